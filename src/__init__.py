@@ -1 +0,0 @@
-# Analysis Package
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+GESTOCK: generación y análisis de datos de inventario multi-negocio
+Las funciones principales se importan bajo demanda, así que `import gestock`
+no carga pandas ni NumPy hasta que se usa alguna de ellas
+"""
+
+import importlib
+
+__version__ = '0.1.0'
+
+# Nombre público -> módulo que lo define
+_LAZY_ATTRIBUTES = {
+    'configure_dirs': 'config',
+    'configure_logging': 'logs',
+    'get_scale_profile': 'scale_profiles',
+    'load_table': 'storage',
+    'save_table': 'storage',
+    'build_pipeline': 'pipeline',
+    'run_pipeline': 'pipeline',
+    'TransactionsView': 'transactions_view',
+    'StockSnapshotIndex': 'stock_snapshots',
+    'abc_classification': 'abc_analysis'
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module 'gestock' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
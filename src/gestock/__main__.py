@@ -0,0 +1,9 @@
+"""
+Permite ejecutar la CLI con `python -m gestock`
+"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
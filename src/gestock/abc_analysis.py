@@ -0,0 +1,234 @@
+"""
+Clasificación ABC (Pareto) de productos de GESTOCK
+Ordena los productos de cada negocio o almacén por valor de movimiento
+(cantidad movida × price o cost_price) y los clasifica en A, B y C según la
+participación acumulada en el valor del grupo. Todos los grupos se resuelven
+con un solo ordenamiento y una suma acumulada, sin recorrer los grupos en Python
+
+Uso:
+    from gestock.abc_analysis import abc_classification
+    abc_classification('warehouse')                      # por almacén, valor de venta
+    abc_classification('business', price_column='cost_price', months=['2025-05', '2025-06'])
+"""
+
+import functools
+
+import numpy as np
+import pandas as pd
+
+from .config import processed_dir, raw_dir
+from .dimension_lookups import _dense_index
+from .movement_cube import CUBE_TABLE
+from .storage import load_table, month_labels, table_version
+
+# Participación acumulada hasta la que llega cada clase (el resto es C)
+DEFAULT_THRESHOLDS = (0.8, 0.95)
+CLASSES = ['A', 'B', 'C']
+
+# Nivel -> columna del grupo
+LEVELS = {'business': 'business_id', 'warehouse': 'warehouse_id'}
+
+# Movimiento valorizado -> medidas del cubo que se suman
+MOVEMENTS = {
+    'salida': ['salida_quantity'],
+    'entrada': ['entrada_quantity'],
+    'total': ['entrada_quantity', 'salida_quantity']
+}
+
+PRICE_COLUMNS = ('price', 'cost_price')
+
+def classify_abc(df, group_column, value_column='value', thresholds=DEFAULT_THRESHOLDS):
+    """
+    Clasifica las filas de cada grupo por su participación en el valor del grupo
+
+    Una fila es A si la participación acumulada de las filas de mayor valor
+    que la preceden es menor que thresholds[0], B si es menor que
+    thresholds[1] y C en otro caso; así la fila que cruza un umbral queda en
+    la clase superior y la de mayor valor de cada grupo con valor es siempre A.
+    Los grupos sin valor quedan completos en C.
+
+    Args:
+        df (pandas.DataFrame): Una fila por elemento y grupo
+        group_column (str): Columna del grupo (entera)
+        value_column (str): Columna del valor (no negativo)
+        thresholds (tuple): Participaciones acumuladas límite de A y de B
+
+    Returns:
+        pandas.DataFrame: df ordenado por grupo y valor descendente, con rank
+            (1 = mayor valor del grupo), share, cumulative_share y abc_class
+    """
+    groups = df[group_column].to_numpy(dtype=np.int64)
+    order = _group_value_order(groups, df[value_column].to_numpy())
+    groups = groups[order]
+    values = df[value_column].to_numpy(dtype=np.float64)[order]
+
+    # Suma acumulada por grupo: acumulado global menos el acumulado al comienzo del grupo
+    group_start = np.ones(len(groups), dtype=bool)
+    group_start[1:] = groups[1:] != groups[:-1]
+    group_index = np.cumsum(group_start) - 1
+    starts = np.flatnonzero(group_start)
+    cumulative = np.cumsum(values)
+    offsets = (cumulative - values)[starts]
+    cumulative -= offsets[group_index]
+    totals = np.add.reduceat(values, starts) if len(values) else values
+    total = totals[group_index]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        share = np.where(total > 0, values / total, 0.0)
+        cumulative_share = np.where(total > 0, cumulative / total, 1.0)
+    preceding_share = np.where(total > 0, cumulative_share - share, 1.0)
+    class_codes = np.searchsorted(np.asarray(thresholds, dtype=np.float64), preceding_share, side='right')
+
+    result = df.take(order).reset_index(drop=True)
+    result['rank'] = (np.arange(len(order)) - starts[group_index] + 1).astype(np.int32)
+    result['share'] = share
+    result['cumulative_share'] = cumulative_share
+    result['abc_class'] = pd.Categorical.from_codes(class_codes, CLASSES)
+    return result
+
+def _group_value_order(groups, values):
+    """
+    Orden por grupo y por valor descendente (los empates conservan el orden de entrada)
+
+    Con valores enteros no negativos, grupo y valor se empaquetan en una clave
+    int64 y basta un solo argsort, varias veces más rápido que lexsort sobre
+    dos columnas; si no caben, se usa lexsort.
+    """
+    if len(values) and np.issubdtype(values.dtype, np.integer) and groups.min() >= 0 and values.min() >= 0:
+        span = int(values.max()) + 1
+        if (int(groups.max()) + 1) * span < 2**63:
+            return np.argsort(groups * span + (span - 1 - values.astype(np.int64)), kind='stable')
+    return np.lexsort((-values.astype(np.float64), groups))
+
+def _check_options(level, price_column, movement):
+    """Valida nivel, columna de precio y movimiento (ValueError si alguno no es válido)"""
+    if level not in LEVELS:
+        raise ValueError(f"Nivel desconocido: {level}")
+    if price_column not in PRICE_COLUMNS:
+        raise ValueError(f"Columna de precio desconocida: {price_column}")
+    if movement not in MOVEMENTS:
+        raise ValueError(f"Movimiento desconocido: {movement}")
+
+def movement_values(cube_df, assortment_df, products_df, warehouses_df, level='warehouse',
+                    price_column='price', movement='salida'):
+    """
+    Cantidad y valor movidos de cada producto por negocio o almacén
+
+    El universo son las parejas del surtido (warehouse_products), así que los
+    productos sin movimientos aparecen con valor 0.
+
+    Args:
+        cube_df (pandas.DataFrame): Cubo o subconjunto (warehouse_id, product_id
+            y las medidas de MOVEMENTS[movement])
+        assortment_df (pandas.DataFrame): warehouse_products (warehouse_id, product_id)
+        products_df (pandas.DataFrame): Productos (id y price_column)
+        warehouses_df (pandas.DataFrame): Almacenes (id, business_id)
+        level (str): 'business' o 'warehouse'
+        price_column (str): 'price' (valor de venta) o 'cost_price' (valor a costo)
+        movement (str): 'salida', 'entrada' o 'total'
+
+    Returns:
+        pandas.DataFrame: Columna del nivel, product_id, quantity y value
+
+    Raises:
+        ValueError: Si level, price_column o movement no son válidos
+    """
+    _check_options(level, price_column, movement)
+    pair_warehouses = assortment_df['warehouse_id'].to_numpy(dtype=np.int64)
+    pair_products = assortment_df['product_id'].to_numpy(dtype=np.int64)
+    if level == 'business':
+        warehouse_business = _dense_index(
+            warehouses_df['id'].to_numpy(dtype=np.int64),
+            warehouses_df['business_id'].to_numpy(dtype=np.int64)
+        )
+        pair_groups = warehouse_business[pair_warehouses]
+    else:
+        pair_groups = pair_warehouses
+
+    # Filas (grupo, producto) únicas, en orden, y la fila de cada pareja del
+    # surtido; las claves enteras se resuelven con arreglos densos, sin ordenar
+    key_width = int(max(pair_products.max(initial=0), cube_df['product_id'].to_numpy().max(initial=0)) + 1)
+    group_keys = pair_groups * key_width + pair_products
+    present = np.zeros(int(group_keys.max(initial=-1)) + 1, dtype=bool)
+    present[group_keys] = True
+    keys = np.flatnonzero(present)
+    row_of_pair = _dense_index(pair_warehouses * key_width + pair_products,
+                               (np.cumsum(present) - 1)[group_keys])
+
+    # Cantidad de cada celda del cubo acumulada en la fila de su pareja
+    cell_keys = (cube_df['warehouse_id'].to_numpy(dtype=np.int64) * key_width
+                 + cube_df['product_id'].to_numpy(dtype=np.int64))
+    if len(cell_keys) and (cell_keys.max() >= len(row_of_pair) or (row_of_pair[cell_keys] < 0).any()):
+        raise ValueError("El cubo tiene parejas (almacén, producto) fuera del surtido")
+    cell_quantity = sum(cube_df[measure].to_numpy(dtype=np.int64) for measure in MOVEMENTS[movement])
+    quantity = np.bincount(row_of_pair[cell_keys], weights=cell_quantity,
+                           minlength=len(keys)).astype(np.int64)
+
+    product_ids = keys % key_width
+    prices = _dense_index(products_df['id'].to_numpy(dtype=np.int64),
+                          products_df[price_column].to_numpy(dtype=np.int64), fill=0)
+    return pd.DataFrame({
+        LEVELS[level]: (keys // key_width).astype(np.int32),
+        'product_id': product_ids.astype(np.int32),
+        'quantity': quantity,
+        'value': quantity * prices[product_ids]
+    })
+
+def abc_classification(level='warehouse', price_column='price', movement='salida', months=None,
+                       thresholds=DEFAULT_THRESHOLDS, storage_format='parquet'):
+    """
+    Clasificación ABC por negocio o por almacén a partir del cubo de movimientos
+
+    El resultado se guarda en memoria asociado a la versión de los datos de
+    entrada (archivos del cubo, productos, almacenes y surtido; ver
+    storage.table_version): las llamadas repetidas con los mismos datos y
+    parámetros no releen ni reordenan nada, y cualquier actualización de las
+    tablas invalida la entrada.
+
+    Args:
+        level (str): 'business' o 'warehouse'
+        price_column (str): 'price' o 'cost_price'
+        movement (str): 'salida', 'entrada' o 'total'
+        months (list): Meses 'YYYY-MM' a considerar (toda la historia por defecto)
+        thresholds (tuple): Participaciones acumuladas límite de A y de B
+        storage_format (str): Formato de las tablas procesadas
+
+    Returns:
+        pandas.DataFrame: Ver classify_abc; una fila por producto del surtido
+            de cada negocio o almacén
+
+    Raises:
+        ValueError: Si level, price_column o movement no son válidos
+    """
+    _check_options(level, price_column, movement)
+    version = (
+        table_version(CUBE_TABLE, storage_format, processed_dir()),
+        table_version('products'),
+        table_version('warehouses'),
+        table_version('warehouse_products')
+    )
+    months = tuple(sorted(months)) if months is not None else None
+    result = _cached_classification(version, level, price_column, movement, months,
+                                    tuple(thresholds), storage_format, processed_dir(), raw_dir())
+    return result.copy()
+
+@functools.lru_cache(maxsize=16)
+def _cached_classification(version, level, price_column, movement, months, thresholds,
+                           storage_format, base_dir, source_dir):
+    """Calcula abc_classification; version solo forma parte de la clave de la caché"""
+    columns = ['warehouse_id', 'product_id', *MOVEMENTS[movement]]
+    if months is None:
+        cube_df = load_table(CUBE_TABLE, storage_format, base_dir, columns=columns)
+    else:
+        cube_df = load_table(CUBE_TABLE, storage_format, base_dir, columns=['date', *columns],
+                             filters=[('month', 'in', list(months))])
+        cube_df = cube_df[month_labels(cube_df['date']).isin(months)]
+
+    values_df = movement_values(
+        cube_df,
+        load_table('warehouse_products', base_dir=source_dir, columns=['warehouse_id', 'product_id']),
+        load_table('products', base_dir=source_dir, columns=['id', 'price', 'cost_price']),
+        load_table('warehouses', base_dir=source_dir, columns=['id', 'business_id']),
+        level, price_column, movement
+    )
+    return classify_abc(values_df, LEVELS[level], thresholds=thresholds)
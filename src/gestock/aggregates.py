@@ -0,0 +1,139 @@
+"""
+Actualización incremental de las tablas procesadas de GESTOCK
+Cuando se agregan transacciones nuevas, combina solo ese lote con el cubo de
+movimientos, sus resúmenes y las tablas de stock ya guardados: las tablas
+particionadas por mes reescriben solo los meses que toca el lote, los totales
+sin tiempo se suman a los existentes y los checkpoints nuevos se agregan, así
+que el costo crece con el lote y no con la historia
+
+Uso:
+    from gestock.aggregates import apply_transaction_batch
+    apply_transaction_batch(new_transactions, updated_stock, warehouses, products)
+"""
+
+import os
+
+import pandas as pd
+
+from .config import processed_dir
+from .logs import get_logger
+from .movement_cube import (CHECKPOINT_FREQ, CHECKPOINT_TABLE, CUBE_KEYS, CUBE_TABLE, MEASURES,
+                            ROLLUPS, STOCK_EOD_TABLE, build_processed_tables)
+from .schema import apply_schema
+from .storage import (MONTH_SOURCE_COLUMNS, load_table, month_labels, replace_partitions, save_table,
+                      table_max, table_path)
+
+logger = get_logger(__name__)
+
+def table_keys(table):
+    """
+    Clave de una tabla procesada (columnas que identifican cada fila)
+
+    Returns:
+        list: Columnas de la clave
+    """
+    if table in (CUBE_TABLE, STOCK_EOD_TABLE):
+        return list(CUBE_KEYS)
+    if table == CHECKPOINT_TABLE:
+        return ['checkpoint_date', 'warehouse_id', 'product_id']
+    grain, dimensions = ROLLUPS[table]
+    return ([grain] if grain else []) + list(dimensions)
+
+def merge_measures(existing_df, delta_df, keys):
+    """
+    Suma las medidas de delta_df a las de existing_df por clave
+
+    Returns:
+        pandas.DataFrame: Una fila por clave, ordenada por la clave
+    """
+    combined = pd.concat([existing_df[keys + MEASURES], delta_df[keys + MEASURES]], ignore_index=True)
+    return combined.groupby(keys, sort=True, observed=True).sum().reset_index()
+
+def merge_snapshots(existing_df, delta_df, keys):
+    """
+    Combina dos tablas de estado por clave; las filas de delta_df reemplazan
+    a las de existing_df con la misma clave
+
+    Returns:
+        pandas.DataFrame: Una fila por clave, ordenada por la clave
+    """
+    combined = pd.concat([existing_df, delta_df[existing_df.columns]], ignore_index=True)
+    combined = combined.drop_duplicates(keys, keep='last')
+    return combined.sort_values(keys, kind='stable', ignore_index=True)
+
+def _touched_months(df, table):
+    """Meses ('YYYY-MM') de las filas de df, en el formato de la partición"""
+    return sorted(month_labels(df[MONTH_SOURCE_COLUMNS[table]]).categories)
+
+def apply_transaction_batch(transactions_df, final_stock_df, warehouses_df, products_df,
+                            storage_format='parquet', base_dir=None):
+    """
+    Incorpora un lote de transacciones nuevas a las tablas procesadas
+
+    El lote se agrega con build_processed_tables y se combina con lo guardado:
+    - Tablas particionadas por mes (cubo, resumen diario, stock diario): se
+      leen y reescriben solo las particiones de los meses del lote
+    - Resúmenes mensuales y totales: son pequeños (una fila por clave) y se
+      suman completos
+    - Checkpoints de stock: se agregan todos los lunes desde el siguiente al
+      último guardado hasta el final del lote, aunque el lote empiece
+      semanas después
+
+    El stock al cierre de cada día del lote y el de sus checkpoints parten del
+    stock final menos el movimiento neto del lote, que es el snapshot de stock
+    del que partió y el stock de cada lunes entre la historia y el lote. Sin
+    checkpoints guardados, los del lote anteriores a su primer día no
+    incluyen los movimientos previos de esa semana y se descartan.
+
+    Args:
+        transactions_df (pandas.DataFrame): Transacciones nuevas (posteriores a
+            las ya incluidas en el cubo)
+        final_stock_df (pandas.DataFrame): warehouse_products después del lote
+        warehouses_df (pandas.DataFrame): Almacenes (id, business_id)
+        products_df (pandas.DataFrame): Productos (id, category)
+        storage_format (str): Formato de las tablas procesadas
+        base_dir (str): Directorio (por defecto, config.processed_dir())
+
+    Returns:
+        dict: Tabla -> filas escritas, o None si aún no hay cubo que actualizar
+    """
+    base_dir = base_dir or processed_dir()
+    if not os.path.exists(table_path(CUBE_TABLE, storage_format, base_dir)):
+        return None
+
+    # Los checkpoints nuevos siguen al último guardado, sin dejar lunes vacíos
+    first_checkpoint = None
+    if os.path.exists(table_path(CHECKPOINT_TABLE, storage_format, base_dir)):
+        last_checkpoint = table_max(CHECKPOINT_TABLE, ['checkpoint_date'], storage_format, base_dir)['checkpoint_date']
+        if last_checkpoint is not None:
+            first_checkpoint = last_checkpoint + pd.tseries.frequencies.to_offset(CHECKPOINT_FREQ)
+
+    delta_tables = build_processed_tables(transactions_df, warehouses_df, products_df, final_stock_df,
+                                          first_checkpoint)
+    written = {}
+    for table, delta_df in delta_tables.items():
+        keys = table_keys(table)
+        merge = merge_snapshots if table == STOCK_EOD_TABLE else merge_measures
+        exists = os.path.exists(table_path(table, storage_format, base_dir))
+        if table == CHECKPOINT_TABLE:
+            if first_checkpoint is None:
+                delta_df = delta_df[delta_df['checkpoint_date'] >= transactions_df['created_at'].min().normalize()]
+            save_table(delta_df, table, storage_format, base_dir, append=True)
+            written[table] = len(delta_df)
+        elif not exists:
+            # Tabla nueva (p. ej. stock_eod sobre un cubo anterior): solo el lote
+            save_table(delta_df, table, storage_format, base_dir)
+            written[table] = len(delta_df)
+        elif table in MONTH_SOURCE_COLUMNS:
+            months = _touched_months(delta_df, table)
+            existing_df = load_table(table, storage_format, base_dir, filters=[('month', 'in', months)])
+            merged_df = apply_schema(merge(existing_df, delta_df, keys), table)
+            replace_partitions(merged_df, table, storage_format, base_dir)
+            written[table] = len(merged_df)
+        else:
+            existing_df = load_table(table, storage_format, base_dir)
+            merged_df = apply_schema(merge(existing_df, delta_df, keys), table)
+            save_table(merged_df, table, storage_format, base_dir)
+            written[table] = len(merged_df)
+        logger.debug(f"  {table}: {written[table]:,} filas reescritas")
+    return written
@@ -0,0 +1,329 @@
+"""
+Benchmarks de los generadores y la validación de GESTOCK
+Mide tiempo y memoria de cada etapa en varios perfiles de escala, guarda los
+resultados en JSON y los compara con una línea base para detectar regresiones
+
+Uso:
+    gestock benchmark --scales SF1 SF10 --repeat 3
+    gestock benchmark --scales SF1 SF10 --baseline data/benchmarks/baseline.json
+    gestock benchmark --scales SF1 SF10 --save-baseline data/benchmarks/baseline.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from .config import data_dir
+from .logs import add_logging_arguments, configure_logging_from_args, get_logger, silenced
+from .scale_profiles import get_scale_profile
+
+logger = get_logger(__name__)
+
+# Archivo de resultados, dentro de config.data_dir()
+RESULTS_FILE = os.path.join('benchmarks', 'latest.json')
+
+# Formato del JSON de resultados; cambia si cambia su estructura
+RESULTS_VERSION = 1
+
+# Etapas medidas, en orden de ejecución
+STAGES = [
+    'generate_businesses', 'generate_products', 'generate_warehouses', 'generate_users',
+    'generate_warehouse_products', 'generate_transactions', 'validation', 'summaries'
+]
+
+# Regresión: más de un `threshold` relativo por encima de la línea base y
+# además más que estos mínimos absolutos (las etapas muy cortas son ruidosas)
+DEFAULT_THRESHOLD = 0.2
+MIN_SECONDS_DELTA = 0.05
+MIN_BYTES_DELTA = 1 << 20
+
+def run_stages(profile, seed, mode='sequential', workers=1, on_stage=None):
+    """
+    Ejecuta todas las etapas de generación y validación de un perfil
+
+    Args:
+        profile (dict): Parámetros de tamaño (ver scale_profiles.get_scale_profile)
+        seed (int): Semilla de la ejecución
+        mode (str): Motor de simulación de transacciones
+        workers (int): Procesos para generar transacciones
+        on_stage (callable): Contexto por etapa: on_stage(nombre) devuelve un
+            context manager que envuelve su ejecución
+
+    Returns:
+        dict: Etapa -> filas producidas
+    """
+    # Los generadores (pandas, NumPy) se importan al medir: --help es inmediato
+    from .generate_businesses import generate_businesses
+    from .generate_products import generate_products
+    from .generate_warehouses import generate_warehouses
+    from .generate_users import generate_users
+    from .generate_warehouse_products import generate_warehouse_products
+    from .generate_transactions import generate_transactions_parallel
+    from .generate_transactional_data import generate_comprehensive_summary
+    from .validation_engine import validate_stock_ledger, validate_tables
+
+    if on_stage is None:
+        on_stage = lambda name: contextlib.nullcontext()
+    rows = {}
+
+    # Se silencia el progreso de los generadores para no medirlo
+    with silenced():
+        with on_stage('generate_businesses'):
+            businesses_df = generate_businesses(profile['num_businesses'], seed=seed)
+        with on_stage('generate_products'):
+            products_df = generate_products(profile['num_products'], seed=seed)
+        with on_stage('generate_warehouses'):
+            warehouses_df = generate_warehouses(
+                businesses_df, profile['warehouses_per_business_range'], seed=seed
+            )
+        with on_stage('generate_users'):
+            users_df = generate_users(businesses_df, profile['users_per_business_range'], seed=seed)
+        with on_stage('generate_warehouse_products'):
+            warehouse_products_df = generate_warehouse_products(
+                businesses_df, warehouses_df, products_df, seed=seed,
+                assortment_scale=profile['assortment_scale']
+            )
+        with on_stage('generate_transactions'):
+            transactions_df, updated_stock_df = generate_transactions_parallel(
+                warehouse_products_df, users_df, warehouses_df, products_df, businesses_df,
+                months_back=profile['months_back'], target_transactions=profile['target_transactions'],
+                mode=mode, max_workers=workers, seed=seed
+            )
+        with on_stage('validation'):
+            report = validate_tables(users_df, updated_stock_df, transactions_df,
+                                     businesses_df, warehouses_df, products_df)
+            ledger_report = validate_stock_ledger(warehouse_products_df, updated_stock_df, transactions_df)
+        with on_stage('summaries'):
+            generate_comprehensive_summary(users_df, updated_stock_df, transactions_df,
+                                           businesses_df, warehouses_df, products_df)
+
+    if not (report.is_valid and ledger_report.is_valid):
+        raise ValueError("Los datos generados no superaron la validación")
+
+    rows['generate_businesses'] = len(businesses_df)
+    rows['generate_products'] = len(products_df)
+    rows['generate_warehouses'] = len(warehouses_df)
+    rows['generate_users'] = len(users_df)
+    rows['generate_warehouse_products'] = len(warehouse_products_df)
+    rows['generate_transactions'] = len(transactions_df)
+    rows['validation'] = len(transactions_df)
+    rows['summaries'] = len(transactions_df)
+    return rows
+
+def benchmark_scale(scale, seed=42, repeat=3, mode='sequential', workers=1):
+    """
+    Mide tiempo y memoria de cada etapa en un perfil de escala
+
+    El tiempo es el mínimo de `repeat` ejecuciones sin trazar memoria; la
+    memoria máxima por etapa (asignaciones de Python y NumPy, vía tracemalloc)
+    se mide en una ejecución aparte, porque trazar ralentiza las etapas.
+
+    Returns:
+        dict: Etapa -> {'seconds', 'runs', 'peak_bytes', 'rows'}
+    """
+    profile = get_scale_profile(scale)
+    timings = {stage: [] for stage in STAGES}
+
+    @contextlib.contextmanager
+    def timed(name):
+        start = time.perf_counter()
+        yield
+        timings[name].append(time.perf_counter() - start)
+
+    for _ in range(max(1, repeat)):
+        rows = run_stages(profile, seed, mode, workers, on_stage=timed)
+
+    peaks = {}
+
+    @contextlib.contextmanager
+    def traced(name):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        yield
+        peaks[name] = tracemalloc.get_traced_memory()[1] - base
+
+    tracemalloc.start()
+    try:
+        run_stages(profile, seed, mode, workers, on_stage=traced)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        stage: {
+            'seconds': min(timings[stage]),
+            'runs': timings[stage],
+            'peak_bytes': peaks[stage],
+            'rows': rows[stage]
+        }
+        for stage in STAGES
+    }
+
+def run_benchmarks(scales, seed=42, repeat=3, mode='sequential', workers=1):
+    """
+    Ejecuta los benchmarks en varios perfiles de escala
+
+    Returns:
+        dict: Resultados con metadatos del entorno (serializables en JSON)
+    """
+    import numpy as np
+    import pandas as pd
+
+    results = {}
+    for scale in scales:
+        logger.info(f"⏱️ Midiendo {scale}...")
+        results[scale] = benchmark_scale(scale, seed, repeat, mode, workers)
+        total = sum(stage['seconds'] for stage in results[scale].values())
+        logger.info(f"  ✅ {scale}: {total:.2f} s en total")
+
+    return {
+        'version': RESULTS_VERSION,
+        'metadata': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'seed': seed,
+            'repeat': repeat,
+            'mode': mode,
+            'workers': workers
+        },
+        'results': results
+    }
+
+def compare_results(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compara resultados con una línea base
+
+    Args:
+        current (dict): Resultados actuales (ver run_benchmarks)
+        baseline (dict): Resultados de la línea base
+        threshold (float): Aumento relativo tolerado (0.2 = 20%)
+
+    Returns:
+        list: Comparaciones (dict) por perfil, etapa y métrica, con
+            'regression' True si supera el umbral e 'improvement' True si
+            baja más que el umbral
+    """
+    comparisons = []
+    for scale, stages in current['results'].items():
+        for stage, measures in stages.items():
+            reference = baseline.get('results', {}).get(scale, {}).get(stage)
+            if reference is None:
+                continue
+            for metric, min_delta in (('seconds', MIN_SECONDS_DELTA), ('peak_bytes', MIN_BYTES_DELTA)):
+                value, base_value = measures[metric], reference[metric]
+                ratio = value / base_value if base_value else float('inf') if value else 1.0
+                comparisons.append({
+                    'scale': scale,
+                    'stage': stage,
+                    'metric': metric,
+                    'baseline': base_value,
+                    'current': value,
+                    'ratio': ratio,
+                    'regression': ratio > 1 + threshold and value - base_value > min_delta,
+                    'improvement': ratio < 1 - threshold and base_value - value > min_delta,
+                    'rows_changed': measures['rows'] != reference['rows']
+                })
+    return comparisons
+
+def print_results(results):
+    """
+    Muestra los resultados por perfil y etapa
+    """
+    for scale, stages in results['results'].items():
+        logger.info(f"\n📊 {scale}")
+        logger.info(f"  {'Etapa':<30}{'Tiempo (s)':>12}{'Memoria (MB)':>14}{'Filas':>12}")
+        for stage, measures in stages.items():
+            logger.info(f"  {stage:<30}{measures['seconds']:>12.3f}"
+                        f"{measures['peak_bytes'] / (1 << 20):>14.1f}{measures['rows']:>12,}")
+
+def print_comparison(comparisons, threshold):
+    """
+    Muestra las regresiones frente a la línea base
+
+    Returns:
+        bool: True si no hay regresiones
+    """
+    regressions = [c for c in comparisons if c['regression']]
+    changed = sorted({(c['scale'], c['stage']) for c in comparisons if c['rows_changed']})
+
+    logger.info(f"\n🔍 COMPARACIÓN CON LA LÍNEA BASE (umbral {threshold:.0%})")
+    for scale, stage in changed:
+        logger.warning(f"  ⚠️ {scale} {stage}: cambió el número de filas; la carga de trabajo no es la misma")
+    if not regressions:
+        logger.info("  ✅ Sin regresiones")
+        return True
+    for c in regressions:
+        if c['metric'] == 'seconds':
+            before, after = f"{c['baseline']:.3f} s", f"{c['current']:.3f} s"
+        else:
+            before, after = f"{c['baseline'] / (1 << 20):.1f} MB", f"{c['current'] / (1 << 20):.1f} MB"
+        logger.error(f"  ❌ {c['scale']} {c['stage']} ({c['metric']}): {before} -> {after} ({c['ratio']:.2f}x)")
+    return False
+
+def save_results(results, path):
+    """
+    Guarda resultados en JSON
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    logger.info(f"📁 Resultados guardados en: {path}")
+
+def parse_args(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Benchmarks de los generadores de GESTOCK")
+    parser.add_argument('--scales', nargs='+', default=['SF1', 'SF10'],
+                        help="Perfiles de escala a medir (ver scale_profiles)")
+    parser.add_argument('--repeat', type=int, default=3, help="Ejecuciones cronometradas por perfil")
+    parser.add_argument('--seed', type=int, default=42, help="Semilla de los datos")
+    parser.add_argument('--mode', choices=['sequential', 'batched'], default='sequential')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--output', help=f"Archivo JSON de resultados (por defecto, <datos>/{RESULTS_FILE})")
+    parser.add_argument('--baseline', help="Línea base (JSON) con la que comparar")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Aumento relativo tolerado antes de marcar una regresión")
+    parser.add_argument('--save-baseline', metavar='PATH',
+                        help="Guardar también los resultados como línea base")
+    add_logging_arguments(parser)
+    return parser.parse_args(argv)
+
+def main(argv=None, prog=None):
+    """
+    Ejecuta los benchmarks y los compara con la línea base
+
+    Returns:
+        bool: True si no hubo errores ni regresiones
+    """
+    args = parse_args(argv, prog)
+    configure_logging_from_args(args)
+
+    logger.info("🚀 BENCHMARKS DE GENERACIÓN GESTOCK")
+    logger.info("="*60)
+    try:
+        results = run_benchmarks(args.scales, args.seed, args.repeat, args.mode, args.workers)
+    except Exception as e:
+        logger.exception(f"\n❌ ERROR durante los benchmarks: {str(e)}")
+        return False
+
+    print_results(results)
+    save_results(results, args.output or os.path.join(data_dir(), RESULTS_FILE))
+    if args.save_baseline:
+        save_results(results, args.save_baseline)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        return print_comparison(compare_results(results, baseline, args.threshold), args.threshold)
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
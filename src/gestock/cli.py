@@ -0,0 +1,62 @@
+"""
+Punto de entrada de la línea de comandos de GESTOCK (comando `gestock`)
+Cada subcomando vive en su propio módulo y solo se importa al ejecutarlo, así
+que `gestock --help` y la ayuda de cada subcomando no cargan pandas ni NumPy
+
+Uso:
+    gestock generate --scale SF10 --seed 42
+    gestock --data-dir /tmp/gestock generate --quiet
+    gestock rotation --period-days 60
+    gestock benchmark --scales SF1 SF10
+    gestock scales
+"""
+
+import argparse
+import importlib
+
+from .config import configure_dirs
+
+# Subcomando -> (módulo con main(argv, prog), descripción)
+COMMANDS = {
+    'generate': ('gestock.generate_all', "Genera todos los datos con un perfil de escala (pipeline)"),
+    'cube': ('gestock.movement_cube', "Construye el cubo diario de movimientos en data/processed"),
+    'rotation': ('gestock.rotation_metrics', "Calcula las métricas de rotación de inventario en data/processed"),
+    'benchmark': ('gestock.benchmark', "Mide tiempo y memoria de cada etapa y detecta regresiones"),
+    'scales': ('gestock.scale_profiles', "Muestra los perfiles de escala")
+}
+
+def parse_args(argv=None):
+    """
+    Interpreta las opciones globales y el subcomando
+
+    Returns:
+        argparse.Namespace: Opciones, subcomando ('command') y sus argumentos ('args')
+    """
+    commands = '\n'.join(f"  {name:<12}{description}" for name, (_, description) in COMMANDS.items())
+    parser = argparse.ArgumentParser(
+        prog='gestock',
+        description="Generación y análisis de datos de GESTOCK",
+        epilog=f"comandos:\n{commands}\n\n`gestock COMANDO --help` muestra las opciones de cada comando",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--data-dir', help="Directorio base de datos (o GESTOCK_DATA_DIR)")
+    parser.add_argument('--raw-dir', help="Directorio de las tablas generadas (por defecto, <datos>/raw)")
+    parser.add_argument('--processed-dir', help="Directorio de las tablas derivadas (por defecto, <datos>/processed)")
+    parser.add_argument('command', choices=list(COMMANDS), metavar='COMANDO', help="Subcomando (ver la lista abajo)")
+    parser.add_argument('args', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Ejecuta un subcomando
+
+    Returns:
+        int: Código de salida (0 si terminó sin errores)
+    """
+    args = parse_args(argv)
+    configure_dirs(args.data_dir, args.raw_dir, args.processed_dir)
+
+    module_name, _ = COMMANDS[args.command]
+    module = importlib.import_module(module_name)
+    success = module.main(args.args, prog=f"gestock {args.command}")
+    return 0 if success else 1
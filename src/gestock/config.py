@@ -0,0 +1,68 @@
+"""
+Configuración de GESTOCK: directorios de datos y formatos de almacenamiento
+Solo usa la biblioteca estándar, así que importarlo (p. ej. desde la CLI) es
+inmediato
+
+Los directorios se resuelven en cada llamada, en este orden:
+    1. configure_dirs(...) (opciones --data-dir, --raw-dir y --processed-dir de la CLI)
+    2. Variables de entorno GESTOCK_DATA_DIR, GESTOCK_RAW_DIR y GESTOCK_PROCESSED_DIR
+    3. El directorio data/ del repositorio si se ejecuta desde una copia del
+       código; si no, ./data en el directorio de trabajo
+"""
+
+import os
+
+# Formatos soportados y extensión de archivo de cada uno. 'arrow' es Arrow IPC
+# sin comprimir y en un solo lote, apto para memory-mapping sin copias
+FORMATS = {
+    'parquet': '.parquet',
+    'feather': '.feather',
+    'arrow': '.arrow',
+    'csv': '.csv'
+}
+
+# data/ del repositorio (src/gestock/config.py -> <repo>/data)
+_REPO_DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data'))
+
+# Directorios elegidos con configure_dirs
+_dirs = {}
+
+def configure_dirs(data_dir=None, raw_dir=None, processed_dir=None):
+    """
+    Fija los directorios de datos del proceso
+
+    Args:
+        data_dir (str): Directorio base (caché del pipeline, benchmarks y, por
+            defecto, raw/ y processed/)
+        raw_dir (str): Tablas generadas (por defecto, <data_dir>/raw)
+        processed_dir (str): Tablas derivadas (por defecto, <data_dir>/processed)
+    """
+    for key, value in (('data', data_dir), ('raw', raw_dir), ('processed', processed_dir)):
+        if value is not None:
+            _dirs[key] = os.path.abspath(value)
+
+def data_dir():
+    """Directorio base de datos"""
+    if 'data' in _dirs:
+        return _dirs['data']
+    if os.environ.get('GESTOCK_DATA_DIR'):
+        return os.path.abspath(os.environ['GESTOCK_DATA_DIR'])
+    if os.path.isdir(_REPO_DATA_DIR):
+        return _REPO_DATA_DIR
+    return os.path.abspath('data')
+
+def raw_dir():
+    """Directorio de las tablas generadas"""
+    if 'raw' in _dirs:
+        return _dirs['raw']
+    if os.environ.get('GESTOCK_RAW_DIR'):
+        return os.path.abspath(os.environ['GESTOCK_RAW_DIR'])
+    return os.path.join(data_dir(), 'raw')
+
+def processed_dir():
+    """Directorio de las tablas derivadas (métricas, agregados)"""
+    if 'processed' in _dirs:
+        return _dirs['processed']
+    if os.environ.get('GESTOCK_PROCESSED_DIR'):
+        return os.path.abspath(os.environ['GESTOCK_PROCESSED_DIR'])
+    return os.path.join(data_dir(), 'processed')
@@ -0,0 +1,91 @@
+"""
+Tablas de búsqueda densas indexadas por ID para las dimensiones de GESTOCK
+Se construyen una sola vez por ejecución para resolver productos, almacenes
+y usuarios en O(1) dentro de la simulación de transacciones
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _dense_index(ids, values, fill=-1):
+    """
+    Crea un arreglo denso donde la posición ID contiene el valor asociado
+
+    Args:
+        ids (numpy.ndarray): IDs enteros positivos
+        values (numpy.ndarray): Valores enteros para cada ID
+        fill (int): Valor para los IDs inexistentes
+
+    Returns:
+        numpy.ndarray: Arreglo de tamaño max(ids) + 1
+    """
+    size = int(ids.max()) + 1 if len(ids) else 0
+    dense = np.full(size, fill, dtype=np.int64)
+    dense[ids] = values
+    return dense
+
+
+class DimensionLookups:
+    """
+    Búsquedas densas de productos, almacenes y usuarios activos
+
+    Los atributos de texto se codifican como índices a arreglos de valores
+    únicos (categorías, nombres, proveedores). Los usuarios activos de cada
+    negocio se guardan en formato CSR: los IDs de los usuarios del negocio b
+    son active_user_ids[active_user_ptr[b]:active_user_ptr[b + 1]].
+    """
+
+    def __init__(self, products_df, warehouses_df, users_df):
+        """
+        Args:
+            products_df (pandas.DataFrame): DataFrame con productos
+            warehouses_df (pandas.DataFrame): DataFrame con almacenes
+            users_df (pandas.DataFrame): DataFrame con usuarios
+        """
+        # Productos
+        product_ids = products_df['id'].to_numpy(dtype=np.int64)
+        category_codes, self.categories = pd.factorize(products_df['category'])
+        name_codes, self.product_names = pd.factorize(products_df['name'])
+        supplier_codes, self.suppliers = pd.factorize(products_df['supplier'])
+        self.categories = np.asarray(self.categories, dtype=object)
+        self.product_names = np.asarray(self.product_names, dtype=object)
+        self.suppliers = np.asarray(self.suppliers, dtype=object)
+        self.product_category = _dense_index(product_ids, category_codes)
+        self.product_name = _dense_index(product_ids, name_codes)
+        self.product_supplier = _dense_index(product_ids, supplier_codes)
+
+        # Almacenes
+        warehouse_ids = warehouses_df['id'].to_numpy(dtype=np.int64)
+        warehouse_name_codes, self.warehouse_names = pd.factorize(warehouses_df['name'])
+        self.warehouse_names = np.asarray(self.warehouse_names, dtype=object)
+        self.warehouse_name = _dense_index(warehouse_ids, warehouse_name_codes)
+        self.warehouse_business = _dense_index(
+            warehouse_ids, warehouses_df['business_id'].to_numpy(dtype=np.int64)
+        )
+
+        # Usuarios: nombres por ID y usuarios activos agrupados por negocio
+        user_ids = users_df['id'].to_numpy(dtype=np.int64)
+        user_name_codes, self.user_names = pd.factorize(users_df['full_name'])
+        self.user_names = np.asarray(self.user_names, dtype=object)
+        self.user_name = _dense_index(user_ids, user_name_codes)
+
+        active_users = users_df[users_df['is_active'] == True]
+        active_business = active_users['business_id'].to_numpy(dtype=np.int64)
+        order = np.argsort(active_business, kind='stable')
+        self.active_user_ids = active_users['id'].to_numpy(dtype=np.int64)[order]
+
+        num_businesses = max(
+            int(self.warehouse_business.max()) + 1 if len(self.warehouse_business) else 0,
+            int(active_business.max()) + 1 if len(active_business) else 0
+        )
+        counts = np.bincount(active_business, minlength=num_businesses)
+        self.active_user_ptr = np.zeros(num_businesses + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.active_user_ptr[1:])
+
+    def active_users_range(self, business_id):
+        """
+        Devuelve el rango [inicio, fin) de usuarios activos de un negocio
+        dentro de active_user_ids
+        """
+        return int(self.active_user_ptr[business_id]), int(self.active_user_ptr[business_id + 1])
@@ -0,0 +1,107 @@
+"""
+Script maestro para generar todos los datos del proyecto GESTOCK
+Ejecuta el pipeline completo (datos base, transaccionales, validación y
+resúmenes) con un perfil de escala seleccionable desde la línea de comandos
+
+Uso:
+    gestock generate                            # demo (SF1)
+    python -m gestock generate --scale SF100 --seed 42 --workers 4 --mode batched
+    gestock generate --incremental --seed 42    # solo los días nuevos
+    gestock generate --list-scales
+"""
+
+import argparse
+import sys
+
+from .config import FORMATS
+from .logs import add_logging_arguments, configure_logging_from_args, get_logger
+from .scale_profiles import DEFAULT_SCALE, SCALE_FACTORS, describe_profile, get_scale_profile
+
+logger = get_logger(__name__)
+
+def parse_args(argv=None, prog=None):
+    """
+    Interpreta los argumentos de la línea de comandos
+
+    Returns:
+        argparse.Namespace: Opciones de la ejecución
+    """
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Genera los datos de GESTOCK con un perfil de escala"
+    )
+    parser.add_argument('--scale', default=DEFAULT_SCALE,
+                        help=f"Perfil de escala: {', '.join(SCALE_FACTORS)} o SF<n> (por defecto, {DEFAULT_SCALE})")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Semilla de la ejecución; la misma semilla produce los mismos datos")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Procesos para generar transacciones (no cambia el resultado)")
+    parser.add_argument('--mode', choices=['sequential', 'batched'], default='sequential',
+                        help="Motor de simulación de transacciones")
+    parser.add_argument('--batch-days', type=int, default=7,
+                        help="Días por bloque en modo batched")
+    parser.add_argument('--format', dest='storage_format', choices=list(FORMATS), default='parquet',
+                        help="Formato de las tablas")
+    parser.add_argument('--normalized', action='store_true',
+                        help="Guardar transactions como tabla de hechos solo con IDs")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Agregar solo los días posteriores a la última transacción guardada")
+    parser.add_argument('--force', nargs='*', default=[], metavar='ETAPA',
+                        help="Etapas del pipeline a ejecutar aunque no hayan cambiado")
+    parser.add_argument('--list-scales', action='store_true',
+                        help="Mostrar los perfiles de escala y salir")
+    add_logging_arguments(parser)
+    return parser.parse_args(argv)
+
+def main(argv=None, prog=None):
+    """
+    Función principal: genera los datos con el perfil de escala indicado
+
+    Returns:
+        bool: True si la generación terminó sin errores
+    """
+    args = parse_args(argv, prog)
+    configure_logging_from_args(args)
+
+    if args.list_scales:
+        logger.info("📐 PERFILES DE ESCALA")
+        for scale in SCALE_FACTORS:
+            logger.info(f"  {describe_profile(scale)}")
+        return True
+
+    try:
+        profile = get_scale_profile(args.scale)
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+        return False
+
+    logger.info(f"📐 {describe_profile(args.scale)}")
+
+    # pandas y NumPy se importan solo al generar: --help y --list-scales son inmediatos
+    if args.incremental:
+        from .generate_transactional_data import main as generate_transactional_data
+        return generate_transactional_data(
+            workers=args.workers,
+            storage_format=args.storage_format,
+            normalized=args.normalized,
+            incremental=True,
+            seed=args.seed,
+            scale=args.scale
+        )
+
+    from .pipeline import run_pipeline
+
+    return run_pipeline(
+        force=args.force,
+        storage_format=args.storage_format,
+        mode=args.mode,
+        batch_days=args.batch_days,
+        workers=args.workers,
+        normalized=args.normalized,
+        seed=args.seed,
+        **profile
+    )
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -3,15 +3,19 @@ Script maestro para generar todos los datos base del proyecto GESTOCK
 Ejecuta todos los generadores y valida la integridad de los datos
 """
 
-import pandas as pd
-import os
 import sys
 from datetime import datetime
 
 # Importar los generadores
-from generate_businesses import generate_businesses, save_businesses_csv
-from generate_products import generate_products, save_products_csv
-from generate_warehouses import generate_warehouses, save_warehouses_csv
+from .config import raw_dir
+from .generate_businesses import generate_businesses
+from .generate_products import generate_products
+from .generate_warehouses import generate_warehouses
+from .scale_profiles import DEFAULT_SCALE, describe_profile, get_scale_profile
+from .storage import FORMATS, save_table
+from .logs import configure_logging, get_logger
+
+logger = get_logger(__name__)
 
 def validate_data_integrity(businesses_df, products_df, warehouses_df):
     """
@@ -26,8 +30,8 @@ def validate_data_integrity(businesses_df, products_df, warehouses_df):
         bool: True si todos los datos son válidos
     """
     
-    print("\n🔍 VALIDANDO INTEGRIDAD DE DATOS...")
-    print("="*50)
+    logger.info("\n🔍 VALIDANDO INTEGRIDAD DE DATOS...")
+    logger.info("="*50)
     
     errors = []
     warnings = []
@@ -74,18 +78,18 @@ def validate_data_integrity(businesses_df, products_df, warehouses_df):
     
     # Mostrar resultados de validación
     if errors:
-        print("ERRORES ENCONTRADOS:")
+        logger.info("ERRORES ENCONTRADOS:")
         for error in errors:
-            print(f"  {error}")
+            logger.info(f"  {error}")
         return False
     
     if warnings:
-        print("ADVERTENCIAS:")
+        logger.info("ADVERTENCIAS:")
         for warning in warnings:
-            print(f"  {warning}")
+            logger.info(f"  {warning}")
     
     if not errors and not warnings:
-        print("✅ Todos los datos son válidos")
+        logger.info("✅ Todos los datos son válidos")
     
     return True
 
@@ -94,93 +98,102 @@ def generate_summary_report(businesses_df, products_df, warehouses_df):
     Genera un reporte resumen de los datos generados
     """
     
-    print("\n📊 REPORTE RESUMEN DE DATOS GENERADOS")
-    print("="*50)
+    logger.info("\n📊 REPORTE RESUMEN DE DATOS GENERADOS")
+    logger.info("="*50)
     
     # Resumen general
-    print(f"🏢 Negocios generados: {len(businesses_df)}")
-    print(f"📦 Productos generados: {len(products_df)}")
-    print(f"🏭 Almacenes generados: {len(warehouses_df)}")
+    logger.info(f"🏢 Negocios generados: {len(businesses_df)}")
+    logger.info(f"📦 Productos generados: {len(products_df)}")
+    logger.info(f"🏭 Almacenes generados: {len(warehouses_df)}")
     
     # Distribución por industria
-    print(f"\n📈 Distribución por industria:")
+    logger.info(f"\n📈 Distribución por industria:")
     industry_dist = businesses_df['industry'].value_counts()
     for industry, count in industry_dist.items():
-        print(f"  {industry}: {count} negocios")
+        logger.info(f"  {industry}: {count} negocios")
     
     # Distribución por categoría de productos
-    print(f"\n📦 Distribución por categoría de productos:")
+    logger.info(f"\n📦 Distribución por categoría de productos:")
     category_dist = products_df['category'].value_counts()
     for category, count in category_dist.items():
-        print(f"  {category}: {count} productos")
+        logger.info(f"  {category}: {count} productos")
     
     # Almacenes por negocio
-    print(f"\n🏭 Almacenes por negocio:")
+    logger.info(f"\n🏭 Almacenes por negocio:")
     warehouses_per_business = warehouses_df['business_id'].value_counts().sort_index()
     for business_id, count in warehouses_per_business.items():
         business_name = businesses_df[businesses_df['id'] == business_id]['name'].iloc[0]
-        print(f"  {business_name}: {count} almacenes")
+        logger.info(f"  {business_name}: {count} almacenes")
     
     # Estadísticas de precios
-    print(f"\n💰 Estadísticas de precios:")
-    print(f"  Precio promedio: ${products_df['price'].mean():,.0f}")
-    print(f"  Precio mínimo: ${products_df['price'].min():,.0f}")
-    print(f"  Precio máximo: ${products_df['price'].max():,.0f}")
+    logger.info(f"\n💰 Estadísticas de precios:")
+    logger.info(f"  Precio promedio: ${products_df['price'].mean():,.0f}")
+    logger.info(f"  Precio mínimo: ${products_df['price'].min():,.0f}")
+    logger.info(f"  Precio máximo: ${products_df['price'].max():,.0f}")
     
     # Margen de ganancia promedio
-    print(f"  Margen promedio: {products_df['profit_margin'].mean():.1f}%")
+    logger.info(f"  Margen promedio: {products_df['profit_margin'].mean():.1f}%")
     
-    print(f"\n📅 Fecha de generación: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"\n📅 Fecha de generación: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-def main():
+def main(storage_format='parquet', seed=None, scale=DEFAULT_SCALE):
     """
     Función principal que ejecuta todo el proceso de generación
+    
+    Args:
+        storage_format (str): Formato de salida: 'parquet', 'feather' o 'csv'
+        seed (int): Semilla de la ejecución; cada generador usa su propio flujo
+        scale (str): Perfil de escala de los datos (ver scale_profiles)
     """
     
-    print("🚀 INICIANDO GENERACIÓN DE DATOS BASE GESTOCK")
-    print("="*60)
+    profile = get_scale_profile(scale)
+    
+    logger.info("🚀 INICIANDO GENERACIÓN DE DATOS BASE GESTOCK")
+    logger.info("="*60)
+    logger.info(f"📐 {describe_profile(scale)}")
     
     try:
-        # Cambiar al directorio correcto
-        os.chdir(os.path.dirname(os.path.abspath(__file__)))
-        
         # Generar negocios
-        print("\n1️⃣ Generando negocios...")
-        businesses_df = generate_businesses(8)
-        save_businesses_csv(businesses_df)
+        logger.info("\n1️⃣ Generando negocios...")
+        businesses_df = generate_businesses(profile['num_businesses'], seed=seed)
+        save_table(businesses_df, 'businesses', storage_format)
         
         # Generar productos  
-        print("\n2️⃣ Generando productos...")
-        products_df = generate_products(85)
-        save_products_csv(products_df)
+        logger.info("\n2️⃣ Generando productos...")
+        products_df = generate_products(profile['num_products'], seed=seed)
+        save_table(products_df, 'products', storage_format)
         
         # Generar almacenes
-        print("\n3️⃣ Generando almacenes...")
-        warehouses_df = generate_warehouses(businesses_df)
-        save_warehouses_csv(warehouses_df)
+        logger.info("\n3️⃣ Generando almacenes...")
+        warehouses_df = generate_warehouses(
+            businesses_df, profile['warehouses_per_business_range'], seed=seed
+        )
+        save_table(warehouses_df, 'warehouses', storage_format)
         
         # Validar integridad
         if validate_data_integrity(businesses_df, products_df, warehouses_df):
-            print("\n✅ GENERACIÓN EXITOSA")
+            logger.info("\n✅ GENERACIÓN EXITOSA")
         else:
-            print("\n❌ GENERACIÓN CON ERRORES")
+            logger.error("\n❌ GENERACIÓN CON ERRORES")
             return False
         
         # Generar reporte
         generate_summary_report(businesses_df, products_df, warehouses_df)
         
-        print(f"\n🎉 PROCESO COMPLETADO")
-        print(f"📁 Archivos generados en: ../raw/")
-        print(f"   - businesses.csv")
-        print(f"   - products.csv") 
-        print(f"   - warehouses.csv")
+        logger.info(f"\n🎉 PROCESO COMPLETADO")
+        logger.info(f"📁 Archivos generados en: {raw_dir()}")
+        extension = FORMATS[storage_format]
+        logger.info(f"   - businesses{extension}")
+        logger.info(f"   - products{extension}") 
+        logger.info(f"   - warehouses{extension}")
         
         return True
         
     except Exception as e:
-        print(f"\n❌ ERROR durante la generación: {str(e)}")
+        logger.exception(f"\n❌ ERROR durante la generación: {str(e)}")
         return False
 
 if __name__ == "__main__":
+    configure_logging()
     success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
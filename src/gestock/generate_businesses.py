@@ -3,21 +3,32 @@ Generador de datos mockeados para la tabla Businesses de GESTOCK
 Crea negocios diversos con diferentes industrias, tamaños y ubicaciones
 """
 
+import logging
+import os
 import pandas as pd
-import random
 from datetime import datetime, timedelta
 
-def generate_businesses(num_businesses=8):
+from .config import raw_dir
+from .schema import apply_schema
+from .seeding import stream
+from .logs import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+def generate_businesses(num_businesses=8, seed=None):
     """
     Genera datos mockeados para negocios
     
     Args:
         num_businesses (int): Número de negocios a generar
+        seed (int): Semilla de la ejecución; el generador usa su propio flujo 'businesses'
     
     Returns:
         pandas.DataFrame: DataFrame con datos de negocios
     """
     
+    rng = stream(seed, 'businesses')
+    
     # Datos base para generar negocios realistas
     business_types = [
         "Supermercado", "Farmacia", "Ferretería", "Librería", 
@@ -47,10 +58,10 @@ def generate_businesses(num_businesses=8):
     
     for i in range(num_businesses):
         # Seleccionar tipo y datos relacionados
-        business_type = business_types[i] if i < len(business_types) else random.choice(business_types)
-        industry = industries[i] if i < len(industries) else random.choice(industries)
-        city = cities[i] if i < len(cities) else random.choice(cities)
-        region = regions[i] if i < len(regions) else random.choice(regions)
+        business_type = business_types[i] if i < len(business_types) else rng.choice(business_types)
+        industry = industries[i] if i < len(industries) else rng.choice(industries)
+        city = cities[i] if i < len(cities) else rng.choice(cities)
+        region = regions[i] if i < len(regions) else rng.choice(regions)
         
         # Generar nombre de empresa
         if business_type == "Supermercado":
@@ -68,7 +79,7 @@ def generate_businesses(num_businesses=8):
         else:
             names = ["ComercialTotal", "DistribuMax", "MayoristaPlus", "SuministrosGenerales"]
         
-        company_name = f"{random.choice(names)} {city}"
+        company_name = f"{rng.choice(names)} {city}"
         
         # Datos del negocio
         business = {
@@ -76,15 +87,15 @@ def generate_businesses(num_businesses=8):
             'name': company_name,
             'industry': industry,
             'business_type': business_type,
-            'size': random.choice(company_sizes),
+            'size': rng.choice(company_sizes),
             'city': city,
             'region': region,
-            'created_at': start_date + timedelta(days=random.randint(0, 600))
+            'created_at': start_date + timedelta(days=int(rng.integers(0, 600, endpoint=True)))
         }
         
         businesses.append(business)
     
-    return pd.DataFrame(businesses)
+    return apply_schema(pd.DataFrame(businesses), 'businesses')
 
 def save_businesses_csv(df, filename='businesses.csv'):
     """
@@ -94,23 +105,29 @@ def save_businesses_csv(df, filename='businesses.csv'):
         df (pandas.DataFrame): DataFrame con datos de negocios
         filename (str): Nombre del archivo CSV
     """
-    filepath = f'../raw/{filename}'
+    os.makedirs(raw_dir(), exist_ok=True)
+    filepath = os.path.join(raw_dir(), filename)
     df.to_csv(filepath, index=False, encoding='utf-8')
-    print(f"✅ Archivo {filename} guardado con {len(df)} negocios")
-    print(f"📊 Distribución por industria:")
-    print(df['industry'].value_counts().to_string())
-    print(f"\n📊 Distribución por tamaño:")
-    print(df['size'].value_counts().to_string())
+    logger.info(f"✅ Archivo {filename} guardado con {len(df)} negocios")
+
+    # Las tablas de distribución solo se calculan si se van a mostrar
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(f"📊 Distribución por industria:")
+    logger.info("%s", df['industry'].value_counts().to_string())
+    logger.info(f"\n📊 Distribución por tamaño:")
+    logger.info("%s", df['size'].value_counts().to_string())
 
 if __name__ == "__main__":
+    configure_logging()
     # Generar datos
     businesses_df = generate_businesses(8)
     
     # Mostrar preview
-    print("🏢 PREVIEW DE NEGOCIOS GENERADOS:")
-    print("="*50)
-    print(businesses_df.head())
-    print(f"\nTotal negocios: {len(businesses_df)}")
+    logger.info("🏢 PREVIEW DE NEGOCIOS GENERADOS:")
+    logger.info("="*50)
+    logger.info("%s", businesses_df.head())
+    logger.info(f"\nTotal negocios: {len(businesses_df)}")
     
     # Guardar archivo
     save_businesses_csv(businesses_df)
\ No newline at end of file
@@ -3,21 +3,32 @@ Generador de datos mockeados para la tabla Products de GESTOCK
 Crea productos diversos con categorías, precios realistas y márgenes variables
 """
 
+import logging
+import os
 import pandas as pd
-import random
 from datetime import datetime, timedelta
 
-def generate_products(num_products=85):
+from .config import raw_dir
+from .schema import apply_schema
+from .seeding import stream
+from .logs import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+def generate_products(num_products=85, seed=None):
     """
     Genera datos mockeados para productos
     
     Args:
         num_products (int): Número de productos a generar
+        seed (int): Semilla de la ejecución; el generador usa su propio flujo 'products'
     
     Returns:
         pandas.DataFrame: DataFrame con datos de productos
     """
     
+    rng = stream(seed, 'products')
+    
     # Categorías de productos con datos específicos
     product_categories = {
         "Electrónicos": {
@@ -120,13 +131,13 @@ def generate_products(num_products=85):
             # Agregar variaciones si hay repetición
             if i >= len(available_products):
                 variations = ["Premium", "Económico", "Deluxe", "Básico", "Pro"]
-                product_name = f"{product_base} {random.choice(variations)}"
+                product_name = f"{product_base} {rng.choice(variations)}"
             else:
                 product_name = product_base
             
             # Generar precio y costo
-            price = random.randint(price_min, price_max)
-            cost_margin = random.uniform(cost_min, cost_max)
+            price = int(rng.integers(price_min, price_max, endpoint=True))
+            cost_margin = rng.uniform(cost_min, cost_max)
             cost_price = round(price * cost_margin)
             profit_margin = round(((price - cost_price) / price) * 100, 1)
             
@@ -137,15 +148,15 @@ def generate_products(num_products=85):
                 'price': price,
                 'cost_price': cost_price,
                 'profit_margin': profit_margin,
-                'supplier': random.choice(suppliers),
+                'supplier': rng.choice(suppliers),
                 'description': f"{product_name} - {category}",
-                'created_at': start_date + timedelta(days=random.randint(0, 500))
+                'created_at': start_date + timedelta(days=int(rng.integers(0, 500, endpoint=True)))
             }
             
             products.append(product)
             product_id += 1
     
-    return pd.DataFrame(products)
+    return apply_schema(pd.DataFrame(products), 'products')
 
 def save_products_csv(df, filename='products.csv'):
     """
@@ -155,24 +166,30 @@ def save_products_csv(df, filename='products.csv'):
         df (pandas.DataFrame): DataFrame con datos de productos
         filename (str): Nombre del archivo CSV
     """
-    filepath = f'../raw/{filename}'
+    os.makedirs(raw_dir(), exist_ok=True)
+    filepath = os.path.join(raw_dir(), filename)
     df.to_csv(filepath, index=False, encoding='utf-8')
-    print(f"✅ Archivo {filename} guardado con {len(df)} productos")
-    print(f"📊 Distribución por categoría:")
-    print(df['category'].value_counts().to_string())
-    print(f"\n💰 Rango de precios por categoría:")
-    price_stats = df.groupby('category')['price'].agg(['min', 'max', 'mean']).round(0)
-    print(price_stats.to_string())
+    logger.info(f"✅ Archivo {filename} guardado con {len(df)} productos")
+
+    # Las tablas de distribución solo se calculan si se van a mostrar
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(f"📊 Distribución por categoría:")
+    logger.info("%s", df['category'].value_counts().to_string())
+    logger.info(f"\n💰 Rango de precios por categoría:")
+    price_stats = df.groupby('category', observed=True)['price'].agg(['min', 'max', 'mean']).round(0)
+    logger.info("%s", price_stats.to_string())
 
 if __name__ == "__main__":
+    configure_logging()
     # Generar datos
     products_df = generate_products(85)
     
     # Mostrar preview
-    print("📦 PREVIEW DE PRODUCTOS GENERADOS:")
-    print("="*50)
-    print(products_df.head(10))
-    print(f"\nTotal productos: {len(products_df)}")
+    logger.info("📦 PREVIEW DE PRODUCTOS GENERADOS:")
+    logger.info("="*50)
+    logger.info("%s", products_df.head(10))
+    logger.info(f"\nTotal productos: {len(products_df)}")
     
     # Guardar archivo
     save_products_csv(products_df)
\ No newline at end of file
@@ -0,0 +1,364 @@
+"""
+Script maestro para generar todos los datos transaccionales del proyecto GESTOCK
+Coordina la generación de usuarios, stock y transacciones con validación de reglas de negocio
+"""
+
+import pandas as pd
+import sys
+from datetime import datetime, timedelta
+
+# Importar los generadores transaccionales
+from .aggregates import apply_transaction_batch
+from .config import raw_dir
+from .generate_users import generate_users
+from .generate_warehouse_products import generate_warehouse_products
+from .generate_transactions import generate_transactions_parallel
+from .scale_profiles import DEFAULT_SCALE, describe_profile, get_scale_profile
+from .seeding import resolve_now
+from .storage import FORMATS, load_table, save_table, table_max
+from .transactions_view import denormalize_transactions
+from .validation_engine import validate_stock_ledger, validate_tables
+from .logs import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+def validate_transactional_data(users_df, warehouse_products_df, transactions_df, 
+                               businesses_df, warehouses_df, products_df,
+                               initial_warehouse_products_df=None):
+    """
+    Valida la integridad de los datos transaccionales generados
+    
+    Las reglas se evalúan con el motor vectorizado de validation_engine; el
+    reporte estructurado (con las filas que incumplen cada regla) se puede
+    obtener directamente con validate_tables y validate_stock_ledger.
+    
+    Args:
+        initial_warehouse_products_df: Stock inicial; si se indica, se reproduce
+            el libro de movimientos y se verifica que el saldo de cada pareja
+            nunca sea negativo y que coincida con el stock final
+    
+    Returns:
+        bool: True si todos los datos son válidos
+    """
+    
+    logger.info("\n🔍 VALIDANDO INTEGRIDAD DE DATOS TRANSACCIONALES...")
+    logger.info("="*60)
+    
+    report = validate_tables(users_df, warehouse_products_df, transactions_df,
+                             businesses_df, warehouses_df, products_df)
+    
+    if initial_warehouse_products_df is not None:
+        logger.info("📒 Reproduciendo libro de movimientos de stock...")
+        ledger_report = validate_stock_ledger(
+            initial_warehouse_products_df, warehouse_products_df, transactions_df
+        )
+        report.issues.extend(ledger_report.issues)
+    errors = report.errors
+    warnings = report.warnings
+    
+    # Mostrar resultados de validación
+    logger.info("\n📋 RESULTADOS DE VALIDACIÓN:")
+    logger.info("-" * 40)
+    
+    if errors:
+        logger.error("❌ ERRORES ENCONTRADOS:")
+        for error in errors:
+            logger.info(f"  {error.message} ({len(error.rows):,} filas en {error.table})")
+    
+    if warnings:
+        logger.warning("⚠️ ADVERTENCIAS:")
+        for warning in warnings:
+            logger.info(f"  {warning.message}")
+    
+    if not errors and not warnings:
+        logger.info("✅ Todos los datos transaccionales son válidos")
+    elif not errors:
+        logger.info("✅ Datos válidos (con advertencias menores)")
+    
+    return report.is_valid
+
+def generate_comprehensive_summary(users_df, warehouse_products_df, transactions_df, 
+                                 businesses_df, warehouses_df, products_df):
+    """
+    Genera un reporte completo de todos los datos generados
+    """
+    
+    logger.info("\n📊 REPORTE COMPLETO DE DATOS GESTOCK")
+    logger.info("="*60)
+    
+    # Resumen general
+    logger.info("📈 RESUMEN GENERAL:")
+    logger.info(f"  🏢 Negocios: {len(businesses_df)}")
+    logger.info(f"  🏭 Almacenes: {len(warehouses_df)}")
+    logger.info(f"  📦 Productos: {len(products_df)}")
+    logger.info(f"  👥 Usuarios: {len(users_df)}")
+    logger.info(f"  📊 Registros de stock: {len(warehouse_products_df):,}")
+    logger.info(f"  💱 Transacciones: {len(transactions_df):,}")
+    
+    # Análisis por negocio
+    logger.info(f"\n🏢 ANÁLISIS POR NEGOCIO:")
+    for _, business in businesses_df.iterrows():
+        business_id = business['id']
+        business_name = business['name']
+        business_type = business['business_type']
+        
+        # Contadores
+        business_warehouses = len(warehouses_df[warehouses_df['business_id'] == business_id])
+        business_users = len(users_df[users_df['business_id'] == business_id])
+        business_stock_records = len(warehouse_products_df[
+            warehouse_products_df['warehouse_id'].isin(
+                warehouses_df[warehouses_df['business_id'] == business_id]['id']
+            )
+        ])
+        business_transactions = len(transactions_df[transactions_df['business_id'] == business_id])
+        
+        logger.info(f"  {business_name} ({business_type}):")
+        logger.info(f"    - Almacenes: {business_warehouses}")
+        logger.info(f"    - Usuarios: {business_users}")
+        logger.info(f"    - Productos en stock: {business_stock_records}")
+        logger.info(f"    - Transacciones: {business_transactions}")
+    
+    # Estadísticas de transacciones
+    logger.info(f"\n💱 ESTADÍSTICAS DE TRANSACCIONES:")
+    
+    # Por tipo
+    type_counts = transactions_df['type'].value_counts()
+    total_transactions = len(transactions_df)
+    
+    for t_type, count in type_counts.items():
+        percentage = (count / total_transactions) * 100
+        logger.info(f"  {t_type}: {count:,} ({percentage:.1f}%)")
+    
+    # Período de datos
+    min_date = transactions_df['created_at'].min()
+    max_date = transactions_df['created_at'].max()
+    logger.info(f"  Período: {min_date.strftime('%Y-%m-%d')} a {max_date.strftime('%Y-%m-%d')}")
+    
+    # Volumen de unidades
+    total_entries = transactions_df[transactions_df['type'] == 'ENTRADA']['quantity'].sum()
+    total_exits = transactions_df[transactions_df['type'] == 'SALIDA']['quantity'].sum()
+    
+    logger.info(f"  Total unidades ingresadas: {total_entries:,}")
+    logger.info(f"  Total unidades vendidas: {total_exits:,}")
+    logger.info(f"  Balance neto: {total_entries - total_exits:,}")
+    
+    # Stock actual
+    current_total_stock = warehouse_products_df['stock'].sum()
+    logger.info(f"  Stock actual total: {current_total_stock:,} unidades")
+    
+    # Valor del inventario
+    stock_with_products = warehouse_products_df.merge(
+        products_df[['id', 'price']], left_on='product_id', right_on='id'
+    )
+    total_inventory_value = (stock_with_products['stock'] * stock_with_products['price']).sum()
+    logger.info(f"  Valor total del inventario: ${total_inventory_value:,.0f}")
+    
+    logger.info(f"\n📅 Fecha de generación: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+def main(workers=1, storage_format='parquet', normalized=False, incremental=False, seed=None,
+         scale=DEFAULT_SCALE):
+    """
+    Función principal que ejecuta todo el proceso de generación transaccional
+    
+    Args:
+        workers (int): Procesos para generar transacciones; con más de uno
+            cada negocio se simula en paralelo. No cambia el resultado
+        storage_format (str): Formato de salida: 'parquet', 'feather' o 'csv'
+        normalized (bool): Guardar transactions como tabla de hechos solo con IDs;
+            las columnas descriptivas se reconstruyen con transactions_view
+        incremental (bool): Simular solo los días posteriores a la última
+            transacción guardada y agregarlos a la tabla (ver append_transactional_data)
+        seed (int): Semilla de la ejecución; con la misma semilla y los mismos
+            datos base el resultado es idéntico (ver seeding)
+        scale (str): Perfil de escala (ver scale_profiles); debe coincidir con
+            el de los datos base
+    """
+    
+    if incremental:
+        return append_transactional_data(workers, storage_format, normalized, seed=seed, scale=scale)
+    
+    profile = get_scale_profile(scale)
+    
+    logger.info("🚀 INICIANDO GENERACIÓN DE DATOS TRANSACCIONALES GESTOCK")
+    logger.info("="*70)
+    logger.info(f"📐 {describe_profile(scale)}")
+    
+    try:
+        # Cargar datos base
+        logger.info("📋 Cargando datos base...")
+        businesses_df = load_table('businesses')
+        warehouses_df = load_table('warehouses')
+        products_df = load_table('products')
+        
+        logger.info(f"  ✅ {len(businesses_df)} negocios")
+        logger.info(f"  ✅ {len(warehouses_df)} almacenes")
+        logger.info(f"  ✅ {len(products_df)} productos")
+        
+        # Generar usuarios
+        logger.info("\n1️⃣ Generando usuarios...")
+        users_df = generate_users(businesses_df, profile['users_per_business_range'], seed=seed)
+        save_table(users_df, 'users', storage_format)
+        
+        # Generar stock inicial
+        logger.info("\n2️⃣ Generando stock inicial...")
+        warehouse_products_df = generate_warehouse_products(
+            businesses_df, warehouses_df, products_df, seed=seed,
+            assortment_scale=profile['assortment_scale']
+        )
+        save_table(warehouse_products_df, 'warehouse_products', storage_format)
+        
+        # Generar transacciones
+        logger.info("\n3️⃣ Generando transacciones...")
+        transactions_df, updated_stock_df = generate_transactions_parallel(
+            warehouse_products_df, users_df, warehouses_df,
+            products_df, businesses_df, months_back=profile['months_back'],
+            target_transactions=profile['target_transactions'],
+            max_workers=workers, normalized=normalized, seed=seed
+        )
+        
+        save_table(transactions_df, 'transactions', storage_format)
+        save_table(updated_stock_df, 'warehouse_products', storage_format)
+        
+        # El reporte usa las columnas descriptivas; se materializan solo en memoria
+        if normalized:
+            transactions_df = denormalize_transactions(
+                transactions_df, products_df, warehouses_df, users_df
+            )
+        
+        # Usar el stock actualizado para validaciones
+        initial_stock_df = warehouse_products_df
+        warehouse_products_df = updated_stock_df
+        
+        # Validar integridad y reproducir el libro de movimientos
+        if validate_transactional_data(users_df, warehouse_products_df, transactions_df,
+                                     businesses_df, warehouses_df, products_df,
+                                     initial_warehouse_products_df=initial_stock_df):
+            logger.info("\n✅ GENERACIÓN TRANSACCIONAL EXITOSA")
+        else:
+            logger.error("\n❌ GENERACIÓN CON ERRORES")
+            return False
+        
+        # Generar reporte completo
+        generate_comprehensive_summary(users_df, warehouse_products_df, transactions_df,
+                                     businesses_df, warehouses_df, products_df)
+        
+        logger.info(f"\n🎉 PROCESO TRANSACCIONAL COMPLETADO")
+        logger.info(f"📁 Archivos actualizados en: {raw_dir()}")
+        extension = FORMATS[storage_format]
+        logger.info(f"   - users{extension} ({len(users_df)} usuarios)")
+        logger.info(f"   - warehouse_products{extension} ({len(warehouse_products_df)} registros de stock)")
+        logger.info(f"   - transactions{extension} ({len(transactions_df)} transacciones)")
+        
+        return True
+        
+    except Exception as e:
+        logger.exception(f"\n❌ ERROR durante la generación transaccional: {str(e)}")
+        return False
+
+def append_transactional_data(workers=1, storage_format='parquet', normalized=False, end_date=None,
+                              seed=None, scale=DEFAULT_SCALE):
+    """
+    Agrega a las tablas existentes las transacciones de los días nuevos
+    
+    Carga el último snapshot de stock (warehouse_products) y el máximo id y
+    created_at de transactions, simula solo los días completos desde el
+    siguiente a la última transacción hasta el último día terminado en
+    end_date (con el mismo horario que una ejecución completa) y agrega las
+    filas como archivos nuevos del dataset, con IDs a continuación de los
+    existentes. Usuarios y stock inicial no se regeneran; el snapshot de
+    stock se reemplaza por el final.
+    Si ya existe el cubo de movimientos en processed/, el lote se combina con
+    él y sus resúmenes (ver aggregates.apply_transaction_batch).
+    
+    Args:
+        workers (int): Procesos para generar transacciones
+        storage_format (str): Formato de las tablas existentes
+        normalized (bool): Debe coincidir con la forma de la tabla existente
+        end_date (datetime): "Ahora" de la actualización (por defecto, el de
+            referencia si hay semilla o la fecha actual; ver seeding.resolve_now).
+            Si cae a mitad de un día, ese día queda para la próxima actualización
+        seed (int): Semilla de la ejecución; los flujos aleatorios dependen del
+            negocio y del día, así que cada día nuevo se simula igual que en una
+            ejecución completa con la misma semilla y el mismo stock de partida
+        scale (str): Perfil de escala; fija el volumen diario de transacciones
+    
+    Returns:
+        bool: True si la actualización terminó sin errores
+    """
+    
+    profile = get_scale_profile(scale)
+    
+    logger.info("🔁 ACTUALIZACIÓN INCREMENTAL DE TRANSACCIONES GESTOCK")
+    logger.info("="*70)
+    
+    try:
+        # Cargar dimensiones y el último snapshot de stock
+        logger.info("📋 Cargando datos existentes...")
+        businesses_df = load_table('businesses')
+        warehouses_df = load_table('warehouses')
+        products_df = load_table('products')
+        users_df = load_table('users', storage_format)
+        stock_snapshot_df = load_table('warehouse_products', storage_format)
+        
+        # Marca de agua: último id y última fecha ya guardados
+        watermark = table_max('transactions', ['id', 'created_at'], storage_format)
+        last_id = int(watermark['id'] or 0)
+        last_created_at = watermark['created_at']
+        
+        # Solo días completos: el día en curso se simula en la próxima
+        # actualización y no se escriben transacciones posteriores a "ahora"
+        now = pd.Timestamp(resolve_now(end_date, seed))
+        end_date = ((now + pd.Timedelta(seconds=1)).normalize() - pd.Timedelta(seconds=1)).to_pydatetime()
+        if last_created_at is None:
+            start_date = end_date - timedelta(days=profile['months_back'] * 30)
+        else:
+            start_date = (last_created_at.normalize() + pd.Timedelta(days=1)).to_pydatetime()
+        
+        logger.info(f"  ✅ Última transacción: id {last_id:,} ({last_created_at})")
+        
+        if start_date > end_date:
+            logger.info("\n✅ No hay días nuevos para simular")
+            return True
+        
+        # Simular solo los días nuevos
+        logger.info(f"\n3️⃣ Generando transacciones de {(end_date - start_date).days + 1} días nuevos...")
+        transactions_df, updated_stock_df = generate_transactions_parallel(
+            stock_snapshot_df, users_df, warehouses_df,
+            products_df, businesses_df, months_back=profile['months_back'],
+            target_transactions=profile['target_transactions'], max_workers=workers,
+            normalized=normalized, start_date=start_date, end_date=end_date, seed=seed
+        )
+        transactions_df['id'] += last_id
+        
+        # Validar solo el tramo nuevo contra el snapshot del que partió
+        if not validate_transactional_data(users_df, updated_stock_df, transactions_df,
+                                           businesses_df, warehouses_df, products_df,
+                                           initial_warehouse_products_df=stock_snapshot_df):
+            logger.error("\n❌ ACTUALIZACIÓN CON ERRORES")
+            return False
+        
+        save_table(transactions_df, 'transactions', storage_format, append=True)
+        save_table(updated_stock_df, 'warehouse_products', storage_format)
+        
+        # Combinar el lote con el cubo y los resúmenes de processed/
+        written = apply_transaction_batch(transactions_df, updated_stock_df, warehouses_df,
+                                          products_df, storage_format)
+        if written is None:
+            logger.info("ℹ️ No hay cubo de movimientos que actualizar (gestock cube lo construye)")
+        else:
+            logger.info(f"  ✅ Tablas procesadas actualizadas: {', '.join(written)}")
+        
+        logger.info(f"\n🎉 ACTUALIZACIÓN INCREMENTAL COMPLETADA")
+        logger.info(f"   - {len(transactions_df):,} transacciones nuevas "
+                    f"(ids {last_id + 1:,} a {last_id + len(transactions_df):,})")
+        
+        return True
+        
+    except Exception as e:
+        logger.exception(f"\n❌ ERROR durante la actualización incremental: {str(e)}")
+        return False
+
+if __name__ == "__main__":
+    configure_logging()
+    success = main()
+    sys.exit(0 if success else 1)
\ No newline at end of file
@@ -0,0 +1,952 @@
+"""
+Generador de datos mockeados para la tabla Transactions de GESTOCK
+Genera movimientos de inventario con patrones estacionales y temporales realistas
+"""
+
+import os
+import pandas as pd
+import numpy as np
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+from .config import raw_dir
+from .stock_engine import StockState
+from .dimension_lookups import DimensionLookups
+from .transactions_view import DENORMALIZED_COLUMNS
+from .storage import load_table
+from .schema import apply_schema
+from .seeding import resolve_now, stream
+from . import instrumentation
+from .logs import configure_logging, get_logger, silenced
+
+logger = get_logger(__name__)
+
+# Patrones estacionales por categoría (multiplicadores de actividad)
+SEASONAL_PATTERNS = {
+    "Alimentos": {
+        1: 1.1, 2: 1.0, 3: 1.1, 4: 1.2, 5: 1.1, 6: 1.0,
+        7: 1.0, 8: 1.1, 9: 1.2, 10: 1.3, 11: 1.4, 12: 1.5  # Más actividad hacia fin de año
+    },
+    "Ropa": {
+        1: 0.8, 2: 1.0, 3: 1.3, 4: 1.2, 5: 1.1, 6: 1.0,
+        7: 0.9, 8: 1.1, 9: 1.2, 10: 1.3, 11: 1.4, 12: 1.6  # Picos en marzo (escolar) y diciembre
+    },
+    "Electrónicos": {
+        1: 0.9, 2: 1.0, 3: 1.2, 4: 1.1, 5: 1.0, 6: 1.1,
+        7: 1.0, 8: 1.1, 9: 1.2, 10: 1.1, 11: 1.3, 12: 1.4  # Black Friday y Navidad
+    },
+    "Construcción": {
+        1: 1.2, 2: 1.3, 3: 1.4, 4: 1.3, 5: 1.2, 6: 1.1,
+        7: 1.0, 8: 1.1, 9: 1.2, 10: 1.3, 11: 1.2, 12: 0.8  # Temporada seca construcción
+    },
+    "Salud": {
+        1: 1.1, 2: 1.0, 3: 1.1, 4: 1.2, 5: 1.3, 6: 1.2,
+        7: 1.1, 8: 1.0, 9: 1.1, 10: 1.2, 11: 1.1, 12: 1.0  # Picos en épocas de lluvia
+    },
+    "Hogar": {
+        1: 1.2, 2: 1.1, 3: 1.0, 4: 1.1, 5: 1.0, 6: 1.1,
+        7: 1.2, 8: 1.1, 9: 1.0, 10: 1.1, 11: 1.2, 12: 1.3  # Limpieza enero y diciembre
+    },
+    "Oficina": {
+        1: 1.4, 2: 1.3, 3: 1.2, 4: 1.1, 5: 1.0, 6: 1.1,
+        7: 1.2, 8: 1.1, 9: 1.0, 10: 1.1, 11: 1.0, 12: 0.8  # Inicio de año escolar/laboral
+    }
+}
+
+# Patrones por día de la semana (0=lunes, 6=domingo)
+WEEKLY_PATTERNS = [1.2, 1.3, 1.4, 1.3, 1.2, 0.8, 0.5]  # Menos actividad fines de semana
+
+# Plantillas de descripción por tipo de transacción
+DESCRIPTION_TEMPLATES = {
+    "ENTRADA": [
+        "Compra a proveedor {supplier}",
+        "Reposición de stock - {product_name}",
+        "Entrada por compra mayorista",
+        "Recepción de mercancía - Pedido #{order}",
+        "Reabastecimiento {warehouse_name}",
+        "Compra directa - {supplier}"
+    ],
+    "SALIDA": [
+        "Venta al cliente - Pedido #{order}",
+        "Salida por venta mostrador",
+        "Entrega a cliente - {product_name}",
+        "Venta corporativa",
+        "Despacho desde {warehouse_name}",
+        "Salida por venta directa",
+        "Entrega domicilio - Cliente #{client}"
+    ]
+}
+
+# Columnas del DataFrame de transacciones
+TRANSACTION_COLUMNS = [
+    'id', 'type', 'quantity', 'description', 'created_at', 'user_id',
+    'product_id', 'warehouse_id', 'product_name', 'product_category',
+    'warehouse_name', 'business_id', 'user_name'
+]
+
+# Filas acumuladas por bloque en el modo secuencial: construir un DataFrame
+# por día es lo más costoso cuando cada negocio se simula por separado
+SEQUENTIAL_BLOCK_ROWS = 50_000
+
+# Parejas producto-almacén con stock mínimas por fragmento de la generación en
+# paralelo: con muchos negocios pequeños, simular cada uno por separado cuesta
+# más en preparación que en simulación
+MIN_SHARD_PAIRS = 5_000
+
+def generate_transactions(warehouse_products_df, users_df, warehouses_df, products_df, 
+                         businesses_df, months_back=6, target_transactions=1800,
+                         mode='sequential', batch_days=7, end_date=None, seed=None,
+                         normalized=False, start_date=None):
+    """
+    Genera transacciones de inventario con patrones realistas
+    
+    Args:
+        warehouse_products_df: DataFrame con stock inicial
+        users_df: DataFrame con usuarios
+        warehouses_df: DataFrame con almacenes
+        products_df: DataFrame con productos
+        businesses_df: DataFrame con negocios
+        months_back: Meses hacia atrás desde hoy
+        target_transactions: Número objetivo de transacciones
+        mode: 'sequential' (evento por evento) o 'batched' (bloques de días vectorizados).
+            En 'batched' las SALIDAS sin stock se descartan, por lo que el total puede
+            quedar bajo el objetivo si cada pareja recibe muchos eventos por bloque
+        batch_days: Días simulados por bloque en modo 'batched'
+        end_date: Fecha final de la simulación (por defecto, el "ahora" de
+            referencia si hay semilla o la fecha actual; ver seeding.resolve_now)
+        seed: Semilla de la ejecución. Cada día (o bloque de días) usa su propio
+            flujo aleatorio derivado de ella (ver seeding.stream)
+        normalized: Si es True, devuelve una tabla de hechos solo con IDs, sin las
+            columnas copiadas de las dimensiones (ver transactions_view.TransactionsView)
+        start_date: Fecha inicial de la simulación (por defecto, months_back antes
+            de end_date). El ritmo diario se sigue calculando con months_back, de
+            modo que simular solo los días nuevos mantiene el mismo volumen por día
+    
+    Returns:
+        tuple: (transactions_df, updated_warehouse_products_df)
+    """
+    
+    current_stock, blocks = _simulation_blocks(
+        warehouse_products_df, users_df, warehouses_df, products_df,
+        months_back, target_transactions, mode, batch_days, end_date, seed, normalized,
+        start_date
+    )
+    return _collect_transactions(current_stock, blocks, normalized)
+
+def _collect_transactions(current_stock, blocks, normalized):
+    """
+    Ejecuta la simulación completa y une sus bloques
+    
+    Returns:
+        tuple: (transactions_df, updated_warehouse_products_df)
+    """
+    blocks = list(blocks)
+    
+    # Convertir a DataFrame y asignar IDs consecutivos
+    if blocks:
+        transactions_df = pd.concat(blocks, ignore_index=True)
+    else:
+        transactions_df = pd.DataFrame(columns=_output_columns(normalized)[1:])
+    transactions_df.insert(0, 'id', np.arange(1, len(transactions_df) + 1))
+    
+    # Construir DataFrame del stock actualizado
+    updated_stock = current_stock.to_frame()
+    
+    return (
+        apply_schema(transactions_df, 'transactions'),
+        apply_schema(updated_stock, 'warehouse_products')
+    )
+
+def stream_transactions(warehouse_products_df, users_df, warehouses_df, products_df,
+                        businesses_df, months_back=6, target_transactions=1800,
+                        mode='sequential', batch_days=7, end_date=None, seed=None,
+                        chunk_size=100_000, normalized=False, start_date=None):
+    """
+    Genera transacciones como un flujo de chunks columnares de tamaño fijo
+    
+    A diferencia de generate_transactions, nunca materializa el historial
+    completo: la memoria máxima depende de chunk_size y no de months_back.
+    
+    Args:
+        Mismos que generate_transactions, más:
+        chunk_size: Número de filas por chunk
+    
+    Returns:
+        TransactionStream: Iterable de DataFrames con el esquema de transactions_df
+    """
+    current_stock, blocks = _simulation_blocks(
+        warehouse_products_df, users_df, warehouses_df, products_df,
+        months_back, target_transactions, mode, batch_days, end_date, seed, normalized,
+        start_date
+    )
+    return TransactionStream(current_stock, blocks, chunk_size)
+
+class TransactionStream:
+    """
+    Flujo de transacciones en chunks de chunk_size filas con IDs consecutivos
+    
+    Se puede iterar una sola vez. Al agotarse, updated_stock contiene el
+    DataFrame de stock final (mismo esquema que el de generate_transactions).
+    """
+    
+    def __init__(self, current_stock, blocks, chunk_size):
+        self._current_stock = current_stock
+        self._blocks = blocks
+        self.chunk_size = chunk_size
+        self.updated_stock = None
+    
+    def __iter__(self):
+        next_id = 1
+        buffer = []
+        buffered = 0
+        
+        for block in self._blocks:
+            buffer.append(block)
+            buffered += len(block)
+            if buffered < self.chunk_size:
+                continue
+            
+            merged = pd.concat(buffer, ignore_index=True)
+            offset = 0
+            while len(merged) - offset >= self.chunk_size:
+                yield _with_ids(merged.iloc[offset:offset + self.chunk_size], next_id)
+                next_id += self.chunk_size
+                offset += self.chunk_size
+            buffer = [merged.iloc[offset:]]
+            buffered = len(merged) - offset
+        
+        if buffered:
+            yield _with_ids(pd.concat(buffer, ignore_index=True), next_id)
+        
+        self.updated_stock = apply_schema(self._current_stock.to_frame(), 'warehouse_products')
+
+def _with_ids(block, first_id):
+    """
+    Devuelve una copia del bloque con la columna id a partir de first_id
+    """
+    chunk = block.reset_index(drop=True)
+    chunk.insert(0, 'id', np.arange(first_id, first_id + len(chunk)))
+    return apply_schema(chunk, 'transactions')
+
+def _simulation_blocks(warehouse_products_df, users_df, warehouses_df, products_df,
+                       months_back, target_transactions, mode, batch_days, end_date, seed,
+                       normalized=False, start_date=None, stream_keys=('transactions',)):
+    """
+    Prepara el estado de la simulación y el iterador de bloques de transacciones
+    
+    Args:
+        stream_keys: Claves de los flujos aleatorios de esta simulación; a cada
+            día o bloque se le agrega su fecha (ordinal) como última clave
+    
+    Returns:
+        tuple: (StockState, iterador de DataFrames sin columna id)
+    """
+    if mode not in ('sequential', 'batched'):
+        raise ValueError(f"Modo de generación desconocido: {mode}")
+    
+    # Configurar fecha de inicio y fin
+    end_date = resolve_now(end_date, seed)
+    if start_date is None:
+        start_date = end_date - timedelta(days=months_back * 30)
+    # Los días simulados empiezan a medianoche: las horas de los eventos se
+    # cuentan desde el comienzo de cada día y el último día es el de end_date
+    start_date = pd.Timestamp(start_date).normalize().to_pydatetime()
+    
+    logger.info(f"📅 Generando transacciones desde {start_date.strftime('%Y-%m-%d')} hasta {end_date.strftime('%Y-%m-%d')}")
+    
+    # Estado de stock en arreglos NumPy con conjunto incremental de parejas disponibles
+    current_stock = StockState(warehouse_products_df)
+    
+    # Búsquedas densas por ID construidas una sola vez por ejecución
+    lookups = DimensionLookups(products_df, warehouses_df, users_df)
+    
+    daily_transaction_target = target_transactions / (months_back * 30)
+    
+    if mode == 'batched':
+        blocks = _iter_batched_blocks(
+            current_stock, lookups, start_date, end_date,
+            daily_transaction_target, batch_days, seed, stream_keys
+        )
+    else:
+        blocks = _iter_sequential_blocks(
+            current_stock, lookups, start_date, end_date, daily_transaction_target, seed,
+            stream_keys
+        )
+    
+    if normalized:
+        blocks = (block.drop(columns=DENORMALIZED_COLUMNS) for block in blocks)
+    
+    return current_stock, blocks
+
+def _output_columns(normalized):
+    """
+    Columnas de la tabla de transacciones según su forma (normalizada o no)
+    """
+    if normalized:
+        return [c for c in TRANSACTION_COLUMNS if c not in DENORMALIZED_COLUMNS]
+    return TRANSACTION_COLUMNS
+
+def generate_transactions_parallel(warehouse_products_df, users_df, warehouses_df, products_df,
+                                   businesses_df, months_back=6, target_transactions=1800,
+                                   mode='sequential', batch_days=7, max_workers=None, seed=None,
+                                   normalized=False, start_date=None, end_date=None):
+    """
+    Genera transacciones en paralelo, un proceso por fragmento de negocios
+    
+    Los negocios no comparten almacenes ni usuarios, así que la simulación de
+    cada business_id es independiente. Los negocios se agrupan, en orden de id,
+    en fragmentos de al menos MIN_SHARD_PAIRS parejas producto-almacén con
+    stock. Cada fragmento recibe una fracción del objetivo proporcional a sus
+    parejas con stock y sus propios flujos aleatorios derivados de `seed` y del
+    primer business_id del fragmento. Al final se unen los resultados, se
+    ordenan por fecha y se asignan IDs globales. Los fragmentos dependen solo de
+    los datos, así que con la misma semilla el resultado es idéntico para
+    cualquier número de procesos; con max_workers=1 se simulan en el proceso actual.
+    
+    Args:
+        warehouse_products_df: DataFrame con stock inicial
+        users_df: DataFrame con usuarios
+        warehouses_df: DataFrame con almacenes
+        products_df: DataFrame con productos
+        businesses_df: DataFrame con negocios
+        months_back: Meses hacia atrás desde hoy
+        target_transactions: Número objetivo de transacciones
+        mode: 'sequential' o 'batched' (ver generate_transactions)
+        batch_days: Días simulados por bloque en modo 'batched'
+        max_workers: Número máximo de procesos (por defecto, núcleos disponibles)
+        seed: Semilla de la ejecución de la que se derivan los flujos de cada negocio
+        normalized: Si es True, devuelve una tabla de hechos solo con IDs
+        start_date: Fecha inicial de la simulación (ver generate_transactions)
+        end_date: Fecha final común a todos los negocios (ver generate_transactions)
+    
+    Returns:
+        tuple: (transactions_df, updated_warehouse_products_df)
+    """
+    
+    # Fecha de referencia común para todos los negocios
+    end_date = resolve_now(end_date, seed)
+    
+    # Negocio de cada pareja producto-almacén
+    warehouse_business = warehouses_df.set_index('id')['business_id']
+    pair_business = warehouse_products_df['warehouse_id'].map(warehouse_business)
+    in_stock_pairs = (warehouse_products_df['stock'] > 0).groupby(pair_business).sum().sort_index()
+    total_in_stock = in_stock_pairs.sum()
+    
+    # Fragmento de cada negocio, identificado por su primer business_id
+    shard_of_business = _shard_businesses(in_stock_pairs)
+    users_by_shard = {
+        int(shard_id): group
+        for shard_id, group in users_df.groupby(users_df['business_id'].map(shard_of_business))
+    }
+    warehouses_by_shard = {
+        int(shard_id): group
+        for shard_id, group in warehouses_df.groupby(warehouses_df['business_id'].map(shard_of_business))
+    }
+    shard_in_stock = in_stock_pairs.groupby(in_stock_pairs.index.map(shard_of_business)).sum()
+    
+    shards = []
+    for shard_id, shard_stock in warehouse_products_df.groupby(pair_business.map(shard_of_business)):
+        shard_id = int(shard_id)
+        shard_target = target_transactions * shard_in_stock[shard_id] / max(1, total_in_stock)
+        shards.append((
+            shard_stock,
+            users_by_shard.get(shard_id, users_df.iloc[:0]),
+            warehouses_by_shard[shard_id],
+            shard_target,
+            shard_id
+        ))
+    
+    # Procesar primero los fragmentos más grandes para balancear la carga
+    shards.sort(key=lambda shard: len(shard[0]), reverse=True)
+    
+    shard_args = [
+        (shard_stock, shard_users, shard_warehouses, products_df, months_back, shard_target,
+         mode, batch_days, start_date, end_date, seed, shard_id)
+        for shard_stock, shard_users, shard_warehouses, shard_target, shard_id in shards
+    ]
+    if max_workers == 1:
+        logger.info(f"🧵 Generando transacciones de {len(in_stock_pairs)} negocios en {len(shards)} fragmentos")
+        results = [_generate_shard(*args) for args in shard_args]
+    else:
+        logger.info(f"🧵 Generando transacciones de {len(in_stock_pairs)} negocios en {len(shards)} fragmentos en paralelo")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_generate_shard, *args) for args in shard_args]
+            results = [future.result() for future in futures]
+    
+    transaction_frames = []
+    stock_frames = []
+    for (shard_stock, *_), (shard_transactions, shard_updated_stock) in zip(shards, results):
+        shard_updated_stock.index = shard_stock.index
+        transaction_frames.append(shard_transactions)
+        stock_frames.append(shard_updated_stock)
+    
+    # Unir resultados: orden temporal global e IDs consecutivos
+    transactions_df = pd.concat(transaction_frames, ignore_index=True)
+    transactions_df = transactions_df.sort_values(
+        ['created_at', 'business_id'], kind='stable'
+    ).reset_index(drop=True)
+    transactions_df['id'] = np.arange(1, len(transactions_df) + 1)
+    if normalized:
+        transactions_df = transactions_df.drop(columns=DENORMALIZED_COLUMNS)
+    
+    updated_stock = pd.concat(stock_frames).sort_index().reset_index(drop=True)
+    
+    return (
+        apply_schema(transactions_df, 'transactions'),
+        apply_schema(updated_stock, 'warehouse_products')
+    )
+
+def _shard_businesses(in_stock_pairs):
+    """
+    Agrupa negocios consecutivos en fragmentos de al menos MIN_SHARD_PAIRS parejas con stock
+    
+    Args:
+        in_stock_pairs (pandas.Series): Parejas con stock por business_id, ordenadas por id
+    
+    Returns:
+        dict: business_id -> primer business_id de su fragmento
+    """
+    shard_of_business = {}
+    shard_id, accumulated = None, 0
+    for business_id, pairs in in_stock_pairs.items():
+        if shard_id is None or accumulated >= MIN_SHARD_PAIRS:
+            shard_id, accumulated = int(business_id), 0
+        shard_of_business[business_id] = shard_id
+        accumulated += int(pairs)
+    return shard_of_business
+
+def _generate_shard(warehouse_products_df, users_df, warehouses_df, products_df, months_back,
+                    target_transactions, mode, batch_days, start_date, end_date, seed, shard_id):
+    """
+    Genera las transacciones de un fragmento de negocios con sus propios flujos aleatorios
+    """
+    # Silenciar el progreso de los negocios para no mezclar su salida
+    with silenced(logger.name), \
+            instrumentation.stage('transactions.shard', shard_id=shard_id):
+        current_stock, blocks = _simulation_blocks(
+            warehouse_products_df, users_df, warehouses_df, products_df,
+            months_back, target_transactions, mode, batch_days, end_date, seed,
+            start_date=start_date, stream_keys=('transactions', shard_id)
+        )
+        return _collect_transactions(current_stock, blocks, normalized=False)
+
+def _iter_sequential_blocks(current_stock, lookups, start_date, end_date, daily_transaction_target,
+                            seed=None, stream_keys=('transactions',)):
+    """
+    Simula las transacciones evento por evento, día por día
+    
+    Cada día usa su propio flujo aleatorio (stream_keys + fecha ordinal) y
+    emite una muestra de instrumentación ('transactions.day') con las filas
+    generadas, los eventos descartados y las SALIDAS rechazadas o recortadas.
+    
+    Yields:
+        pandas.DataFrame: Transacciones de hasta SEQUENTIAL_BLOCK_ROWS filas
+            (días completos), sin columna id
+    """
+    
+    generated = 0
+    total_days = (end_date - start_date).days
+    transactions = []
+    
+    # Generar transacciones día por día
+    current_date = start_date
+    
+    while current_date <= end_date:
+        rng = stream(seed, *stream_keys, current_date.toordinal())
+        day_started = time.perf_counter()
+        day_rows = len(transactions)
+        skipped = rejected_salidas = clamped_salidas = 0
+        
+        # Ajustar por día de la semana
+        weekday_multiplier = WEEKLY_PATTERNS[current_date.weekday()]
+        
+        # Calcular transacciones para este día
+        daily_transactions = max(1, int(daily_transaction_target * weekday_multiplier * rng.uniform(0.7, 1.3)))
+        
+        # Horas del día sorteadas de antemano y ordenadas: el orden de
+        # generación coincide con el orden temporal (el saldo de cada pareja
+        # reproducido por fecha nunca queda negativo)
+        minute_offsets = np.sort(
+            rng.integers(8, 19, daily_transactions) * 60 + rng.integers(0, 60, daily_transactions)
+        ).tolist()
+        
+        # Generar transacciones para este día
+        for minute_offset in minute_offsets:
+            # Seleccionar warehouse_product aleatorio entre los que tienen stock
+            stock_pos = current_stock.sample_in_stock(rng)
+            
+            if stock_pos < 0:
+                skipped += 1
+                continue
+            
+            product_id = int(current_stock.product_ids[stock_pos])
+            warehouse_id = int(current_stock.warehouse_ids[stock_pos])
+            
+            # Obtener información adicional
+            category = lookups.categories[lookups.product_category[product_id]]
+            product_name = lookups.product_names[lookups.product_name[product_id]]
+            supplier = lookups.suppliers[lookups.product_supplier[product_id]]
+            warehouse_name = lookups.warehouse_names[lookups.warehouse_name[warehouse_id]]
+            business_id = int(lookups.warehouse_business[warehouse_id])
+            
+            # Aplicar patrón estacional
+            month = current_date.month
+            seasonal_multiplier = SEASONAL_PATTERNS.get(category, {}).get(month, 1.0)
+            
+            # Decidir tipo de transacción
+            current_stock_level = int(current_stock.stock[stock_pos])
+            min_stock = int(current_stock.min_stock[stock_pos])
+            max_stock = int(current_stock.max_stock[stock_pos])
+            
+            # Lógica para tipo de transacción
+            if current_stock_level <= min_stock:
+                # Stock bajo -> mayor probabilidad de ENTRADA
+                transaction_type = "ENTRADA" if rng.random() < 0.8 else "SALIDA"
+            elif current_stock_level >= max_stock * 0.8:
+                # Stock alto -> mayor probabilidad de SALIDA
+                transaction_type = "SALIDA" if rng.random() < 0.7 else "ENTRADA"
+            else:
+                # Stock normal -> balanceado con sesgo hacia SALIDA (más ventas que compras)
+                transaction_type = "SALIDA" if rng.random() < 0.6 else "ENTRADA"
+            
+            # Ajustar probabilidad por estacionalidad
+            if seasonal_multiplier > 1.2 and transaction_type == "SALIDA":
+                # En temporada alta, más salidas
+                pass
+            elif seasonal_multiplier > 1.2 and transaction_type == "ENTRADA":
+                # En temporada alta, también más reposición
+                pass
+            
+            # Calcular cantidad
+            if transaction_type == "ENTRADA":
+                # Cantidad de entrada basada en reposición
+                ideal_stock = (min_stock + max_stock) // 2
+                quantity = int(rng.integers(
+                    max(1, min_stock),
+                    max(min_stock + 1, ideal_stock),
+                    endpoint=True
+                ))
+            else:  # SALIDA
+                # Cantidad de salida limitada por stock actual
+                max_sale = min(current_stock_level, max(1, current_stock_level // 3))
+                quantity = int(rng.integers(1, max(1, max_sale), endpoint=True))
+            
+            # Aplicar modificador estacional a cantidad
+            quantity = max(1, int(quantity * seasonal_multiplier * rng.uniform(0.8, 1.2)))
+            
+            # Validar transacción de SALIDA
+            if transaction_type == "SALIDA" and quantity > current_stock_level:
+                quantity = current_stock_level
+                clamped_salidas += current_stock_level > 0
+                
+            if transaction_type == "SALIDA" and current_stock_level <= 0:
+                rejected_salidas += 1
+                continue  # Skip si no hay stock
+            
+            # Seleccionar usuario del mismo negocio
+            users_start, users_end = lookups.active_users_range(business_id)
+            
+            if users_end == users_start:
+                skipped += 1
+                continue
+                
+            user_id = int(lookups.active_user_ids[rng.integers(users_start, users_end)])
+            
+            # Generar descripción realista
+            templates = DESCRIPTION_TEMPLATES[transaction_type]
+            description = templates[rng.integers(len(templates))].format(
+                supplier=supplier,
+                product_name=product_name,
+                warehouse_name=warehouse_name,
+                order=rng.integers(1000, 10000),
+                client=rng.integers(100, 1000)
+            )
+            
+            # Crear transacción
+            transaction = {
+                'type': transaction_type,
+                'quantity': quantity,
+                'description': description,
+                'created_at': current_date + timedelta(minutes=minute_offset),
+                'user_id': user_id,
+                'product_id': product_id,
+                'warehouse_id': warehouse_id,
+                'product_name': product_name,
+                'product_category': category,
+                'warehouse_name': warehouse_name,
+                'business_id': business_id,
+                'user_name': lookups.user_names[lookups.user_name[user_id]]
+            }
+            
+            transactions.append(transaction)
+            generated += 1
+            
+            # Actualizar stock actual
+            if transaction_type == "ENTRADA":
+                current_stock.add(stock_pos, quantity)
+            else:  # SALIDA
+                current_stock.remove(stock_pos, quantity)
+        
+        instrumentation.sample('transactions.day', day_started, {
+            'rows': len(transactions) - day_rows,
+            'skipped_events': skipped,
+            'rejected_salidas': rejected_salidas,
+            'clamped_salidas': clamped_salidas
+        }, date=current_date.date().isoformat())
+        
+        if len(transactions) >= SEQUENTIAL_BLOCK_ROWS:
+            yield pd.DataFrame(transactions, columns=TRANSACTION_COLUMNS[1:])
+            transactions = []
+        
+        # Avanzar al siguiente día
+        current_date += timedelta(days=1)
+        
+        # Progreso cada 10 días
+        if (current_date - start_date).days % 10 == 0:
+            progress = (current_date - start_date).days / total_days * 100
+            logger.info("  📈 Progreso: %.1f%% - %d transacciones generadas", progress, generated)
+    
+    if transactions:
+        yield pd.DataFrame(transactions, columns=TRANSACTION_COLUMNS[1:])
+
+def _seasonal_table(categories):
+    """
+    Construye la tabla de multiplicadores estacionales [categoría, mes]
+    
+    Args:
+        categories (numpy.ndarray): Categorías en el orden de sus códigos
+    
+    Returns:
+        numpy.ndarray: Tabla de forma (len(categories), 13); la columna 0 no se usa
+    """
+    table = np.ones((len(categories), 13))
+    for code, category in enumerate(categories):
+        for month, multiplier in SEASONAL_PATTERNS.get(category, {}).items():
+            table[code, month] = multiplier
+    return table
+
+def _iter_batched_blocks(current_stock, lookups, start_date, end_date, daily_transaction_target,
+                         batch_days, seed=None, stream_keys=('transactions',)):
+    """
+    Simula las transacciones por bloques de días con operaciones vectorizadas
+    
+    Cada bloque usa su propio flujo aleatorio (stream_keys + fecha ordinal de
+    su primer día) y emite una muestra de instrumentación ('transactions.block').
+    
+    Yields:
+        pandas.DataFrame: Transacciones de cada bloque, sin columna id
+    """
+    
+    season_table = _seasonal_table(lookups.categories)
+    
+    # Calendario: día de la semana y mes de cada día simulado
+    num_days = (end_date - start_date).days + 1
+    day_offsets = np.arange(num_days)
+    day_weekdays = (start_date.weekday() + day_offsets) % 7
+    calendar_days = np.datetime64(start_date.date(), 'D') + day_offsets
+    day_months = calendar_days.astype('datetime64[M]').astype(np.int64) % 12 + 1
+    
+    generated = 0
+    
+    for block_start in range(0, num_days, batch_days):
+        block_days = day_offsets[block_start:block_start + batch_days]
+        rng = stream(seed, *stream_keys, start_date.toordinal() + block_start)
+        block_started = time.perf_counter()
+        counters = {}
+        block = _simulate_block(
+            current_stock, lookups, start_date, block_days, day_weekdays, day_months,
+            daily_transaction_target, season_table, rng, counters
+        )
+        instrumentation.sample(
+            'transactions.block', block_started, counters,
+            date=(start_date + timedelta(days=block_start)).date().isoformat(), days=len(block_days)
+        )
+        if block is not None:
+            generated += len(block)
+            yield block
+        
+        # Progreso cada 10 días
+        block_end = block_days[-1] + 1
+        if block_end // 10 > block_start // 10:
+            progress = min(block_end, num_days - 1) / (num_days - 1) * 100
+            logger.info("  📈 Progreso: %.1f%% - %d transacciones generadas", progress, generated)
+
+def _simulate_block(current_stock, lookups, start_date, block_days, day_weekdays, day_months,
+                    daily_transaction_target, season_table, rng, counters=None):
+    """
+    Sortea y resuelve todos los eventos de un bloque de días
+    
+    Parejas, tipos, cantidades, horas y minutos se sortean de una sola vez a
+    partir del stock al inicio del bloque. La factibilidad se resuelve por
+    pareja producto-almacén en orden temporal: el saldo acumulado se refleja
+    en cero (saldo - min(0, mínimo acumulado del saldo)), así cada SALIDA se
+    recorta al stock disponible en su momento y las SALIDAS sin stock se
+    descartan. El stock nunca queda negativo.
+    
+    Args:
+        counters (dict): Si se indica, recibe las filas generadas, los eventos
+            descartados y las SALIDAS rechazadas o recortadas del bloque
+    
+    Returns:
+        pandas.DataFrame: Transacciones del bloque sin columna id, o None si no hay eventos
+    """
+    
+    candidates = current_stock.in_stock_positions()
+    if len(candidates) == 0:
+        return None
+    
+    # Número de eventos por día según el patrón semanal
+    weekday_multiplier = np.asarray(WEEKLY_PATTERNS)[day_weekdays[block_days]]
+    daily_counts = np.maximum(
+        1, (daily_transaction_target * weekday_multiplier * rng.uniform(0.7, 1.3, len(block_days))).astype(np.int64)
+    )
+    event_day = np.repeat(block_days, daily_counts)
+    n = len(event_day)
+    
+    # Parejas producto-almacén y stock al inicio del bloque
+    pos = candidates[rng.integers(0, len(candidates), n)]
+    level = current_stock.stock[pos]
+    min_stock = current_stock.min_stock[pos]
+    max_stock = current_stock.max_stock[pos]
+    
+    # Tipo de transacción: stock bajo -> ENTRADA, stock alto -> SALIDA, normal -> sesgo a SALIDA
+    salida_probability = np.where(level <= min_stock, 0.2, np.where(level >= max_stock * 0.8, 0.7, 0.6))
+    is_salida = rng.random(n) < salida_probability
+    
+    # Cantidades: reposición hasta el stock ideal o venta hasta un tercio del stock
+    ideal_stock = (min_stock + max_stock) // 2
+    max_sale = np.maximum(1, np.minimum(level, np.maximum(1, level // 3)))
+    low = np.where(is_salida, 1, np.maximum(1, min_stock))
+    high = np.where(is_salida, max_sale, np.maximum(min_stock + 1, ideal_stock))
+    quantity = rng.integers(low, high + 1)
+    
+    # Aplicar modificador estacional a cantidad
+    product_ids = current_stock.product_ids[pos]
+    category_codes = lookups.product_category[product_ids]
+    seasonal_multiplier = season_table[category_codes, day_months[event_day]]
+    quantity = np.maximum(1, (quantity * seasonal_multiplier * rng.uniform(0.8, 1.2, n)).astype(np.int64))
+    
+    # Minuto del evento desde start_date (horario 8:00 - 18:59)
+    minute_offset = event_day * 1440 + rng.integers(8, 19, n) * 60 + rng.integers(0, 60, n)
+    
+    # Seleccionar usuario activo del mismo negocio
+    warehouse_ids = current_stock.warehouse_ids[pos]
+    business_ids = lookups.warehouse_business[warehouse_ids]
+    users_start = lookups.active_user_ptr[business_ids]
+    users_count = lookups.active_user_ptr[business_ids + 1] - users_start
+    user_pick = users_start + (rng.random(n) * users_count).astype(np.int64)
+    
+    # Descartar eventos de negocios sin usuarios activos
+    has_users = users_count > 0
+    
+    # Ordenar por pareja y tiempo para resolver el saldo de cada pareja
+    order = np.lexsort((minute_offset, pos))
+    order = order[has_users[order]]
+    if len(order) == 0:
+        return None
+    pos = pos[order]
+    is_salida = is_salida[order]
+    quantity = quantity[order]
+    
+    delta = np.where(is_salida, -quantity, quantity)
+    group_first = np.flatnonzero(np.r_[True, pos[1:] != pos[:-1]])
+    group_id = np.repeat(np.arange(len(group_first)), np.diff(np.r_[group_first, len(pos)]))
+    
+    cumulative = np.cumsum(delta)
+    group_offset = cumulative[group_first] - delta[group_first]
+    balance = current_stock.stock[pos] + cumulative - group_offset[group_id]
+    floor = np.minimum(0, pd.Series(balance).groupby(group_id).cummin().to_numpy())
+    level_after = balance - floor
+    
+    level_before = np.empty_like(level_after)
+    level_before[1:] = level_after[:-1]
+    level_before[group_first] = current_stock.stock[pos[group_first]]
+    applied = level_after - level_before
+    
+    # Stock final de cada pareja tocada en el bloque
+    group_last = np.r_[group_first[1:] - 1, len(pos) - 1]
+    current_stock.set_stock(pos[group_last], level_after[group_last])
+    
+    if counters is not None:
+        counters['rows'] = int(np.count_nonzero(applied))
+        counters['skipped_events'] = int(len(has_users) - len(order))
+        counters['rejected_salidas'] = int(np.count_nonzero(is_salida & (applied == 0)))
+        counters['clamped_salidas'] = int(np.count_nonzero(is_salida & (applied != 0) & (-applied < quantity)))
+    
+    # Conservar solo los movimientos efectivos en orden temporal
+    keep = applied != 0
+    order = order[keep]
+    applied = applied[keep]
+    time_order = np.argsort(minute_offset[order], kind='stable')
+    order = order[time_order]
+    applied = applied[time_order]
+    n = len(order)
+    
+    is_salida = applied < 0
+    quantity = np.abs(applied)
+    product_ids = product_ids[order]
+    warehouse_ids = warehouse_ids[order]
+    business_ids = business_ids[order]
+    user_ids = lookups.active_user_ids[user_pick[order]]
+    
+    product_names = lookups.product_names[lookups.product_name[product_ids]]
+    suppliers = lookups.suppliers[lookups.product_supplier[product_ids]]
+    warehouse_names = lookups.warehouse_names[lookups.warehouse_name[warehouse_ids]]
+    
+    # Generar descripción realista
+    entrada_templates = DESCRIPTION_TEMPLATES["ENTRADA"]
+    salida_templates = DESCRIPTION_TEMPLATES["SALIDA"]
+    template_idx = np.where(
+        is_salida,
+        rng.integers(0, len(salida_templates), n),
+        rng.integers(0, len(entrada_templates), n)
+    )
+    orders = rng.integers(1000, 10000, n)
+    clients = rng.integers(100, 1000, n)
+    descriptions = [
+        (salida_templates if salida else entrada_templates)[t].format(
+            supplier=supplier, product_name=product_name, warehouse_name=warehouse_name,
+            order=order_number, client=client
+        )
+        for salida, t, supplier, product_name, warehouse_name, order_number, client in zip(
+            is_salida.tolist(), template_idx.tolist(), suppliers, product_names,
+            warehouse_names, orders.tolist(), clients.tolist()
+        )
+    ]
+    
+    created_at = np.datetime64(start_date, 'us') + minute_offset[order].astype('timedelta64[m]')
+    
+    return pd.DataFrame({
+        'type': np.where(is_salida, "SALIDA", "ENTRADA").astype(object),
+        'quantity': quantity,
+        'description': descriptions,
+        'created_at': created_at,
+        'user_id': user_ids,
+        'product_id': product_ids,
+        'warehouse_id': warehouse_ids,
+        'product_name': product_names,
+        'product_category': lookups.categories[category_codes[order]],
+        'warehouse_name': warehouse_names,
+        'business_id': business_ids,
+        'user_name': lookups.user_names[lookups.user_name[user_ids]]
+    })
+
+def generate_transaction_summary(transactions_df):
+    """
+    Genera resumen de las transacciones generadas
+    """
+    logger.info(f"\n📊 RESUMEN DE TRANSACCIONES GENERADAS:")
+    logger.info("="*50)
+    
+    total_transactions = len(transactions_df)
+    logger.info(f"📝 Total transacciones: {total_transactions:,}")
+    
+    # Por tipo
+    type_summary = transactions_df['type'].value_counts()
+    logger.info(f"\n📈 Por tipo:")
+    for t_type, count in type_summary.items():
+        percentage = (count / total_transactions) * 100
+        logger.info(f"  {t_type}: {count:,} ({percentage:.1f}%)")
+    
+    # Por mes
+    transactions_df['month'] = pd.to_datetime(transactions_df['created_at']).dt.to_period('M')
+    monthly_summary = transactions_df['month'].value_counts().sort_index()
+    logger.info(f"\n📅 Por mes:")
+    for month, count in monthly_summary.items():
+        logger.info(f"  {month}: {count:,} transacciones")
+    
+    # Por categoría
+    category_summary = transactions_df['product_category'].value_counts()
+    logger.info(f"\n📦 Por categoría de producto:")
+    for category, count in category_summary.items():
+        percentage = (count / total_transactions) * 100
+        logger.info(f"  {category}: {count:,} ({percentage:.1f}%)")
+    
+    # Por negocio
+    business_summary = transactions_df['business_id'].value_counts().sort_index()
+    logger.info(f"\n🏢 Por negocio:")
+    for business_id, count in business_summary.items():
+        percentage = (count / total_transactions) * 100
+        logger.info(f"  Negocio {business_id}: {count:,} ({percentage:.1f}%)")
+
+def save_transactions_csv(transactions_df, updated_stock_df):
+    """
+    Guarda los archivos CSV de transacciones y stock actualizado
+    """
+    # Guardar transacciones
+    os.makedirs(raw_dir(), exist_ok=True)
+    transactions_filepath = os.path.join(raw_dir(), 'transactions.csv')
+    transactions_df.to_csv(transactions_filepath, index=False, encoding='utf-8')
+    logger.info(f"\n✅ Archivo transactions.csv guardado con {len(transactions_df)} transacciones")
+    
+    # Actualizar stock
+    stock_filepath = os.path.join(raw_dir(), 'warehouse_products.csv')
+    updated_stock_df.to_csv(stock_filepath, index=False, encoding='utf-8')
+    logger.info(f"✅ Archivo warehouse_products.csv actualizado con stock final")
+
+def save_transactions_csv_stream(transaction_stream):
+    """
+    Escribe un flujo de transacciones chunk por chunk y luego el stock actualizado
+    
+    Args:
+        transaction_stream (TransactionStream): Flujo creado con stream_transactions
+    
+    Returns:
+        int: Número de transacciones escritas
+    """
+    os.makedirs(raw_dir(), exist_ok=True)
+    transactions_filepath = os.path.join(raw_dir(), 'transactions.csv')
+    total_rows = 0
+    
+    # El primer chunk crea el archivo con encabezado; los siguientes se anexan
+    for chunk in transaction_stream:
+        chunk.to_csv(
+            transactions_filepath, index=False, encoding='utf-8',
+            mode='w' if total_rows == 0 else 'a', header=total_rows == 0
+        )
+        total_rows += len(chunk)
+    
+    if total_rows == 0:
+        pd.DataFrame(columns=TRANSACTION_COLUMNS).to_csv(transactions_filepath, index=False, encoding='utf-8')
+    logger.info(f"\n✅ Archivo transactions.csv guardado con {total_rows} transacciones")
+    
+    stock_filepath = os.path.join(raw_dir(), 'warehouse_products.csv')
+    transaction_stream.updated_stock.to_csv(stock_filepath, index=False, encoding='utf-8')
+    logger.info(f"✅ Archivo warehouse_products.csv actualizado con stock final")
+    
+    return total_rows
+
+if __name__ == "__main__":
+    configure_logging()
+    # Cargar datos base
+    try:
+        warehouse_products_df = load_table('warehouse_products')
+        users_df = load_table('users')
+        warehouses_df = load_table('warehouses')
+        products_df = load_table('products')
+        businesses_df = load_table('businesses')
+        
+        logger.info(f"📋 Datos cargados:")
+        logger.info(f"  - {len(warehouse_products_df)} registros de stock")
+        logger.info(f"  - {len(users_df)} usuarios")
+        logger.info(f"  - {len(warehouses_df)} almacenes")
+        logger.info(f"  - {len(products_df)} productos")
+        logger.info(f"  - {len(businesses_df)} negocios")
+        
+    except FileNotFoundError as e:
+        logger.error(f"❌ Error: {e}")
+        logger.info("Primero debe ejecutar los generadores previos (gestock generate)")
+        exit(1)
+    
+    # Generar transacciones
+    transactions_df, updated_stock_df = generate_transactions(
+        warehouse_products_df, users_df, warehouses_df, 
+        products_df, businesses_df, months_back=6, target_transactions=1800
+    )
+    
+    # Generar resumen
+    generate_transaction_summary(transactions_df)
+    
+    # Guardar archivos
+    save_transactions_csv(transactions_df, updated_stock_df)
\ No newline at end of file
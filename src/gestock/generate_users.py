@@ -3,22 +3,34 @@ Generador de datos mockeados para la tabla Users de GESTOCK
 Crea usuarios distribuidos entre negocios con roles y datos realistas
 """
 
+import logging
+import os
 import pandas as pd
-import random
-from datetime import datetime, timedelta
+from datetime import timedelta
 
-def generate_users(businesses_df, users_per_business_range=(2, 5)):
+from .config import raw_dir
+from .storage import load_table
+from .schema import apply_schema
+from .seeding import stream
+from .logs import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+def generate_users(businesses_df, users_per_business_range=(2, 5), seed=None):
     """
     Genera datos mockeados para usuarios basados en los negocios existentes
     
     Args:
         businesses_df (pandas.DataFrame): DataFrame con datos de negocios
         users_per_business_range (tuple): Rango de usuarios por negocio
+        seed (int): Semilla de la ejecución; el generador usa su propio flujo 'users'
     
     Returns:
         pandas.DataFrame: DataFrame con datos de usuarios
     """
     
+    rng = stream(seed, 'users')
+    
     # Nombres y apellidos realistas
     first_names = [
         "Carlos", "María", "Juan", "Ana", "Luis", "Carmen", "Roberto", "Patricia",
@@ -51,6 +63,9 @@ def generate_users(businesses_df, users_per_business_range=(2, 5)):
     users = []
     user_id = 1
     
+    # Emails usados en todos los negocios (la columna es única en la tabla)
+    used_emails = set()
+    
     for _, business in businesses_df.iterrows():
         business_id = business['id']
         business_size = business['size']
@@ -60,11 +75,11 @@ def generate_users(businesses_df, users_per_business_range=(2, 5)):
         min_users, max_users = users_per_business_range
         
         if business_size == 'Grande':
-            num_users = random.randint(max_users, max_users + 2)
+            num_users = int(rng.integers(max_users, max_users + 2, endpoint=True))
         elif business_size == 'Mediana':
-            num_users = random.randint(min_users + 1, max_users)
+            num_users = int(rng.integers(min_users + 1, max_users, endpoint=True))
         else:  # Pequeña
-            num_users = random.randint(min_users, min_users + 1)
+            num_users = int(rng.integers(min_users, min_users + 1, endpoint=True))
         
         # Asegurar al menos 1 ADMIN por negocio
         roles = ['ADMIN']
@@ -72,23 +87,21 @@ def generate_users(businesses_df, users_per_business_range=(2, 5)):
         
         # Distribuir roles restantes
         for _ in range(remaining_users):
-            if random.random() < role_distribution['ADMIN']:
+            if rng.random() < role_distribution['ADMIN']:
                 roles.append('ADMIN')
             else:
                 roles.append('USER')
         
         # Generar usuarios
-        used_emails = set()
-        
         for i in range(num_users):
             # Generar nombre completo
-            first_name = random.choice(first_names)
-            last_name = random.choice(last_names)
+            first_name = rng.choice(first_names)
+            last_name = rng.choice(last_names)
             full_name = f"{first_name} {last_name}"
             
             # Generar email único
             base_email = f"{first_name.lower()}.{last_name.lower()}"
-            domain = random.choice(email_domains)
+            domain = rng.choice(email_domains)
             email = f"{base_email}@{domain}"
             
             # Si el email ya existe, agregar número
@@ -104,18 +117,18 @@ def generate_users(businesses_df, users_per_business_range=(2, 5)):
             
             # Fecha de creación (después del negocio)
             business_created = pd.to_datetime(business['created_at'])
-            days_after_business = random.randint(1, 120)  # 1-4 meses después
+            days_after_business = int(rng.integers(1, 120, endpoint=True))  # 1-4 meses después
             created_at = business_created + timedelta(days=days_after_business)
             
             # Generar contraseña hasheada ficticia (simulando BCrypt)
             # En realidad sería hasheada, pero para datos mock usamos un patrón
-            password_hash = f"$2a$10${''.join(random.choices('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789./', k=53))}"
+            password_hash = f"$2a$10${''.join(rng.choice(list('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789./'), 53))}"
             
             # Estado del usuario
-            is_active = True if random.random() > 0.05 else False  # 95% activos
+            is_active = True if rng.random() > 0.05 else False  # 95% activos
             
             # Datos adicionales
-            phone_number = f"3{random.randint(10, 99)}{random.randint(1000000, 9999999)}"
+            phone_number = f"3{int(rng.integers(10, 99, endpoint=True))}{int(rng.integers(1000000, 9999999, endpoint=True))}"
             
             user = {
                 'id': user_id,
@@ -129,13 +142,13 @@ def generate_users(businesses_df, users_per_business_range=(2, 5)):
                 'is_active': is_active,
                 'phone_number': phone_number,
                 'created_at': created_at,
-                'last_login': created_at + timedelta(days=random.randint(0, 30)) if is_active else None
+                'last_login': created_at + timedelta(days=int(rng.integers(0, 30, endpoint=True))) if is_active else None
             }
             
             users.append(user)
             user_id += 1
     
-    return pd.DataFrame(users)
+    return apply_schema(pd.DataFrame(users), 'users')
 
 def save_users_csv(df, filename='users.csv'):
     """
@@ -145,33 +158,39 @@ def save_users_csv(df, filename='users.csv'):
         df (pandas.DataFrame): DataFrame con datos de usuarios
         filename (str): Nombre del archivo CSV
     """
-    filepath = f'../raw/{filename}'
+    os.makedirs(raw_dir(), exist_ok=True)
+    filepath = os.path.join(raw_dir(), filename)
     df.to_csv(filepath, index=False, encoding='utf-8')
-    print(f"✅ Archivo {filename} guardado con {len(df)} usuarios")
-    print(f"📊 Distribución por rol:")
-    print(df['role'].value_counts().to_string())
-    print(f"\n📊 Usuarios por negocio:")
+    logger.info(f"✅ Archivo {filename} guardado con {len(df)} usuarios")
+
+    # Las tablas de distribución solo se calculan si se van a mostrar
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(f"📊 Distribución por rol:")
+    logger.info("%s", df['role'].value_counts().to_string())
+    logger.info(f"\n📊 Usuarios por negocio:")
     users_per_business = df['business_id'].value_counts().sort_index()
-    print(users_per_business.to_string())
-    print(f"\n📊 Usuarios activos: {df['is_active'].sum()}/{len(df)} ({(df['is_active'].sum()/len(df)*100):.1f}%)")
+    logger.info("%s", users_per_business.to_string())
+    logger.info(f"\n📊 Usuarios activos: {df['is_active'].sum()}/{len(df)} ({(df['is_active'].sum()/len(df)*100):.1f}%)")
 
 if __name__ == "__main__":
+    configure_logging()
     # Cargar datos de negocios
     try:
-        businesses_df = pd.read_csv('../raw/businesses.csv')
-        print(f"📋 Cargados {len(businesses_df)} negocios")
+        businesses_df = load_table('businesses')
+        logger.info(f"📋 Cargados {len(businesses_df)} negocios")
     except FileNotFoundError:
-        print("❌ Error: Primero debe ejecutar generate_base_data.py")
+        logger.error("❌ Error: Primero debe ejecutar python -m gestock.generate_base_data")
         exit(1)
     
     # Generar datos
     users_df = generate_users(businesses_df)
     
     # Mostrar preview
-    print("\n👥 PREVIEW DE USUARIOS GENERADOS:")
-    print("="*50)
-    print(users_df[['email', 'full_name', 'business_id', 'role', 'is_active']].head(10))
-    print(f"\nTotal usuarios: {len(users_df)}")
+    logger.info("\n👥 PREVIEW DE USUARIOS GENERADOS:")
+    logger.info("="*50)
+    logger.info("%s", users_df[['email', 'full_name', 'business_id', 'role', 'is_active']].head(10))
+    logger.info(f"\nTotal usuarios: {len(users_df)}")
     
     # Guardar archivo
     save_users_csv(users_df)
\ No newline at end of file
@@ -0,0 +1,274 @@
+"""
+Generador de datos mockeados para la tabla WarehouseProducts de GESTOCK
+Asigna productos a almacenes con stock inicial realista
+"""
+
+import logging
+import os
+import pandas as pd
+import numpy as np
+
+from .config import raw_dir
+from .storage import load_table
+from .schema import apply_schema
+from .seeding import resolve_now, stream
+from .logs import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+# Parejas candidatas (almacén x producto) evaluadas por lote; acota la memoria
+# con catálogos grandes (ver scale_profiles)
+CANDIDATE_CHUNK_SIZE = 4_000_000
+
+def generate_warehouse_products(businesses_df, warehouses_df, products_df, seed=None, now=None,
+                                assortment_scale=1.0):
+    """
+    Genera datos mockeados para stock inicial de productos en almacenes
+    
+    Args:
+        businesses_df (pandas.DataFrame): DataFrame con datos de negocios
+        warehouses_df (pandas.DataFrame): DataFrame con datos de almacenes  
+        products_df (pandas.DataFrame): DataFrame con datos de productos
+        seed (int): Semilla de la ejecución; el generador usa su propio flujo 'warehouse_products'
+        now (datetime): Fecha de referencia para last_updated (ver seeding.resolve_now)
+        assortment_scale (float): Factor aplicado a la probabilidad de que un
+            almacén tenga cada producto; con catálogos más grandes mantiene el
+            número de productos por almacén (ver scale_profiles)
+    
+    Returns:
+        pandas.DataFrame: DataFrame con stock por almacén
+    """
+    
+    # Configuración de stock por tipo de negocio y categoría
+    stock_config = {
+        "Supermercado": {
+            "Alimentos": {"min_stock": 50, "max_stock": 500, "probability": 0.9},
+            "Hogar": {"min_stock": 20, "max_stock": 150, "probability": 0.8},
+            "Salud": {"min_stock": 10, "max_stock": 80, "probability": 0.6},
+            "Oficina": {"min_stock": 5, "max_stock": 50, "probability": 0.4},
+            "default": {"min_stock": 5, "max_stock": 30, "probability": 0.3}
+        },
+        "Farmacia": {
+            "Salud": {"min_stock": 30, "max_stock": 200, "probability": 0.95},
+            "Hogar": {"min_stock": 10, "max_stock": 80, "probability": 0.7},
+            "Alimentos": {"min_stock": 5, "max_stock": 40, "probability": 0.5},
+            "default": {"min_stock": 2, "max_stock": 20, "probability": 0.2}
+        },
+        "Ferretería": {
+            "Construcción": {"min_stock": 20, "max_stock": 300, "probability": 0.9},
+            "Hogar": {"min_stock": 15, "max_stock": 100, "probability": 0.8},
+            "Electrónicos": {"min_stock": 5, "max_stock": 50, "probability": 0.6},
+            "default": {"min_stock": 3, "max_stock": 25, "probability": 0.3}
+        },
+        "Librería": {
+            "Oficina": {"min_stock": 25, "max_stock": 200, "probability": 0.9},
+            "Electrónicos": {"min_stock": 5, "max_stock": 40, "probability": 0.6},
+            "default": {"min_stock": 3, "max_stock": 30, "probability": 0.4}
+        },
+        "Tienda de Electrónicos": {
+            "Electrónicos": {"min_stock": 10, "max_stock": 100, "probability": 0.95},
+            "Oficina": {"min_stock": 5, "max_stock": 60, "probability": 0.7},
+            "default": {"min_stock": 2, "max_stock": 20, "probability": 0.3}
+        },
+        "Boutique": {
+            "Ropa": {"min_stock": 15, "max_stock": 150, "probability": 0.9},
+            "default": {"min_stock": 2, "max_stock": 25, "probability": 0.2}
+        },
+        "Almacén Mayorista": {
+            "Alimentos": {"min_stock": 100, "max_stock": 1000, "probability": 0.8},
+            "Ropa": {"min_stock": 50, "max_stock": 500, "probability": 0.8},
+            "Electrónicos": {"min_stock": 30, "max_stock": 200, "probability": 0.7},
+            "Construcción": {"min_stock": 50, "max_stock": 800, "probability": 0.7},
+            "Hogar": {"min_stock": 40, "max_stock": 300, "probability": 0.7},
+            "default": {"min_stock": 20, "max_stock": 200, "probability": 0.6}
+        },
+        "Distribuidora": {
+            "Alimentos": {"min_stock": 200, "max_stock": 2000, "probability": 0.9},
+            "Ropa": {"min_stock": 100, "max_stock": 800, "probability": 0.8},
+            "Electrónicos": {"min_stock": 50, "max_stock": 400, "probability": 0.8},
+            "Construcción": {"min_stock": 80, "max_stock": 1200, "probability": 0.8},
+            "Hogar": {"min_stock": 60, "max_stock": 500, "probability": 0.7},
+            "Salud": {"min_stock": 40, "max_stock": 300, "probability": 0.7},
+            "default": {"min_stock": 30, "max_stock": 300, "probability": 0.6}
+        }
+    }
+    
+    # Tamaño de negocio -> multiplicadores de (min_stock, max_stock)
+    size_multipliers = {
+        'Grande': (1.5, 1.8),
+        'Pequeña': (0.6, 0.7)
+    }
+    
+    # Almacenes en el orden de los negocios, con tipo y tamaño de su negocio
+    business_order = pd.Series(np.arange(len(businesses_df)), index=businesses_df['id'])
+    warehouses = warehouses_df.assign(
+        _business_order=warehouses_df['business_id'].map(business_order)
+    ).dropna(subset=['_business_order'])
+    warehouses = warehouses.sort_values('_business_order', kind='stable')
+    warehouse_business = businesses_df.set_index('id').loc[warehouses['business_id']]
+    
+    # Matriz de configuración [tipo de negocio, categoría] -> min, max, probabilidad
+    business_type_codes, business_types = pd.factorize(warehouse_business['business_type'])
+    category_codes, categories = pd.factorize(products_df['category'])
+    config_min = np.empty((len(business_types), len(categories)))
+    config_max = np.empty_like(config_min)
+    config_probability = np.empty_like(config_min)
+    for type_code, business_type in enumerate(business_types):
+        business_stock_config = stock_config.get(business_type, {
+            "default": {"min_stock": 10, "max_stock": 100, "probability": 0.5}
+        })
+        for category_code, category in enumerate(categories):
+            category_config = business_stock_config.get(
+                category,
+                business_stock_config.get("default", {"min_stock": 5, "max_stock": 50, "probability": 0.3})
+            )
+            config_min[type_code, category_code] = category_config["min_stock"]
+            config_max[type_code, category_code] = category_config["max_stock"]
+            config_probability[type_code, category_code] = category_config["probability"]
+    
+    # Producto cruz almacén: una fila por almacén y una columna por producto,
+    # evaluado por lotes de almacenes. Los lotes consumen el flujo aleatorio en
+    # el mismo orden que una sola llamada, así que no cambian el resultado
+    num_warehouses = len(warehouses)
+    num_products = len(products_df)
+    config_probability = config_probability * assortment_scale
+    
+    # Decidir qué productos estarán en cada almacén
+    rng = stream(seed, 'warehouse_products')
+    chunk_warehouses = max(1, CANDIDATE_CHUNK_SIZE // max(1, num_products))
+    selected_pairs = []
+    for start in range(0, num_warehouses, chunk_warehouses):
+        chunk_types = business_type_codes[start:start + chunk_warehouses]
+        probability = config_probability[chunk_types[:, None], category_codes[None, :]]
+        selected = rng.random(probability.shape) <= probability
+        selected_pairs.append(np.flatnonzero(selected) + start * num_products)
+    selected_pairs = np.concatenate(selected_pairs) if selected_pairs else np.empty(0, dtype=np.int64)
+    warehouse_index = selected_pairs // num_products
+    product_index = selected_pairs % num_products
+    
+    # Ajustar stock según el tamaño del negocio
+    min_multiplier = warehouse_business['size'].astype(str).map(
+        {size: factors[0] for size, factors in size_multipliers.items()}
+    ).fillna(1.0).to_numpy()
+    max_multiplier = warehouse_business['size'].astype(str).map(
+        {size: factors[1] for size, factors in size_multipliers.items()}
+    ).fillna(1.0).to_numpy()
+    pair_type = business_type_codes[warehouse_index]
+    pair_category = category_codes[product_index]
+    min_stock = (config_min[pair_type, pair_category] * min_multiplier[warehouse_index]).astype(np.int64)
+    max_stock = (config_max[pair_type, pair_category] * max_multiplier[warehouse_index]).astype(np.int64)
+    
+    # Evitar stocks muy bajos
+    min_stock = np.maximum(1, min_stock)
+    max_stock = np.maximum(min_stock + 1, max_stock)
+    
+    initial_stock = rng.integers(min_stock, max_stock + 1)
+    days_since_update = rng.integers(1, 31, len(initial_stock))
+    
+    warehouse_products_df = pd.DataFrame({
+        'product_id': products_df['id'].to_numpy()[product_index],
+        'warehouse_id': warehouses['id'].to_numpy()[warehouse_index],
+        'stock': initial_stock,
+        'min_stock': np.maximum(1, min_stock // 4),  # Stock mínimo para alertas
+        'max_stock': max_stock,
+        'last_updated': resolve_now(now, seed) - pd.to_timedelta(days_since_update, unit='D')
+    })
+    
+    # Resumen de asignaciones por negocio y almacén (una línea por almacén: solo en debug)
+    if not logger.isEnabledFor(logging.DEBUG):
+        return apply_schema(warehouse_products_df, 'warehouse_products')
+    products_per_warehouse = np.bincount(warehouse_index, minlength=num_warehouses)
+    warehouses = warehouses.assign(_products=products_per_warehouse)
+    warehouses_by_business = dict(list(warehouses.groupby('business_id', sort=False)))
+    for _, business in businesses_df.iterrows():
+        business_warehouses = warehouses_by_business.get(business['id'], warehouses.iloc[:0])
+        logger.debug(f"📦 Procesando {business['name']} ({business['business_type']}) - {len(business_warehouses)} almacenes")
+        for warehouse_name, products_in_warehouse in zip(business_warehouses['name'], business_warehouses['_products']):
+            logger.debug(f"  └── {warehouse_name}: {products_in_warehouse} productos asignados")
+    
+    return apply_schema(warehouse_products_df, 'warehouse_products')
+
+def generate_stock_summary(warehouse_products_df, businesses_df, warehouses_df, products_df):
+    """
+    Genera un resumen del stock generado
+    """
+    logger.info(f"\n📊 RESUMEN DE STOCK GENERADO:")
+    logger.info("="*50)
+    
+    # Estadísticas generales
+    total_records = len(warehouse_products_df)
+    total_stock_units = warehouse_products_df['stock'].sum()
+    
+    logger.info(f"📦 Total registros de stock: {total_records:,}")
+    logger.info(f"📦 Total unidades en stock: {total_stock_units:,}")
+    logger.info(f"📦 Stock promedio por producto-almacén: {warehouse_products_df['stock'].mean():.1f}")
+    
+    # Stock por negocio
+    logger.info(f"\n🏢 Stock por negocio:")
+    
+    # Unir datos para obtener información del negocio
+    stock_with_warehouse = warehouse_products_df.merge(warehouses_df[['id', 'business_id']], 
+                                                       left_on='warehouse_id', right_on='id')
+    stock_by_business = stock_with_warehouse.groupby('business_id').agg({
+        'stock': ['sum', 'count', 'mean']
+    }).round(1)
+    
+    for business_id in sorted(stock_by_business.index):
+        business_name = businesses_df[businesses_df['id'] == business_id]['name'].iloc[0]
+        total_stock = stock_by_business.loc[business_id, ('stock', 'sum')]
+        product_count = stock_by_business.loc[business_id, ('stock', 'count')]
+        avg_stock = stock_by_business.loc[business_id, ('stock', 'mean')]
+        
+        logger.info(f"  {business_name}: {total_stock:,.0f} unidades ({product_count} productos, avg: {avg_stock:.1f})")
+    
+    # Stock por categoría
+    logger.info(f"\n📋 Stock por categoría de producto:")
+    
+    stock_with_product = warehouse_products_df.merge(products_df[['id', 'category']], 
+                                                    left_on='product_id', right_on='id')
+    stock_by_category = stock_with_product.groupby('category', observed=True)['stock'].agg(['sum', 'count', 'mean']).round(1)
+    
+    for category in stock_by_category.index:
+        total_stock = stock_by_category.loc[category, 'sum']
+        product_count = stock_by_category.loc[category, 'count']
+        avg_stock = stock_by_category.loc[category, 'mean']
+        
+        logger.info(f"  {category}: {total_stock:,.0f} unidades ({product_count} asignaciones, avg: {avg_stock:.1f})")
+
+def save_warehouse_products_csv(df, filename='warehouse_products.csv'):
+    """
+    Guarda el DataFrame de stock en un archivo CSV
+    """
+    os.makedirs(raw_dir(), exist_ok=True)
+    filepath = os.path.join(raw_dir(), filename)
+    df.to_csv(filepath, index=False, encoding='utf-8')
+    logger.info(f"\n✅ Archivo {filename} guardado con {len(df)} registros de stock")
+
+if __name__ == "__main__":
+    configure_logging()
+    # Cargar datos base
+    try:
+        businesses_df = load_table('businesses')
+        warehouses_df = load_table('warehouses')
+        products_df = load_table('products')
+        
+        logger.info(f"📋 Datos cargados:")
+        logger.info(f"  - {len(businesses_df)} negocios")
+        logger.info(f"  - {len(warehouses_df)} almacenes")
+        logger.info(f"  - {len(products_df)} productos")
+        
+    except FileNotFoundError as e:
+        logger.error(f"❌ Error: {e}")
+        logger.info("Primero debe ejecutar python -m gestock.generate_base_data")
+        exit(1)
+    
+    # Generar stock
+    warehouse_products_df = generate_warehouse_products(
+        businesses_df, warehouses_df, products_df
+    )
+    
+    # Generar resumen
+    generate_stock_summary(warehouse_products_df, businesses_df, warehouses_df, products_df)
+    
+    # Guardar archivo
+    save_warehouse_products_csv(warehouse_products_df)
\ No newline at end of file
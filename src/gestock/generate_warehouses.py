@@ -3,22 +3,34 @@ Generador de datos mockeados para la tabla Warehouses de GESTOCK
 Crea almacenes distribuidos entre negocios con ubicaciones realistas
 """
 
+import logging
+import os
 import pandas as pd
-import random
-from datetime import datetime, timedelta
+from datetime import timedelta
 
-def generate_warehouses(businesses_df, warehouses_per_business_range=(2, 4)):
+from .config import raw_dir
+from .storage import load_table
+from .schema import apply_schema
+from .seeding import stream
+from .logs import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+def generate_warehouses(businesses_df, warehouses_per_business_range=(2, 4), seed=None):
     """
     Genera datos mockeados para almacenes basados en los negocios existentes
     
     Args:
         businesses_df (pandas.DataFrame): DataFrame con datos de negocios
         warehouses_per_business_range (tuple): Rango de almacenes por negocio
+        seed (int): Semilla de la ejecución; el generador usa su propio flujo 'warehouses'
     
     Returns:
         pandas.DataFrame: DataFrame con datos de almacenes
     """
     
+    rng = stream(seed, 'warehouses')
+    
     # Tipos de almacenes según el tipo de negocio
     warehouse_types = {
         "Supermercado": ["Almacén Principal", "Bodega Refrigerados", "Depósito Secos"],
@@ -68,11 +80,11 @@ def generate_warehouses(businesses_df, warehouses_per_business_range=(2, 4)):
         
         # Negocios más grandes tienen más almacenes
         if business['size'] == 'Grande':
-            num_warehouses = random.randint(max_warehouses, max_warehouses + 1)
+            num_warehouses = int(rng.integers(max_warehouses, max_warehouses + 1, endpoint=True))
         elif business['size'] == 'Mediana':
-            num_warehouses = random.randint(min_warehouses + 1, max_warehouses)
+            num_warehouses = int(rng.integers(min_warehouses + 1, max_warehouses, endpoint=True))
         else:  # Pequeña
-            num_warehouses = random.randint(min_warehouses, min_warehouses + 1)
+            num_warehouses = int(rng.integers(min_warehouses, min_warehouses + 1, endpoint=True))
         
         # Obtener tipos de almacenes disponibles
         available_types = warehouse_types.get(business_type, ["Almacén Principal", "Bodega General"])
@@ -87,12 +99,12 @@ def generate_warehouses(businesses_df, warehouses_per_business_range=(2, 4)):
             
             # Generar dirección
             address_formats = address_patterns.get(city, ["Carrera {0} #{1}-{2}"])
-            address_format = random.choice(address_formats)
+            address_format = rng.choice(address_formats)
             
             # Números realistas para direcciones colombianas
-            carrera_calle = random.randint(1, 80)
-            numero1 = random.randint(10, 150)
-            numero2 = random.randint(10, 99)
+            carrera_calle = int(rng.integers(1, 80, endpoint=True))
+            numero1 = int(rng.integers(10, 150, endpoint=True))
+            numero2 = int(rng.integers(10, 99, endpoint=True))
             address = address_format.format(carrera_calle, numero1, numero2)
             
             # Agregar barrio/sector
@@ -107,11 +119,11 @@ def generate_warehouses(businesses_df, warehouses_per_business_range=(2, 4)):
                 "Manizales": ["La Sultana", "Versalles", "Palogrande", "Centro", "Milán"]
             }
             
-            barrio = random.choice(barrios.get(city, ["Centro", "Norte", "Sur"]))
+            barrio = rng.choice(barrios.get(city, ["Centro", "Norte", "Sur"]))
             full_address = f"{address}, {barrio}, {city}"
             
             # Generar otros datos
-            capacity = random.randint(capacity_min, capacity_max)
+            capacity = int(rng.integers(capacity_min, capacity_max, endpoint=True))
             
             # Gerentes/responsables ficticios
             managers = [
@@ -127,7 +139,7 @@ def generate_warehouses(businesses_df, warehouses_per_business_range=(2, 4)):
             }
             
             base_cost = cost_per_m2.get(city, 18000)
-            operational_cost = capacity * base_cost + random.randint(-500000, 1000000)
+            operational_cost = capacity * base_cost + int(rng.integers(-500000, 1000000, endpoint=True))
             
             warehouse = {
                 'id': warehouse_id,
@@ -135,16 +147,16 @@ def generate_warehouses(businesses_df, warehouses_per_business_range=(2, 4)):
                 'address': full_address,
                 'business_id': business_id,
                 'capacity': capacity,
-                'location_type': "Urbano" if random.random() > 0.15 else "Industrial",
-                'manager_name': random.choice(managers),
+                'location_type': "Urbano" if rng.random() > 0.15 else "Industrial",
+                'manager_name': rng.choice(managers),
                 'operational_cost': operational_cost,
-                'created_at': business['created_at'] + timedelta(days=random.randint(1, 90))
+                'created_at': business['created_at'] + timedelta(days=int(rng.integers(1, 90, endpoint=True)))
             }
             
             warehouses.append(warehouse)
             warehouse_id += 1
     
-    return pd.DataFrame(warehouses)
+    return apply_schema(pd.DataFrame(warehouses), 'warehouses')
 
 def save_warehouses_csv(df, filename='warehouses.csv'):
     """
@@ -154,34 +166,40 @@ def save_warehouses_csv(df, filename='warehouses.csv'):
         df (pandas.DataFrame): DataFrame con datos de almacenes
         filename (str): Nombre del archivo CSV
     """
-    filepath = f'../raw/{filename}'
+    os.makedirs(raw_dir(), exist_ok=True)
+    filepath = os.path.join(raw_dir(), filename)
     df.to_csv(filepath, index=False, encoding='utf-8')
-    print(f"✅ Archivo {filename} guardado con {len(df)} almacenes")
-    print(f"📊 Distribución por tipo de ubicación:")
-    print(df['location_type'].value_counts().to_string())
-    print(f"\n📊 Almacenes por negocio:")
-    print(df['business_id'].value_counts().sort_index().to_string())
-    print(f"\n📊 Capacidad promedio por tipo de ubicación:")
-    capacity_stats = df.groupby('location_type')['capacity'].agg(['count', 'mean', 'min', 'max']).round(0)
-    print(capacity_stats.to_string())
+    logger.info(f"✅ Archivo {filename} guardado con {len(df)} almacenes")
+
+    # Las tablas de distribución solo se calculan si se van a mostrar
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(f"📊 Distribución por tipo de ubicación:")
+    logger.info("%s", df['location_type'].value_counts().to_string())
+    logger.info(f"\n📊 Almacenes por negocio:")
+    logger.info("%s", df['business_id'].value_counts().sort_index().to_string())
+    logger.info(f"\n📊 Capacidad promedio por tipo de ubicación:")
+    capacity_stats = df.groupby('location_type', observed=True)['capacity'].agg(['count', 'mean', 'min', 'max']).round(0)
+    logger.info("%s", capacity_stats.to_string())
 
 if __name__ == "__main__":
+    configure_logging()
     # Cargar datos de negocios (debe existir)
     try:
-        businesses_df = pd.read_csv('../raw/businesses.csv')
-        print(f"📋 Cargados {len(businesses_df)} negocios")
+        businesses_df = load_table('businesses')
+        logger.info(f"📋 Cargados {len(businesses_df)} negocios")
     except FileNotFoundError:
-        print("❌ Error: Primero debe ejecutar generate_businesses.py")
+        logger.error("❌ Error: Primero debe ejecutar python -m gestock.generate_businesses")
         exit(1)
     
     # Generar datos
     warehouses_df = generate_warehouses(businesses_df)
     
     # Mostrar preview
-    print("\n🏭 PREVIEW DE ALMACENES GENERADOS:")
-    print("="*50)
-    print(warehouses_df.head(10))
-    print(f"\nTotal almacenes: {len(warehouses_df)}")
+    logger.info("\n🏭 PREVIEW DE ALMACENES GENERADOS:")
+    logger.info("="*50)
+    logger.info("%s", warehouses_df.head(10))
+    logger.info(f"\nTotal almacenes: {len(warehouses_df)}")
     
     # Guardar archivo
     save_warehouses_csv(warehouses_df)
\ No newline at end of file
@@ -0,0 +1,302 @@
+"""
+Instrumentación de las etapas de GESTOCK
+Tiempos, contadores y memoria por etapa y por día simulado, emitidos
+como eventos estructurados a sumideros intercambiables (JSON lines, memoria)
+
+Sin sumideros configurados la instrumentación no hace nada. En producción se
+activa sin tocar el código con variables de entorno, que se leen en el primer
+uso (no al importar el módulo):
+    GESTOCK_EVENTS=eventos.jsonl        Archivo JSON lines de eventos
+    GESTOCK_PROFILE=cprofile            Perfilado de las etapas ('cprofile' o 'tracemalloc')
+    GESTOCK_PROFILE_DIR=perfiles/       Directorio de los archivos .prof
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from .logs import get_logger
+
+logger = get_logger(__name__)
+
+# Modos de perfilado de las etapas de primer nivel
+PROFILE_MODES = ('cprofile', 'tracemalloc')
+
+# Entradas de los informes de perfilado (funciones o líneas con más costo)
+PROFILE_TOP = 15
+
+
+class MemorySink:
+    """
+    Sumidero que guarda los eventos en memoria (pruebas, notebooks, benchmarks)
+
+    Solo recibe los eventos del proceso actual: los procesos de la generación
+    en paralelo tienen su propia copia.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def write(self, event):
+        self.events.append(event)
+
+    def of_type(self, event_type):
+        """Eventos de un tipo ('stage', 'sample', 'profile', ...)"""
+        return [event for event in self.events if event['event'] == event_type]
+
+
+class JsonLinesSink:
+    """
+    Sumidero que agrega cada evento como una línea JSON a un archivo
+
+    El archivo se abre en modo append en cada escritura, así que varios
+    procesos (p. ej. los de la generación en paralelo) pueden compartirlo.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, event):
+        line = json.dumps(event, ensure_ascii=False, default=str)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+
+
+class _Stage:
+    """
+    Etapa en curso: contadores que se suman a la etapa que la contiene
+    """
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+        self.counters = {}
+
+    def count(self, counter, value=1):
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+
+class _NullStage:
+    """Etapa sin efecto cuando la instrumentación está desactivada"""
+
+    def count(self, counter, value=1):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+# Configuración del proceso y pila de etapas en curso
+_sinks = []
+_profile = None
+_profile_dir = None
+_stack = []
+_configured = False
+
+def configure(sinks=(), profile=None, profile_dir=None):
+    """
+    Reemplaza la configuración de la instrumentación
+
+    Args:
+        sinks (iterable): Objetos con un método write(evento)
+        profile (str): None, 'cprofile' o 'tracemalloc'; perfila las etapas de
+            primer nivel (las anidadas se miden pero no se perfilan)
+        profile_dir (str): Directorio de los .prof de cProfile (por defecto,
+            no se guardan: solo se emite el resumen)
+
+    Raises:
+        ValueError: Si el modo de perfilado no es válido
+    """
+    global _sinks, _profile, _profile_dir, _configured
+    if profile is not None and profile not in PROFILE_MODES:
+        raise ValueError(f"Modo de perfilado desconocido: {profile}")
+    _sinks = list(sinks)
+    _profile = profile
+    _profile_dir = profile_dir
+    _configured = True
+
+def configure_from_env(environ=None):
+    """
+    Configura la instrumentación con GESTOCK_EVENTS, GESTOCK_PROFILE y GESTOCK_PROFILE_DIR
+
+    Un GESTOCK_PROFILE desconocido se ignora con una advertencia: una variable
+    de entorno mal escrita no debe impedir la generación.
+    """
+    environ = os.environ if environ is None else environ
+    events_path = environ.get('GESTOCK_EVENTS')
+    profile = environ.get('GESTOCK_PROFILE') or None
+    if profile is not None and profile not in PROFILE_MODES:
+        logger.warning(f"⚠️ GESTOCK_PROFILE={profile} no es válido ({', '.join(PROFILE_MODES)}); "
+                       f"se continúa sin perfilado")
+        profile = None
+    configure(
+        sinks=[JsonLinesSink(events_path)] if events_path else [],
+        profile=profile,
+        profile_dir=environ.get('GESTOCK_PROFILE_DIR') or None
+    )
+
+def _ensure_configured():
+    """
+    Lee la configuración del entorno si aún no se configuró el proceso
+    """
+    if not _configured:
+        configure_from_env()
+
+def enabled():
+    """True si hay algún sumidero configurado"""
+    _ensure_configured()
+    return bool(_sinks)
+
+def emit(event_type, **fields):
+    """
+    Emite un evento a todos los sumideros
+
+    Cada evento lleva su tipo, la marca de tiempo, el pid del proceso y la
+    etapa en curso ('parent'), además de los campos indicados.
+    """
+    _ensure_configured()
+    if not _sinks:
+        return
+    event = {
+        'event': event_type,
+        'ts': time.time(),
+        'pid': os.getpid(),
+        'parent': _stack[-1].name if _stack else None
+    }
+    event.update(fields)
+    for sink in _sinks:
+        sink.write(event)
+
+def process_peak_rss():
+    """
+    Memoria residente máxima del proceso desde que empezó, en bytes (None si
+    no se puede medir). Es una marca histórica del proceso, no de la etapa
+    """
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa kilobytes; macOS, bytes
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+@contextlib.contextmanager
+def stage(name, **fields):
+    """
+    Mide una etapa: tiempo, memoria máxima y contadores
+
+    Al terminar emite un evento 'stage' con 'seconds',
+    'process_peak_rss_bytes' (máximo del proceso hasta el final de la etapa),
+    'peak_rss_growth_bytes' (cuánto subió ese máximo durante la etapa; 0 si
+    no superó a las anteriores), 'counters' y los campos indicados, y suma sus contadores a la etapa que la
+    contiene. Las etapas de primer nivel se perfilan si así se configuró.
+
+    Args:
+        name (str): Nombre de la etapa (p. ej. 'transactions' o 'transactions.shard')
+        **fields: Campos adicionales del evento
+
+    Yields:
+        objeto con count(contador, valor=1) para acumular contadores
+    """
+    _ensure_configured()
+    if not _sinks:
+        yield _NULL_STAGE
+        return
+
+    current = _Stage(name, fields)
+    profiler = _start_profiler() if not _stack and _profile else None
+    _stack.append(current)
+    peak_before = process_peak_rss()
+    started = time.perf_counter()
+    try:
+        yield current
+    finally:
+        seconds = time.perf_counter() - started
+        _stack.pop()
+        if _stack:
+            for counter, value in current.counters.items():
+                _stack[-1].count(counter, value)
+        if profiler is not None:
+            _stop_profiler(name, profiler)
+        peak_after = process_peak_rss()
+        emit('stage', stage=name, seconds=seconds, process_peak_rss_bytes=peak_after,
+             peak_rss_growth_bytes=None if peak_after is None else peak_after - peak_before,
+             counters=current.counters, **fields)
+
+def count(counter, value=1):
+    """
+    Suma a un contador de la etapa en curso (sin efecto fuera de una etapa)
+    """
+    if _stack:
+        _stack[-1].count(counter, value)
+
+def sample(name, started, counters, **fields):
+    """
+    Registra una medición puntual dentro de una etapa (p. ej. un día simulado)
+
+    Emite un evento 'sample' con la duración desde `started`
+    (time.perf_counter()), los contadores y la memoria máxima del proceso
+    ('process_peak_rss_bytes'), y suma los contadores a la etapa en curso. Es
+    más barato que stage() para mediciones muy frecuentes.
+    """
+    _ensure_configured()
+    if not _sinks:
+        return
+    for counter, value in counters.items():
+        count(counter, value)
+    emit('sample', sample=name, seconds=time.perf_counter() - started,
+         process_peak_rss_bytes=process_peak_rss(), counters=dict(counters), **fields)
+
+def _start_profiler():
+    if _profile == 'cprofile':
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    return started_tracing
+
+def _stop_profiler(name, profiler):
+    """
+    Detiene el perfilado de una etapa y emite un evento 'profile' con su resumen
+    """
+    if _profile == 'cprofile':
+        profiler.disable()
+        path = None
+        if _profile_dir:
+            os.makedirs(_profile_dir, exist_ok=True)
+            path = os.path.join(_profile_dir, f"{name}-{os.getpid()}.prof")
+            profiler.dump_stats(path)
+        stats = pstats.Stats(profiler, stream=io.StringIO())
+        top = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:PROFILE_TOP]
+        emit('profile', stage=name, mode='cprofile', path=path, top=[
+            {
+                'function': f"{filename}:{line}({function})",
+                'calls': calls,
+                'total_seconds': total,
+                'cumulative_seconds': cumulative
+            }
+            for (filename, line, function), (_, calls, total, cumulative, _) in top
+        ])
+        return
+
+    peak = tracemalloc.get_traced_memory()[1]
+    statistics = tracemalloc.take_snapshot().statistics('lineno')[:PROFILE_TOP]
+    if profiler:
+        tracemalloc.stop()
+    emit('profile', stage=name, mode='tracemalloc', peak_traced_bytes=peak, top=[
+        {'line': str(stat.traceback), 'size_bytes': stat.size, 'count': stat.count}
+        for stat in statistics
+    ])
@@ -0,0 +1,169 @@
+"""
+Salida de consola de GESTOCK a través de logging
+Los generadores registran sus mensajes en el logger 'gestock'. Usados como
+biblioteca no escriben nada (el logger solo tiene un NullHandler); los scripts
+llaman a configure_logging para mostrar los mensajes con el nivel elegido
+
+El nivel por defecto de los scripts se cambia sin tocar el código con:
+    GESTOCK_LOG_LEVEL=warning           'debug', 'info', 'warning', 'error' o 'quiet'
+    GESTOCK_LOG_FORMAT=json             'text' o 'json'
+"""
+
+import contextlib
+import io
+import json
+import logging
+import os
+import sys
+
+LOGGER_NAME = 'gestock'
+
+# Niveles aceptados por configure_logging; 'quiet' no muestra nada
+LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'quiet': logging.CRITICAL + 1
+}
+
+logging.getLogger(LOGGER_NAME).addHandler(logging.NullHandler())
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatea cada registro como una línea JSON (registros de procesos por lotes)
+    """
+
+    def format(self, record):
+        event = {
+            'ts': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage().strip()
+        }
+        if record.exc_info:
+            event['exception'] = self.formatException(record.exc_info)
+        return json.dumps(event, ensure_ascii=False)
+
+
+def get_logger(name):
+    """
+    Logger de un módulo, hijo de 'gestock'
+
+    Args:
+        name (str): Nombre del módulo (__name__); los nombres que ya están bajo
+            'gestock' (los módulos del paquete) se usan tal cual
+
+    Returns:
+        logging.Logger: Logger 'gestock.<name>'
+    """
+    if name == LOGGER_NAME or name.startswith(f"{LOGGER_NAME}."):
+        return logging.getLogger(name)
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+def configure_logging(level=None, fmt=None, stream=None):
+    """
+    Muestra los mensajes de GESTOCK en consola (scripts y CLI)
+
+    Reemplaza el handler instalado por una llamada anterior. Los mensajes no se
+    propagan al logger raíz para no duplicarse.
+
+    Args:
+        level (str): 'debug', 'info', 'warning', 'error' o 'quiet' (por
+            defecto, GESTOCK_LOG_LEVEL o 'info')
+        fmt (str): 'text' (solo el mensaje, como la salida original) o 'json'
+            (por defecto, GESTOCK_LOG_FORMAT o 'text')
+        stream: Destino (por defecto, sys.stdout)
+
+    Raises:
+        ValueError: Si el nivel o el formato no son válidos
+    """
+    level = level or os.environ.get('GESTOCK_LOG_LEVEL') or 'info'
+    fmt = fmt or os.environ.get('GESTOCK_LOG_FORMAT') or 'text'
+    if level not in LEVELS:
+        raise ValueError(f"Nivel de log desconocido: {level}")
+    if fmt not in ('text', 'json'):
+        raise ValueError(f"Formato de log desconocido: {fmt}")
+
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        if getattr(handler, '_gestock_console', False):
+            logger.removeHandler(handler)
+
+    logger.setLevel(LEVELS[level])
+    logger.propagate = False
+    if level == 'quiet':
+        return
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter() if fmt == 'json' else logging.Formatter('%(message)s'))
+    handler._gestock_console = True
+    logger.addHandler(handler)
+
+def add_logging_arguments(parser):
+    """
+    Agrega --log-level, --log-format y --quiet a un argparse.ArgumentParser
+    """
+    parser.add_argument('--log-level', choices=[level for level in LEVELS if level != 'quiet'],
+                        help="Nivel de los mensajes en consola (por defecto, info)")
+    parser.add_argument('--log-format', choices=['text', 'json'],
+                        help="Formato de los mensajes en consola")
+    parser.add_argument('--quiet', action='store_true',
+                        help="No mostrar mensajes en consola")
+
+def configure_logging_from_args(args):
+    """
+    Configura la salida con las opciones de add_logging_arguments
+    """
+    configure_logging('quiet' if args.quiet else args.log_level, args.log_format)
+
+@contextlib.contextmanager
+def silenced(name=LOGGER_NAME):
+    """
+    Descarta los mensajes de un logger (y de sus hijos) dentro del bloque
+
+    Args:
+        name (str): Nombre completo del logger (por defecto, todo GESTOCK)
+    """
+    logger = logging.getLogger(name)
+    previous = logger.level
+    logger.setLevel(LEVELS['quiet'])
+    try:
+        yield
+    finally:
+        logger.setLevel(previous)
+
+@contextlib.contextmanager
+def capture_logs(level=logging.INFO):
+    """
+    Captura como texto los mensajes de GESTOCK emitidos dentro del bloque
+
+    La captura no depende del nivel de consola: los handlers existentes siguen
+    mostrando solo lo que mostraban.
+
+    Yields:
+        io.StringIO: Texto capturado, un mensaje por línea
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    previous_level, previous_propagate = logger.level, logger.propagate
+    effective = logger.getEffectiveLevel()
+    handler_levels = [(handler, handler.level) for handler in logger.handlers]
+    for handler, handler_level in handler_levels:
+        handler.setLevel(max(handler_level, effective))
+
+    buffer = io.StringIO()
+    capture = logging.StreamHandler(buffer)
+    capture.setFormatter(logging.Formatter('%(message)s'))
+    capture.setLevel(level)
+    logger.addHandler(capture)
+    logger.setLevel(min(level, effective))
+    logger.propagate = False
+    try:
+        yield buffer
+    finally:
+        logger.removeHandler(capture)
+        logger.setLevel(previous_level)
+        logger.propagate = previous_propagate
+        for handler, handler_level in handler_levels:
+            handler.setLevel(handler_level)
@@ -0,0 +1,363 @@
+"""
+Cubo diario de movimientos de stock de GESTOCK
+Agrega las transacciones por día, almacén y producto (cantidades y número de
+ENTRADAs y SALIDAs) y deriva de ese cubo los resúmenes por negocio, categoría
+y mes, para que reportes y dashboards no recorran la historia completa
+
+Uso:
+    gestock cube                  # reconstruye el cubo desde las tablas de raw/
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from .config import FORMATS, processed_dir
+from .dimension_lookups import _dense_index
+from .logs import add_logging_arguments, configure_logging_from_args, get_logger
+from .schema import apply_schema
+from .storage import load_table, save_table
+
+logger = get_logger(__name__)
+
+CUBE_TABLE = 'movement_cube'
+
+# Clave del cubo y medidas (sumables) de cada celda
+CUBE_KEYS = ['date', 'warehouse_id', 'product_id']
+MEASURES = ['entrada_quantity', 'salida_quantity', 'entrada_count', 'salida_count']
+
+# Columnas de transactions que necesita el cubo (presentes también en la tabla normalizada)
+TRANSACTION_COLUMNS = ['type', 'quantity', 'created_at', 'warehouse_id', 'product_id']
+
+# Resúmenes materializados junto al cubo: tabla -> (grano temporal, dimensiones)
+ROLLUPS = {
+    'movement_daily_business': ('date', ['business_id']),
+    'movement_monthly': ('month', ['business_id', 'category']),
+    'movement_by_product': (None, ['product_id']),
+    'movement_by_warehouse': (None, ['warehouse_id']),
+    'movement_by_business': (None, ['business_id'])
+}
+
+# Stock al cierre de cada día con movimientos (ver build_stock_eod)
+STOCK_EOD_TABLE = 'stock_eod'
+
+# Vector completo de stock al comienzo de cada lunes (ver build_stock_checkpoints)
+CHECKPOINT_TABLE = 'stock_checkpoints'
+CHECKPOINT_FREQ = 'W-MON'
+
+# Dimensiones que admite rollup (business_id y category se resuelven con las dimensiones)
+DIMENSIONS = ('warehouse_id', 'product_id', 'business_id', 'category')
+
+def build_movement_cube(transactions_df):
+    """
+    Agrega las transacciones por día, almacén y producto
+
+    Args:
+        transactions_df (pandas.DataFrame): Transacciones (al menos TRANSACTION_COLUMNS)
+
+    Returns:
+        pandas.DataFrame: Una fila por (date, warehouse_id, product_id) con
+            movimientos, ordenada por esa clave
+    """
+    is_entrada = (transactions_df['type'] == 'ENTRADA').to_numpy()
+    quantity = transactions_df['quantity'].to_numpy(dtype=np.int64)
+    cells = pd.DataFrame({
+        'date': transactions_df['created_at'].dt.floor('D'),
+        'warehouse_id': transactions_df['warehouse_id'].to_numpy(),
+        'product_id': transactions_df['product_id'].to_numpy(),
+        'entrada_quantity': np.where(is_entrada, quantity, 0),
+        'salida_quantity': np.where(is_entrada, 0, quantity),
+        'entrada_count': is_entrada.astype(np.int64),
+        'salida_count': (~is_entrada).astype(np.int64)
+    })
+    cube = cells.groupby(CUBE_KEYS, sort=True).sum().reset_index()
+    return apply_schema(cube, CUBE_TABLE)
+
+def rollup(cube_df, dimensions=(), grain=None, warehouses_df=None, products_df=None):
+    """
+    Resume el cubo a un grano más grueso
+
+    Args:
+        cube_df (pandas.DataFrame): Cubo (ver build_movement_cube) o un
+            resumen que conserve warehouse_id/product_id si se piden
+        dimensions (iterable): Subconjunto de DIMENSIONS
+        grain (str): None (total del período), 'date' o 'month'
+        warehouses_df (pandas.DataFrame): Almacenes; necesario para 'business_id'
+        products_df (pandas.DataFrame): Productos; necesario para 'category'
+
+    Returns:
+        pandas.DataFrame: Medidas (int64) sumadas por grano y dimensiones,
+            ordenadas por esa clave
+
+    Raises:
+        ValueError: Si una dimensión o el grano no son válidos
+    """
+    keys = {}
+    if grain == 'date':
+        keys['date'] = cube_df['date'].to_numpy()
+    elif grain == 'month':
+        keys['month'] = cube_df['date'].to_numpy().astype('datetime64[M]').astype('datetime64[s]')
+    elif grain is not None:
+        raise ValueError(f"Grano desconocido: {grain}")
+
+    for dimension in dimensions:
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Dimensión desconocida: {dimension}")
+        if dimension == 'business_id':
+            warehouse_business = _dense_index(
+                warehouses_df['id'].to_numpy(dtype=np.int64),
+                warehouses_df['business_id'].to_numpy(dtype=np.int64)
+            )
+            keys['business_id'] = warehouse_business[cube_df['warehouse_id'].to_numpy(dtype=np.int64)]
+        elif dimension == 'category':
+            category_codes, categories = pd.factorize(products_df['category'], sort=True)
+            product_category = _dense_index(products_df['id'].to_numpy(dtype=np.int64), category_codes)
+            keys['category'] = pd.Categorical.from_codes(
+                product_category[cube_df['product_id'].to_numpy(dtype=np.int64)], categories
+            )
+        else:
+            keys[dimension] = cube_df[dimension].to_numpy()
+
+    measures = {measure: cube_df[measure].to_numpy(dtype=np.int64) for measure in MEASURES}
+    if not keys:
+        return pd.DataFrame({measure: [values.sum()] for measure, values in measures.items()})
+
+    frame = pd.DataFrame({**keys, **measures})
+    return frame.groupby(list(keys), sort=True, observed=True).sum().reset_index()
+
+def build_stock_eod(cube_df, final_stock_df):
+    """
+    Calcula el stock al cierre de cada día con movimientos
+
+    El stock inicial de cada pareja (almacén, producto) es su stock final menos
+    el movimiento neto del cubo; a partir de ahí se acumula el neto diario con
+    una suma por segmentos sobre el cubo ordenado por pareja y fecha.
+
+    Args:
+        cube_df (pandas.DataFrame): Cubo (ver build_movement_cube)
+        final_stock_df (pandas.DataFrame): warehouse_products con el stock
+            después del último movimiento del cubo
+
+    Returns:
+        pandas.DataFrame: Una fila por celda del cubo con el stock al cierre
+            del día, ordenada por CUBE_KEYS
+
+    Raises:
+        ValueError: Si el cubo tiene parejas que no están en final_stock_df
+    """
+    warehouse_ids = cube_df['warehouse_id'].to_numpy(dtype=np.int64)
+    product_ids = cube_df['product_id'].to_numpy(dtype=np.int64)
+    order = np.lexsort((cube_df['date'].to_numpy(), product_ids, warehouse_ids))
+    warehouse_ids = warehouse_ids[order]
+    product_ids = product_ids[order]
+    net = (cube_df['entrada_quantity'].to_numpy(dtype=np.int64)
+           - cube_df['salida_quantity'].to_numpy(dtype=np.int64))[order]
+
+    # Suma acumulada del neto reiniciada al comienzo de cada pareja
+    pair_start = np.ones(len(order), dtype=bool)
+    pair_start[1:] = (warehouse_ids[1:] != warehouse_ids[:-1]) | (product_ids[1:] != product_ids[:-1])
+    pair_index = np.cumsum(pair_start) - 1
+    cumulative = np.cumsum(net)
+    running = cumulative - (cumulative - net)[pair_start][pair_index]
+    pair_net = np.add.reduceat(net, np.flatnonzero(pair_start)) if len(net) else net
+
+    # Stock final de cada pareja con una clave entera ordenada (almacén, producto)
+    key_width = int(max(product_ids.max(initial=0), final_stock_df['product_id'].max()) + 1)
+    stock_keys = (final_stock_df['warehouse_id'].to_numpy(dtype=np.int64) * key_width
+                  + final_stock_df['product_id'].to_numpy(dtype=np.int64))
+    stock_order = np.argsort(stock_keys)
+    stock_keys = stock_keys[stock_order]
+    pair_keys = (warehouse_ids * key_width + product_ids)[pair_start]
+    positions = np.minimum(np.searchsorted(stock_keys, pair_keys), max(len(stock_keys) - 1, 0))
+    if len(pair_keys) and (len(stock_keys) == 0 or (stock_keys[positions] != pair_keys).any()):
+        raise ValueError("El cubo tiene parejas (almacén, producto) sin stock final")
+    final_stock = final_stock_df['stock'].to_numpy(dtype=np.int64)[stock_order][positions]
+    opening_stock = final_stock - pair_net
+
+    stock_eod = pd.DataFrame({
+        'date': cube_df['date'].to_numpy()[order],
+        'warehouse_id': warehouse_ids,
+        'product_id': product_ids,
+        'stock': opening_stock[pair_index] + running
+    })
+    stock_eod = stock_eod.sort_values(CUBE_KEYS, kind='stable', ignore_index=True)
+    return apply_schema(stock_eod, STOCK_EOD_TABLE)
+
+def checkpoint_dates(first_date, last_date):
+    """
+    Fechas de checkpoint que cubren los movimientos de first_date a last_date
+
+    Van del lunes anterior (o igual) a first_date al lunes anterior (o igual)
+    al día siguiente a last_date, así que todo día con movimientos tiene un
+    checkpoint como mucho seis días antes.
+
+    Returns:
+        pandas.DatetimeIndex: Lunes a medianoche, en orden
+    """
+    offset = pd.tseries.frequencies.to_offset(CHECKPOINT_FREQ)
+    first = offset.rollback(pd.Timestamp(first_date).normalize())
+    last = offset.rollback(pd.Timestamp(last_date).normalize() + pd.Timedelta(days=1))
+    return pd.date_range(first, last, freq=CHECKPOINT_FREQ)
+
+def build_stock_checkpoints(cube_df, final_stock_df, first_checkpoint=None):
+    """
+    Calcula el stock de todas las parejas (almacén, producto) al comienzo de
+    cada fecha de checkpoint_dates
+
+    Junto con el cubo (el movimiento neto de cada pareja por día) forma un
+    índice para consultar el stock a cualquier fecha: el checkpoint anterior
+    más los movimientos de, como mucho, seis días (ver stock_snapshots).
+
+    Args:
+        cube_df (pandas.DataFrame): Cubo (ver build_movement_cube)
+        final_stock_df (pandas.DataFrame): warehouse_products con el stock
+            después del último movimiento del cubo
+        first_checkpoint: Primer checkpoint a calcular en lugar del lunes del
+            primer día del cubo; puede ser anterior a ese día si no hubo
+            movimientos desde el último checkpoint guardado (los checkpoints
+            previos al cubo llevan el stock inicial)
+
+    Returns:
+        pandas.DataFrame: Una fila por checkpoint y pareja de final_stock_df,
+            ordenada por (checkpoint_date, warehouse_id, product_id)
+
+    Raises:
+        ValueError: Si el cubo tiene parejas que no están en final_stock_df
+    """
+    stock_df = final_stock_df.sort_values(['warehouse_id', 'product_id'], kind='stable')
+    pair_warehouses = stock_df['warehouse_id'].to_numpy(dtype=np.int64)
+    pair_products = stock_df['product_id'].to_numpy(dtype=np.int64)
+    product_ids = cube_df['product_id'].to_numpy(dtype=np.int64)
+    key_width = int(max(product_ids.max(initial=0), pair_products.max(initial=0)) + 1)
+    pair_keys = pair_warehouses * key_width + pair_products
+
+    # Celdas del cubo por fecha, con la posición de su pareja en el vector de stock
+    dates = cube_df['date'].to_numpy()
+    order = np.argsort(dates, kind='stable')
+    dates = dates[order]
+    cell_keys = (cube_df['warehouse_id'].to_numpy(dtype=np.int64) * key_width + product_ids)[order]
+    pair_index = np.minimum(np.searchsorted(pair_keys, cell_keys), max(len(pair_keys) - 1, 0))
+    if len(cell_keys) and (len(pair_keys) == 0 or (pair_keys[pair_index] != cell_keys).any()):
+        raise ValueError("El cubo tiene parejas (almacén, producto) sin stock final")
+    net = (cube_df['entrada_quantity'].to_numpy(dtype=np.int64)
+           - cube_df['salida_quantity'].to_numpy(dtype=np.int64))[order]
+
+    stock = stock_df['stock'].to_numpy(dtype=np.int64) - np.bincount(
+        pair_index, weights=net, minlength=len(pair_keys)).astype(np.int64)
+    if len(dates) == 0:
+        checkpoints = pd.DatetimeIndex([])
+    else:
+        checkpoints = checkpoint_dates(dates[0] if first_checkpoint is None else first_checkpoint, dates[-1])
+
+    # Cada checkpoint suma al anterior los movimientos de los días intermedios
+    bounds = np.searchsorted(dates, checkpoints.to_numpy().astype(dates.dtype))
+    vectors = np.empty((len(checkpoints), len(pair_keys)), dtype=np.int64)
+    start = 0
+    for position, bound in enumerate(bounds):
+        stock = stock + np.bincount(pair_index[start:bound], weights=net[start:bound],
+                                    minlength=len(pair_keys)).astype(np.int64)
+        vectors[position] = stock
+        start = bound
+
+    checkpoints_df = pd.DataFrame({
+        'checkpoint_date': np.repeat(checkpoints.to_numpy(), len(pair_keys)),
+        'warehouse_id': np.tile(pair_warehouses, len(checkpoints)),
+        'product_id': np.tile(pair_products, len(checkpoints)),
+        'stock': vectors.ravel()
+    })
+    return apply_schema(checkpoints_df, CHECKPOINT_TABLE)
+
+def build_processed_tables(transactions_df, warehouses_df, products_df, final_stock_df=None,
+                           first_checkpoint=None):
+    """
+    Construye el cubo, los resúmenes de ROLLUPS y las tablas de stock
+
+    El cubo se calcula una vez a partir de las transacciones; los resúmenes
+    y el stock diario se derivan del cubo, no de las transacciones.
+
+    Args:
+        final_stock_df (pandas.DataFrame): warehouse_products después de las
+            transacciones; sin él no se calculan STOCK_EOD_TABLE ni CHECKPOINT_TABLE
+        first_checkpoint: Primer checkpoint de CHECKPOINT_TABLE (ver
+            build_stock_checkpoints)
+
+    Returns:
+        dict: Tabla -> DataFrame (CUBE_TABLE, las tablas de ROLLUPS,
+            STOCK_EOD_TABLE y CHECKPOINT_TABLE)
+    """
+    cube = build_movement_cube(transactions_df)
+    tables = {CUBE_TABLE: cube}
+    for table, (grain, dimensions) in ROLLUPS.items():
+        tables[table] = apply_schema(rollup(cube, dimensions, grain, warehouses_df, products_df), table)
+    if final_stock_df is not None:
+        tables[STOCK_EOD_TABLE] = build_stock_eod(cube, final_stock_df)
+        tables[CHECKPOINT_TABLE] = build_stock_checkpoints(cube, final_stock_df, first_checkpoint)
+    return tables
+
+def save_processed_tables(tables, storage_format='parquet', base_dir=None):
+    """
+    Guarda el cubo y los resúmenes en el directorio de datos procesados
+
+    En Parquet el cubo, el resumen diario y el stock diario se particionan
+    por mes (ver storage.PARTITION_COLUMNS).
+    """
+    base_dir = base_dir or processed_dir()
+    for table, df in tables.items():
+        save_table(df, table, storage_format, base_dir)
+        logger.info(f"✅ {table}: {len(df):,} filas")
+
+def load_cube(columns=None, filters=None, base_dir=None):
+    """
+    Carga el cubo de movimientos
+
+    Args:
+        columns (list): Columnas a leer (todas por defecto)
+        filters (list): Filtros de pyarrow, p. ej. [('month', '=', '2025-03')]
+            para leer solo una partición
+        base_dir (str): Directorio (por defecto, config.processed_dir())
+
+    Returns:
+        pandas.DataFrame: Cubo con los tipos del esquema
+    """
+    return load_table(CUBE_TABLE, base_dir=base_dir or processed_dir(), columns=columns, filters=filters)
+
+def refresh_movement_cube(storage_format='parquet'):
+    """
+    Reconstruye el cubo y los resúmenes a partir de las tablas de raw/
+
+    Returns:
+        dict: Tabla -> DataFrame escrito
+    """
+    logger.info("🧊 Construyendo cubo de movimientos...")
+    transactions_df = load_table('transactions', columns=TRANSACTION_COLUMNS)
+    warehouses_df = load_table('warehouses', columns=['id', 'business_id'])
+    products_df = load_table('products', columns=['id', 'category'])
+    final_stock_df = load_table('warehouse_products', columns=['warehouse_id', 'product_id', 'stock'])
+
+    tables = build_processed_tables(transactions_df, warehouses_df, products_df, final_stock_df)
+    save_processed_tables(tables, storage_format)
+    logger.info(f"📁 Tablas procesadas en: {processed_dir()}")
+    return tables
+
+def main(argv=None, prog=None):
+    """
+    Reconstruye el cubo de movimientos (subcomando `gestock cube`)
+
+    Returns:
+        bool: True si terminó sin errores
+    """
+    parser = argparse.ArgumentParser(prog=prog, description="Construye el cubo diario de movimientos y sus resúmenes")
+    parser.add_argument('--format', dest='storage_format', choices=list(FORMATS), default='parquet',
+                        help="Formato de las tablas procesadas")
+    add_logging_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_logging_from_args(args)
+
+    try:
+        refresh_movement_cube(args.storage_format)
+    except FileNotFoundError as e:
+        logger.error(f"❌ Error: {e}")
+        logger.info("Primero debe generar los datos (gestock generate)")
+        return False
+    return True
@@ -0,0 +1,464 @@
+"""
+Ejecutor de etapas del pipeline de datos de GESTOCK
+Ordena las etapas según sus dependencias y omite las que no cambiaron,
+identificando cada salida por un hash de sus entradas, parámetros y semilla
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+from . import config, instrumentation
+from .generate_businesses import generate_businesses
+from .generate_products import generate_products
+from .generate_warehouses import generate_warehouses
+from .generate_users import generate_users
+from .generate_warehouse_products import generate_warehouse_products
+from .generate_transactions import generate_transactions_parallel
+from .generate_transactional_data import generate_comprehensive_summary, validate_transactional_data
+from .logs import capture_logs, configure_logging, get_logger
+from .movement_cube import CHECKPOINT_TABLE, CUBE_TABLE, ROLLUPS, STOCK_EOD_TABLE, build_processed_tables
+from .rotation_metrics import ROTATION_TABLE, build_rotation_metrics
+from .storage import load_table, save_table, table_path
+from .transactions_view import DENORMALIZED_COLUMNS, denormalize_transactions
+
+logger = get_logger(__name__)
+
+# Directorio de artefactos de cada etapa (dentro de config.data_dir()) y manifiesto de claves
+CACHE_DIR_NAME = '.pipeline_cache'
+MANIFEST_FILE = 'manifest.json'
+
+
+class Stage:
+    """
+    Etapa del pipeline
+
+    Attributes:
+        name (str): Nombre único de la etapa
+        func (callable): Función que recibe las entradas y los parámetros como
+            argumentos con nombre y devuelve un dict salida -> valor. Las salidas
+            DataFrame se llaman como su tabla (schema.py); las demás deben ser
+            serializables en JSON
+        inputs (dict): Argumento -> 'etapa.salida' de la que depende
+        params (dict): Parámetros de la función; forman parte de la clave
+        options (dict): Parámetros que no cambian el resultado (p. ej. número
+            de procesos); se pasan a la función pero no forman parte de la clave
+        publish (dict): Salida -> tabla donde se publica
+        publish_dir (str): 'raw' (config.raw_dir()) o 'processed'
+            (config.processed_dir()): directorio de las tablas publicadas
+        cacheable (bool): False si el resultado no depende solo de la clave
+            (p. ej. generación aleatoria sin semilla); la etapa se ejecuta siempre
+    """
+
+    def __init__(self, name, func, inputs=None, params=None, options=None, publish=None,
+                 publish_dir='raw', cacheable=True):
+        self.name = name
+        self.func = func
+        self.inputs = inputs or {}
+        self.params = params or {}
+        self.options = options or {}
+        self.publish = publish or {}
+        self.publish_dir = publish_dir
+        self.cacheable = cacheable
+
+    @property
+    def dependencies(self):
+        """Etapas de las que depende esta etapa"""
+        return sorted({source.split('.')[0] for source in self.inputs.values()})
+
+
+class Pipeline:
+    """
+    Grafo de etapas con caché por contenido
+
+    La clave de una etapa es el hash de su nombre, sus parámetros y el hash del
+    contenido de cada entrada. Si la clave coincide con la guardada en el
+    manifiesto y sus artefactos existen, la etapa no se ejecuta y sus salidas
+    se cargan del caché solo si alguna etapa posterior las necesita. Como las
+    claves dependen del contenido y no de las claves de las etapas previas,
+    una etapa que vuelve a producir los mismos datos no invalida a las siguientes.
+    """
+
+    def __init__(self, stages, storage_format='parquet', cache_dir=None, raw_dir=None,
+                 processed_dir=None):
+        """
+        Args:
+            stages (list): Etapas (Stage) en cualquier orden
+            storage_format (str): Formato de artefactos y tablas publicadas
+            cache_dir (str): Directorio de artefactos (por defecto,
+                <config.data_dir()>/.pipeline_cache)
+            raw_dir (str): Directorio de publicación de las tablas (por defecto,
+                config.raw_dir())
+            processed_dir (str): Directorio de publicación de las tablas
+                procesadas (por defecto, config.processed_dir())
+        """
+        self.stages = {stage.name: stage for stage in stages}
+        self.storage_format = storage_format
+        self.cache_dir = cache_dir or os.path.join(config.data_dir(), CACHE_DIR_NAME)
+        self.raw_dir = raw_dir or config.raw_dir()
+        self.processed_dir = processed_dir or config.processed_dir()
+        self._manifest_path = os.path.join(self.cache_dir, MANIFEST_FILE)
+        self._values = {}
+
+    def order(self):
+        """
+        Ordena las etapas de modo que cada una vaya después de sus dependencias
+
+        Raises:
+            ValueError: Si hay dependencias desconocidas o ciclos
+        """
+        ordered = []
+        state = {}
+
+        def visit(name, path):
+            if name not in self.stages:
+                raise ValueError(f"Etapa desconocida: {name}")
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f"Dependencia circular: {' -> '.join(path + [name])}")
+            state[name] = 'visiting'
+            for dependency in self.stages[name].dependencies:
+                visit(dependency, path + [name])
+            state[name] = 'done'
+            ordered.append(name)
+
+        for name in self.stages:
+            visit(name, [])
+        return ordered
+
+    def run(self, force=()):
+        """
+        Ejecuta las etapas cuyas entradas o parámetros cambiaron
+
+        Args:
+            force (iterable): Etapas que se ejecutan aunque su clave no haya cambiado
+
+        Returns:
+            dict: Etapa -> 'ejecutada' u 'omitida'
+        """
+        manifest = self._load_manifest()
+        status = {}
+        self._values = {}
+
+        for name in self.order():
+            stage = self.stages[name]
+            input_hashes = {
+                argument: manifest[source.split('.')[0]]['outputs'][source.split('.')[1]]
+                for argument, source in stage.inputs.items()
+            }
+            key = _hash_json({'stage': name, 'params': stage.params, 'inputs': input_hashes})
+
+            entry = manifest.get(name)
+            if (name not in force and stage.cacheable and entry and entry['key'] == key
+                    and self._artifacts_exist(name, entry)):
+                logger.info(f"⏭️ {name}: sin cambios")
+                instrumentation.emit('stage_skipped', stage=name, key=key)
+                status[name] = 'omitida'
+                continue
+
+            logger.info(f"▶️ {name}: ejecutando...")
+            arguments = {argument: self._value(source, manifest) for argument, source in stage.inputs.items()}
+            with instrumentation.stage(name) as measured:
+                outputs = stage.func(**arguments, **stage.params, **stage.options)
+                for output, value in outputs.items():
+                    if isinstance(value, pd.DataFrame):
+                        measured.count(f"{output}_rows", len(value))
+
+            manifest[name] = {
+                'key': key,
+                'outputs': {output: self._store(name, output, value) for output, value in outputs.items()}
+            }
+            for output, value in outputs.items():
+                self._values[f"{name}.{output}"] = value
+            self._save_manifest(manifest)
+            status[name] = 'ejecutada'
+
+        self._publish(manifest)
+        return status
+
+    def _value(self, source, manifest):
+        """
+        Devuelve una salida ya calculada o la carga del caché
+        """
+        if source not in self._values:
+            stage, output = source.split('.')
+            if manifest[stage]['outputs'][output].startswith('json:'):
+                with open(self._artifact_path(stage, output, json_file=True), encoding='utf-8') as f:
+                    self._values[source] = json.load(f)
+            else:
+                self._values[source] = load_table(
+                    output, self.storage_format, os.path.join(self.cache_dir, stage)
+                )
+        return self._values[source]
+
+    def _store(self, stage, output, value):
+        """
+        Guarda un artefacto y devuelve el hash de su contenido
+        """
+        stage_dir = os.path.join(self.cache_dir, stage)
+        if isinstance(value, pd.DataFrame):
+            save_table(value, output, self.storage_format, stage_dir)
+            return 'table:' + _hash_frame(value)
+        os.makedirs(stage_dir, exist_ok=True)
+        with open(self._artifact_path(stage, output, json_file=True), 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False, default=str)
+        return 'json:' + _hash_json(value)
+
+    def _artifact_path(self, stage, output, json_file=False):
+        if json_file:
+            return os.path.join(self.cache_dir, stage, f"{output}.json")
+        return table_path(output, self.storage_format, os.path.join(self.cache_dir, stage))
+
+    def _artifacts_exist(self, stage, entry):
+        return all(
+            os.path.exists(self._artifact_path(stage, output, content_hash.startswith('json:')))
+            for output, content_hash in entry['outputs'].items()
+        )
+
+    def _publish(self, manifest):
+        """
+        Copia a raw_dir (o processed_dir) las tablas publicadas cuyo contenido cambió
+        """
+        published = manifest.setdefault('published', {})
+        for name, stage in self.stages.items():
+            publish_dir = self.processed_dir if stage.publish_dir == 'processed' else self.raw_dir
+            for output, table in stage.publish.items():
+                content_hash = manifest[name]['outputs'][output]
+                target = table_path(table, self.storage_format, publish_dir)
+                if published.get(table) == f"{self.storage_format}:{content_hash}" and os.path.exists(target):
+                    continue
+                source = self._artifact_path(name, output)
+                os.makedirs(publish_dir, exist_ok=True)
+                if os.path.isdir(target):
+                    shutil.rmtree(target)
+                if os.path.isdir(source):
+                    shutil.copytree(source, target)
+                else:
+                    shutil.copy2(source, target)
+                published[table] = f"{self.storage_format}:{content_hash}"
+                logger.info(f"📁 Publicado: {os.path.basename(target)}")
+        self._save_manifest(manifest)
+
+    def _load_manifest(self):
+        if not os.path.exists(self._manifest_path):
+            return {}
+        with open(self._manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        # Un cambio de formato invalida todos los artefactos
+        if manifest.get('format') != self.storage_format:
+            return {}
+        return manifest
+
+    def _save_manifest(self, manifest):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        manifest['format'] = self.storage_format
+        with open(self._manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+def _hash_json(value):
+    """
+    Hash estable de un valor serializable en JSON
+    """
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+def _hash_frame(df):
+    """
+    Hash del contenido de un DataFrame (columnas, tipos y valores)
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[c, str(t)] for c, t in df.dtypes.items()]).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+# Etapas de GESTOCK
+
+def _businesses_stage(num_businesses, seed):
+    return {'businesses': generate_businesses(num_businesses, seed=seed)}
+
+def _products_stage(num_products, seed):
+    return {'products': generate_products(num_products, seed=seed)}
+
+def _warehouses_stage(businesses, warehouses_per_business_range, seed):
+    return {'warehouses': generate_warehouses(businesses, tuple(warehouses_per_business_range), seed=seed)}
+
+def _users_stage(businesses, users_per_business_range, seed):
+    return {'users': generate_users(businesses, tuple(users_per_business_range), seed=seed)}
+
+def _warehouse_products_stage(businesses, warehouses, products, assortment_scale, seed):
+    return {'warehouse_products': generate_warehouse_products(
+        businesses, warehouses, products, seed=seed, assortment_scale=assortment_scale
+    )}
+
+def _transactions_stage(warehouse_products, users, warehouses, products, businesses,
+                        months_back, target_transactions, mode, batch_days, workers,
+                        normalized, seed):
+    # El resultado no depende del número de procesos (ver seeding)
+    transactions_df, updated_stock_df = generate_transactions_parallel(
+        warehouse_products, users, warehouses, products, businesses,
+        months_back=months_back, target_transactions=target_transactions, mode=mode,
+        batch_days=batch_days, max_workers=workers, seed=seed, normalized=normalized
+    )
+    return {'transactions': transactions_df, 'warehouse_products': updated_stock_df}
+
+def _validation_stage(users, initial_stock, final_stock, transactions, businesses, warehouses, products):
+    if not validate_transactional_data(users, final_stock, transactions, businesses, warehouses,
+                                       products, initial_warehouse_products_df=initial_stock):
+        raise ValueError("Los datos transaccionales no superaron la validación")
+    return {'validation': {'is_valid': True}}
+
+def _summaries_stage(users, final_stock, transactions, businesses, warehouses, products, validation):
+    if any(column not in transactions.columns for column in DENORMALIZED_COLUMNS):
+        transactions = denormalize_transactions(transactions, products, warehouses, users)
+    # El resumen se muestra según el nivel de log y se guarda completo como artefacto
+    with capture_logs() as buffer:
+        generate_comprehensive_summary(users, final_stock, transactions, businesses, warehouses, products)
+    return {'summary': buffer.getvalue()}
+
+def _movement_cube_stage(transactions, warehouses, products, final_stock):
+    return build_processed_tables(transactions, warehouses, products, final_stock)
+
+def _rotation_stage(cube, final_stock):
+    # Fecha de corte: la última fecha con movimientos, así que la clave no depende del día de ejecución
+    return {ROTATION_TABLE: build_rotation_metrics(cube, final_stock)}
+
+def build_pipeline(storage_format='parquet', num_businesses=8, num_products=85,
+                   warehouses_per_business_range=(2, 4), users_per_business_range=(2, 5),
+                   months_back=6, target_transactions=1800, assortment_scale=1.0,
+                   mode='sequential', batch_days=7, workers=1, normalized=False, seed=None,
+                   cache_dir=None, raw_dir=None):
+    """
+    Construye el pipeline de GESTOCK:
+    businesses -> products/warehouses -> users -> warehouse_products ->
+    transactions -> validation -> summaries
+                 -> movement_cube -> rotation
+
+    Las tablas publicadas en config.raw_dir() son las mismas que generan
+    generate_base_data y generate_transactional_data; warehouse_products es el
+    stock actualizado tras las transacciones. Los parámetros de tamaño tienen
+    los valores de la demo (SF1); scale_profiles.get_scale_profile devuelve los
+    de otros perfiles. El cubo de movimientos, sus resúmenes y las
+    tablas de stock (diario y checkpoints) y las métricas de
+    rotación se publican en config.processed_dir().
+
+    Args:
+        cache_dir (str): Directorio de artefactos (por defecto, el de Pipeline)
+        raw_dir (str): Directorio de publicación de las tablas (por defecto,
+            config.raw_dir())
+
+    Returns:
+        Pipeline: Pipeline listo para ejecutar
+    """
+    # Sin semilla la generación es aleatoria y usa la fecha actual: la misma
+    # clave no garantiza los mismos datos, así que esas etapas no usan el caché
+    seeded = seed is not None
+    stages = [
+        Stage('businesses', _businesses_stage,
+              params={'num_businesses': num_businesses, 'seed': seed},
+              publish={'businesses': 'businesses'}, cacheable=seeded),
+        Stage('products', _products_stage,
+              params={'num_products': num_products, 'seed': seed},
+              publish={'products': 'products'}, cacheable=seeded),
+        Stage('warehouses', _warehouses_stage,
+              inputs={'businesses': 'businesses.businesses'},
+              params={'warehouses_per_business_range': list(warehouses_per_business_range), 'seed': seed},
+              publish={'warehouses': 'warehouses'}, cacheable=seeded),
+        Stage('users', _users_stage,
+              inputs={'businesses': 'businesses.businesses'},
+              params={'users_per_business_range': list(users_per_business_range), 'seed': seed},
+              publish={'users': 'users'}, cacheable=seeded),
+        Stage('warehouse_products', _warehouse_products_stage,
+              inputs={
+                  'businesses': 'businesses.businesses',
+                  'warehouses': 'warehouses.warehouses',
+                  'products': 'products.products'
+              },
+              params={'assortment_scale': assortment_scale, 'seed': seed}, cacheable=seeded),
+        Stage('transactions', _transactions_stage,
+              inputs={
+                  'warehouse_products': 'warehouse_products.warehouse_products',
+                  'users': 'users.users',
+                  'warehouses': 'warehouses.warehouses',
+                  'products': 'products.products',
+                  'businesses': 'businesses.businesses'
+              },
+              params={
+                  'months_back': months_back, 'target_transactions': target_transactions,
+                  'mode': mode, 'batch_days': batch_days,
+                  'normalized': normalized, 'seed': seed
+              },
+              options={'workers': workers},
+              publish={'transactions': 'transactions', 'warehouse_products': 'warehouse_products'},
+              cacheable=seeded),
+        Stage('validation', _validation_stage,
+              inputs={
+                  'users': 'users.users',
+                  'initial_stock': 'warehouse_products.warehouse_products',
+                  'final_stock': 'transactions.warehouse_products',
+                  'transactions': 'transactions.transactions',
+                  'businesses': 'businesses.businesses',
+                  'warehouses': 'warehouses.warehouses',
+                  'products': 'products.products'
+              }),
+        Stage('summaries', _summaries_stage,
+              inputs={
+                  'users': 'users.users',
+                  'final_stock': 'transactions.warehouse_products',
+                  'transactions': 'transactions.transactions',
+                  'businesses': 'businesses.businesses',
+                  'warehouses': 'warehouses.warehouses',
+                  'products': 'products.products',
+                  'validation': 'validation.validation'
+              }),
+        Stage('movement_cube', _movement_cube_stage,
+              inputs={
+                  'transactions': 'transactions.transactions',
+                  'warehouses': 'warehouses.warehouses',
+                  'products': 'products.products',
+                  'final_stock': 'transactions.warehouse_products'
+              },
+              publish={table: table for table in [CUBE_TABLE, *ROLLUPS, STOCK_EOD_TABLE, CHECKPOINT_TABLE]},
+              publish_dir='processed'),
+        Stage('rotation', _rotation_stage,
+              inputs={
+                  'cube': 'movement_cube.movement_cube',
+                  'final_stock': 'transactions.warehouse_products'
+              },
+              publish={ROTATION_TABLE: ROTATION_TABLE},
+              publish_dir='processed')
+    ]
+    return Pipeline(stages, storage_format, cache_dir, raw_dir)
+
+def run_pipeline(force=(), **params):
+    """
+    Construye y ejecuta el pipeline de GESTOCK
+
+    Args:
+        force (iterable): Etapas a ejecutar aunque no hayan cambiado
+        **params: Parámetros de build_pipeline
+
+    Returns:
+        bool: True si el pipeline terminó sin errores
+    """
+    logger.info("🚀 PIPELINE DE DATOS GESTOCK")
+    logger.info("="*60)
+    try:
+        status = build_pipeline(**params).run(force=force)
+    except Exception as e:
+        logger.exception(f"\n❌ ERROR durante el pipeline: {str(e)}")
+        return False
+
+    executed = [name for name, result in status.items() if result == 'ejecutada']
+    logger.info(f"\n🎉 PIPELINE COMPLETADO: {len(executed)} etapas ejecutadas, "
+                f"{len(status) - len(executed)} omitidas")
+    return True
+
+if __name__ == "__main__":
+    configure_logging()
+    success = run_pipeline(force=sys.argv[1:])
+    sys.exit(0 if success else 1)
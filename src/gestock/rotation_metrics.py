@@ -0,0 +1,196 @@
+"""
+Métricas de rotación de inventario de GESTOCK
+Calcula por almacén y producto, a una fecha de corte, la rotación del período,
+los días de inventario, los días de cobertura a la velocidad de SALIDA actual y
+la marca de stock muerto, a partir del cubo de movimientos y del snapshot de
+stock (warehouse_products). Todo se resuelve con operaciones agrupadas sobre
+arreglos, y solo se leen las celdas del cubo desde el comienzo de la ventana
+
+Uso:
+    gestock rotation                          # a la última fecha con movimientos
+    gestock rotation --as-of 2025-06-30 --period-days 60 --dead-stock-days 45
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from .config import FORMATS, processed_dir
+from .dimension_lookups import _dense_index
+from .logs import add_logging_arguments, configure_logging_from_args, get_logger
+from .movement_cube import CUBE_TABLE
+from .schema import apply_schema
+from .storage import load_table, save_table, table_max
+
+logger = get_logger(__name__)
+
+ROTATION_TABLE = 'rotation_metrics'
+
+# Ventanas por defecto (días, terminando en la fecha de corte inclusive)
+DEFAULT_PERIOD_DAYS = 90
+DEFAULT_VELOCITY_DAYS = 30
+DEFAULT_DEAD_STOCK_DAYS = 60
+
+def build_rotation_metrics(cube_df, stock_df, as_of=None, period_days=DEFAULT_PERIOD_DAYS,
+                           velocity_days=DEFAULT_VELOCITY_DAYS, dead_stock_days=DEFAULT_DEAD_STOCK_DAYS):
+    """
+    Calcula las métricas de rotación de cada pareja (almacén, producto)
+
+    El stock al cierre de as_of es el stock del snapshot menos el movimiento
+    neto posterior; el stock promedio del período es el promedio del stock al
+    cierre de cada día, que se obtiene sin recorrer los días: el stock al
+    comienzo del período más cada movimiento neto ponderado por los días del
+    período que quedan desde su fecha.
+
+    Métricas:
+    - turnover: SALIDAs del período / stock promedio del período
+    - days_on_hand: stock promedio / SALIDAs por día del período
+    - days_of_cover: stock a la fecha de corte / SALIDAs por día de los
+      últimos velocity_days días
+    - dead_stock: sin SALIDAs en los últimos dead_stock_days días y con stock
+
+    Las razones sin denominador (sin stock o sin SALIDAs) quedan en NaN.
+
+    Args:
+        cube_df (pandas.DataFrame): Celdas del cubo desde el comienzo de la
+            ventana más larga (más antiguas se ignoran)
+        stock_df (pandas.DataFrame): warehouse_products después del último
+            movimiento de cube_df
+        as_of: Fecha de corte (por defecto, la última fecha del cubo)
+        period_days (int): Días del período de rotación y días de inventario
+        velocity_days (int): Días para la velocidad de SALIDA
+        dead_stock_days (int): Días sin SALIDAs para marcar stock muerto
+
+    Returns:
+        pandas.DataFrame: Una fila por pareja de stock_df, ordenada por pareja
+    """
+    stock_df = stock_df.sort_values(['warehouse_id', 'product_id'], kind='stable')
+    pair_warehouses = stock_df['warehouse_id'].to_numpy(dtype=np.int64)
+    pair_products = stock_df['product_id'].to_numpy(dtype=np.int64)
+    key_width = int(max(pair_products.max(initial=0), cube_df['product_id'].to_numpy().max(initial=0)) + 1)
+    row_of_pair = _dense_index(pair_warehouses * key_width + pair_products, np.arange(len(stock_df)))
+    n_pairs = len(stock_df)
+
+    # Días desde la fecha de corte (0 = as_of, negativos = antes)
+    dates = cube_df['date'].to_numpy().astype('datetime64[D]')
+    if as_of is None:
+        as_of = pd.Timestamp(dates.max()) if len(dates) else pd.Timestamp.now().normalize()
+    as_of = pd.Timestamp(as_of).normalize()
+    day = (dates - np.datetime64(as_of.date(), 'D')).astype(np.int64)
+
+    cell_keys = (cube_df['warehouse_id'].to_numpy(dtype=np.int64) * key_width
+                 + cube_df['product_id'].to_numpy(dtype=np.int64))
+    if len(cell_keys) and (cell_keys.max() >= len(row_of_pair) or (row_of_pair[cell_keys] < 0).any()):
+        raise ValueError("El cubo tiene parejas (almacén, producto) sin stock")
+    rows = row_of_pair[cell_keys]
+    salida = cube_df['salida_quantity'].to_numpy(dtype=np.int64)
+    net = cube_df['entrada_quantity'].to_numpy(dtype=np.int64) - salida
+
+    def pair_sum(mask, weights):
+        return np.bincount(rows[mask], weights=weights[mask], minlength=n_pairs)
+
+    # Stock al cierre de as_of y al comienzo del período
+    stock = stock_df['stock'].to_numpy(dtype=np.int64) - pair_sum(day > 0, net).astype(np.int64)
+    in_period = (day > -period_days) & (day <= 0)
+    opening = stock - pair_sum(in_period, net).astype(np.int64)
+    average_stock = opening + pair_sum(in_period, net * (1 - day)) / period_days
+
+    salida_period = pair_sum(in_period, salida).astype(np.int64)
+    velocity = pair_sum((day > -velocity_days) & (day <= 0), salida) / velocity_days
+
+    # Última SALIDA dentro de la ventana más larga (NaT si no hubo)
+    lookback = max(period_days, velocity_days, dead_stock_days)
+    sold = (salida > 0) & (day > -lookback) & (day <= 0)
+    last_salida = np.full(n_pairs, np.iinfo(np.int64).min, dtype=np.int64)
+    np.maximum.at(last_salida, rows[sold], day[sold])
+    has_salida = last_salida > np.iinfo(np.int64).min
+    last_salida_date = np.where(
+        has_salida,
+        np.datetime64(as_of.date(), 'D') + np.where(has_salida, last_salida, 0).astype('timedelta64[D]'),
+        np.datetime64('NaT')
+    )
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        turnover = np.where(average_stock > 0, salida_period / average_stock, np.nan)
+        days_on_hand = np.where(salida_period > 0, average_stock * period_days / salida_period, np.nan)
+        days_of_cover = np.where(velocity > 0, stock / velocity, np.nan)
+    dead_stock = (stock > 0) & ~(has_salida & (last_salida > -dead_stock_days))
+
+    metrics = pd.DataFrame({
+        'warehouse_id': pair_warehouses,
+        'product_id': pair_products,
+        'as_of': as_of,
+        'stock': stock,
+        'average_stock': average_stock,
+        'salida_quantity': salida_period,
+        'turnover': turnover,
+        'days_on_hand': days_on_hand,
+        'salida_velocity': velocity,
+        'days_of_cover': days_of_cover,
+        'last_salida_date': last_salida_date,
+        'dead_stock': dead_stock
+    })
+    return apply_schema(metrics, ROTATION_TABLE)
+
+def refresh_rotation_metrics(as_of=None, period_days=DEFAULT_PERIOD_DAYS, velocity_days=DEFAULT_VELOCITY_DAYS,
+                             dead_stock_days=DEFAULT_DEAD_STOCK_DAYS, storage_format='parquet'):
+    """
+    Calcula las métricas de rotación desde processed/ y raw/ y las guarda
+
+    Del cubo se leen solo las particiones desde el comienzo de la ventana más
+    larga, así que el costo depende de las ventanas y no de la historia.
+
+    Returns:
+        pandas.DataFrame: Métricas escritas en ROTATION_TABLE
+    """
+    logger.info("🔄 Calculando métricas de rotación...")
+    if as_of is None:
+        as_of = table_max(CUBE_TABLE, ['date'], storage_format, processed_dir())['date']
+    as_of = pd.Timestamp(as_of).normalize()
+    first_day = as_of - pd.Timedelta(days=max(period_days, velocity_days, dead_stock_days) - 1)
+
+    # Particiones desde el mes del comienzo de la ventana; las celdas
+    # posteriores a as_of llevan el snapshot de stock hasta la fecha de corte
+    cube_df = load_table(CUBE_TABLE, storage_format, processed_dir(),
+                         columns=['date', 'warehouse_id', 'product_id', 'entrada_quantity', 'salida_quantity'],
+                         filters=[('month', '>=', first_day.strftime('%Y-%m'))])
+    cube_df = cube_df[cube_df['date'] >= first_day]
+    stock_df = load_table('warehouse_products', columns=['warehouse_id', 'product_id', 'stock'])
+
+    metrics = build_rotation_metrics(cube_df, stock_df, as_of, period_days, velocity_days, dead_stock_days)
+    save_table(metrics, ROTATION_TABLE, storage_format, processed_dir())
+    logger.info(f"✅ {ROTATION_TABLE}: {len(metrics):,} filas al {as_of.date()} "
+                f"({int(metrics['dead_stock'].sum()):,} con stock muerto)")
+    return metrics
+
+def main(argv=None, prog=None):
+    """
+    Calcula y guarda las métricas de rotación (subcomando `gestock rotation`)
+
+    Returns:
+        bool: True si terminó sin errores
+    """
+    parser = argparse.ArgumentParser(prog=prog, description="Calcula las métricas de rotación de inventario")
+    parser.add_argument('--as-of', type=pd.Timestamp, default=None,
+                        help="Fecha de corte (por defecto, la última fecha con movimientos)")
+    parser.add_argument('--period-days', type=int, default=DEFAULT_PERIOD_DAYS,
+                        help="Días del período de rotación y días de inventario")
+    parser.add_argument('--velocity-days', type=int, default=DEFAULT_VELOCITY_DAYS,
+                        help="Días para la velocidad de SALIDA (días de cobertura)")
+    parser.add_argument('--dead-stock-days', type=int, default=DEFAULT_DEAD_STOCK_DAYS,
+                        help="Días sin SALIDAs para marcar stock muerto")
+    parser.add_argument('--format', dest='storage_format', choices=list(FORMATS), default='parquet',
+                        help="Formato de las tablas procesadas")
+    add_logging_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_logging_from_args(args)
+
+    try:
+        refresh_rotation_metrics(args.as_of, args.period_days, args.velocity_days,
+                                 args.dead_stock_days, args.storage_format)
+    except FileNotFoundError as e:
+        logger.error(f"❌ Error: {e}")
+        logger.info("Primero debe construir el cubo de movimientos (gestock cube)")
+        return False
+    return True
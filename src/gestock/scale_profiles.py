@@ -0,0 +1,157 @@
+"""
+Perfiles de escala de los datos de GESTOCK (estilo TPC: SF1, SF10, SF100, SF1000)
+Escalan juntos negocios, productos, almacenes, usuarios y transacciones a
+partir del tamaño de la demo (SF1)
+"""
+
+import argparse
+import math
+import re
+
+from .logs import add_logging_arguments, configure_logging_from_args, get_logger
+
+logger = get_logger(__name__)
+
+# Tamaño de la demo (SF1): los valores que usaban los scripts de generación
+BASE_PROFILE = {
+    'num_businesses': 8,
+    'num_products': 85,
+    'warehouses_per_business_range': (2, 4),
+    'users_per_business_range': (2, 5),
+    'months_back': 6,
+    'target_transactions': 1800
+}
+
+# Perfiles con nombre y su factor de escala
+SCALE_FACTORS = {
+    'SF1': 1,
+    'SF10': 10,
+    'SF100': 100,
+    'SF1000': 1000
+}
+
+DEFAULT_SCALE = 'SF1'
+
+# Al menos un producto por categoría del catálogo (ver generate_products)
+MIN_PRODUCTS = 7
+
+def scale_factor(scale):
+    """
+    Interpreta un factor de escala
+
+    Args:
+        scale (str | int | float): Perfil ('SF10'), 'SF<n>' o el factor mismo
+
+    Returns:
+        float: Factor de escala (positivo)
+
+    Raises:
+        ValueError: Si el perfil no es válido
+    """
+    if isinstance(scale, str):
+        if scale.upper() in SCALE_FACTORS:
+            return float(SCALE_FACTORS[scale.upper()])
+        match = re.fullmatch(r'(?:SF)?(\d+(?:\.\d+)?)', scale.strip(), re.IGNORECASE)
+        if match is None:
+            raise ValueError(f"Perfil de escala desconocido: {scale}")
+        scale = match.group(1)
+    factor = float(scale)
+    if not factor > 0:
+        raise ValueError(f"El factor de escala debe ser positivo: {scale}")
+    return factor
+
+def get_scale_profile(scale=DEFAULT_SCALE):
+    """
+    Tamaños de los datos para un factor de escala
+
+    Negocios, y con ellos almacenes y usuarios (mismos rangos por negocio), y
+    el volumen de transacciones crecen linealmente con el factor. El catálogo
+    de productos crece con su raíz cuadrada, como las dimensiones de artículos
+    de TPC-DS, y assortment_scale reduce la probabilidad de surtido para que
+    cada almacén siga teniendo en promedio tantos productos como en la demo:
+    las parejas producto-almacén también crecen linealmente. Las proporciones
+    por categoría (reparto uniforme del catálogo) y la ventana de meses, y con
+    ella la estacionalidad, no cambian.
+
+    Args:
+        scale (str | int | float): Perfil ('SF1', 'SF10', ...) o factor
+
+    Returns:
+        dict: Parámetros de tamaño de build_pipeline (ver pipeline.py)
+
+    Raises:
+        ValueError: Si el perfil no es válido o sus IDs no caben en los tipos
+            del esquema
+    """
+    factor = scale_factor(scale)
+    num_products = max(MIN_PRODUCTS, round(BASE_PROFILE['num_products'] * math.sqrt(factor)))
+
+    profile = {
+        'num_businesses': max(1, round(BASE_PROFILE['num_businesses'] * factor)),
+        'num_products': num_products,
+        'warehouses_per_business_range': BASE_PROFILE['warehouses_per_business_range'],
+        'users_per_business_range': BASE_PROFILE['users_per_business_range'],
+        'months_back': BASE_PROFILE['months_back'],
+        'target_transactions': max(1, round(BASE_PROFILE['target_transactions'] * factor)),
+        'assortment_scale': min(1.0, BASE_PROFILE['num_products'] / num_products)
+    }
+    _check_id_limits(profile, scale)
+    return profile
+
+def _check_id_limits(profile, scale):
+    """
+    Verifica que los IDs más altos del perfil quepan en los tipos enteros del
+    esquema (schema.py); de lo contrario apply_schema rechazaría las tablas
+
+    Raises:
+        ValueError: Si algún ID supera el máximo de su tipo
+    """
+    # NumPy y pandas se importan al calcular un perfil, no al importar el módulo
+    import numpy as np
+    from .schema import TABLE_SCHEMAS
+
+    max_ids = {
+        ('businesses', 'id'): profile['num_businesses'],
+        ('products', 'id'): profile['num_products'],
+        ('warehouses', 'id'): profile['num_businesses'] * profile['warehouses_per_business_range'][1],
+        ('users', 'id'): profile['num_businesses'] * profile['users_per_business_range'][1],
+        ('transactions', 'id'): profile['target_transactions']
+    }
+    for (table, column), max_id in max_ids.items():
+        dtype = TABLE_SCHEMAS[table][column]
+        limit = np.iinfo(dtype).max
+        if max_id > limit:
+            raise ValueError(f"Perfil de escala demasiado grande: {scale} llega a {max_id:,} en "
+                             f"{table}.{column}, que es {dtype} (máximo {limit:,})")
+
+def describe_profile(scale):
+    """
+    Resume un perfil en una línea
+    """
+    profile = get_scale_profile(scale)
+    return (
+        f"SF{scale_factor(scale):g}: {profile['num_businesses']:,} negocios, "
+        f"{profile['num_products']:,} productos, {profile['target_transactions']:,} transacciones "
+        f"en {profile['months_back']} meses"
+    )
+
+def main(argv=None, prog=None):
+    """
+    Muestra los perfiles de escala (subcomando `gestock scales`)
+
+    Returns:
+        bool: False si algún perfil no es válido
+    """
+    parser = argparse.ArgumentParser(prog=prog, description="Muestra los perfiles de escala")
+    parser.add_argument('scales', nargs='*', metavar='ESCALA',
+                        help="Perfiles a describir, p. ej. SF10 o SF250 (por defecto, todos)")
+    add_logging_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_logging_from_args(args)
+    try:
+        for scale in args.scales or SCALE_FACTORS:
+            logger.info(describe_profile(scale))
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+        return False
+    return True
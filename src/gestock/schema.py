@@ -0,0 +1,250 @@
+"""
+Registro central de tipos de datos para las tablas de GESTOCK
+Declara categóricas, IDs compactos, fechas en segundos y booleanos para que
+generadores y cargadores produzcan siempre los mismos dtypes
+"""
+
+import numpy as np
+import pandas as pd
+
+# Tipos de transacción válidos, en orden fijo
+TRANSACTION_TYPE = pd.CategoricalDtype(['ENTRADA', 'SALIDA'])
+
+# Valores aceptados en las columnas bool (los textos, en minúsculas)
+BOOL_VALUES = {True: True, False: False, 'true': True, 'false': False}
+
+# Las columnas no declaradas (textos únicos como emails o descripciones)
+# conservan el tipo con el que fueron generadas
+TABLE_SCHEMAS = {
+    'businesses': {
+        'id': 'int32',
+        'industry': 'category',
+        'business_type': 'category',
+        'size': 'category',
+        'city': 'category',
+        'region': 'category',
+        'created_at': 'datetime64[s]'
+    },
+    'products': {
+        'id': 'int32',
+        'category': 'category',
+        'price': 'int64',
+        'cost_price': 'int64',
+        'profit_margin': 'float32',
+        'supplier': 'category',
+        'created_at': 'datetime64[s]'
+    },
+    'warehouses': {
+        'id': 'int32',
+        'name': 'category',
+        'business_id': 'int32',
+        'capacity': 'int32',
+        'location_type': 'category',
+        'manager_name': 'category',
+        'operational_cost': 'int64',
+        'created_at': 'datetime64[s]'
+    },
+    'users': {
+        'id': 'int32',
+        'first_name': 'category',
+        'last_name': 'category',
+        'business_id': 'int32',
+        'role': 'category',
+        'is_active': 'bool',
+        'phone_number': 'int64',
+        'created_at': 'datetime64[s]',
+        'last_login': 'datetime64[s]'
+    },
+    'warehouse_products': {
+        'product_id': 'int32',
+        'warehouse_id': 'int32',
+        'stock': 'int32',
+        'min_stock': 'int32',
+        'max_stock': 'int32',
+        'last_updated': 'datetime64[s]'
+    },
+    'transactions': {
+        'id': 'int64',
+        'type': TRANSACTION_TYPE,
+        'quantity': 'int32',
+        'created_at': 'datetime64[s]',
+        'user_id': 'int32',
+        'product_id': 'int32',
+        'warehouse_id': 'int32',
+        'product_name': 'category',
+        'product_category': 'category',
+        'warehouse_name': 'category',
+        'business_id': 'int32',
+        'user_name': 'category'
+    },
+    # Tablas procesadas (ver movement_cube)
+    'movement_cube': {
+        'date': 'datetime64[s]',
+        'warehouse_id': 'int32',
+        'product_id': 'int32',
+        'entrada_quantity': 'int32',
+        'salida_quantity': 'int32',
+        'entrada_count': 'int32',
+        'salida_count': 'int32'
+    },
+    'movement_daily_business': {
+        'date': 'datetime64[s]',
+        'business_id': 'int32',
+        'entrada_quantity': 'int64',
+        'salida_quantity': 'int64',
+        'entrada_count': 'int64',
+        'salida_count': 'int64'
+    },
+    'movement_monthly': {
+        'month': 'datetime64[s]',
+        'business_id': 'int32',
+        'category': 'category',
+        'entrada_quantity': 'int64',
+        'salida_quantity': 'int64',
+        'entrada_count': 'int64',
+        'salida_count': 'int64'
+    },
+    'movement_by_product': {
+        'product_id': 'int32',
+        'entrada_quantity': 'int64',
+        'salida_quantity': 'int64',
+        'entrada_count': 'int64',
+        'salida_count': 'int64'
+    },
+    'movement_by_warehouse': {
+        'warehouse_id': 'int32',
+        'entrada_quantity': 'int64',
+        'salida_quantity': 'int64',
+        'entrada_count': 'int64',
+        'salida_count': 'int64'
+    },
+    'movement_by_business': {
+        'business_id': 'int32',
+        'entrada_quantity': 'int64',
+        'salida_quantity': 'int64',
+        'entrada_count': 'int64',
+        'salida_count': 'int64'
+    },
+    'stock_eod': {
+        'date': 'datetime64[s]',
+        'warehouse_id': 'int32',
+        'product_id': 'int32',
+        'stock': 'int32'
+    },
+    'stock_checkpoints': {
+        'checkpoint_date': 'datetime64[s]',
+        'warehouse_id': 'int32',
+        'product_id': 'int32',
+        'stock': 'int32'
+    },
+    'rotation_metrics': {
+        'warehouse_id': 'int32',
+        'product_id': 'int32',
+        'as_of': 'datetime64[s]',
+        'stock': 'int32',
+        'average_stock': 'float64',
+        'salida_quantity': 'int64',
+        'turnover': 'float64',
+        'days_on_hand': 'float64',
+        'salida_velocity': 'float64',
+        'days_of_cover': 'float64',
+        'last_salida_date': 'datetime64[s]',
+        'dead_stock': 'bool'
+    }
+}
+
+def date_columns(table):
+    """
+    Devuelve las columnas de fecha declaradas para una tabla
+    """
+    return [
+        column for column, dtype in TABLE_SCHEMAS.get(table, {}).items()
+        if str(dtype).startswith('datetime64')
+    ]
+
+def apply_schema(df, table):
+    """
+    Convierte las columnas de un DataFrame a los tipos declarados para la tabla
+
+    Las columnas que ya tienen el tipo declarado no se copian, de modo que
+    aplicar el esquema a datos ya tipados (p. ej. vistas memory-mapped) no
+    tiene costo. Las columnas ausentes se ignoran.
+
+    Args:
+        df (pandas.DataFrame): Datos de la tabla
+        table (str): Nombre de la tabla (clave de TABLE_SCHEMAS)
+
+    Returns:
+        pandas.DataFrame: DataFrame con los tipos del esquema
+
+    Raises:
+        ValueError: Si una columna bool tiene valores que no son booleanos o
+            una columna entera tiene valores fuera del rango de su tipo
+    """
+    conversions = {}
+    for column, dtype in TABLE_SCHEMAS[table].items():
+        if column not in df.columns:
+            continue
+        series = df[column]
+
+        if isinstance(dtype, pd.CategoricalDtype):
+            if series.dtype != dtype:
+                conversions[column] = series.astype(str).astype(dtype)
+        elif dtype == 'category':
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                conversions[column] = series.astype('category')
+        elif str(dtype).startswith('datetime64'):
+            if not pd.api.types.is_datetime64_any_dtype(series):
+                series = pd.to_datetime(series)
+            if series.dtype != dtype:
+                conversions[column] = series.astype(dtype)
+        elif dtype == 'bool':
+            if series.dtype != bool:
+                conversions[column] = _to_bool(series, f"{table}.{column}")
+        elif series.dtype != dtype:
+            _check_int_bounds(series, dtype, f"{table}.{column}")
+            conversions[column] = series.astype(dtype)
+
+    if not conversions:
+        return df
+    df = df.copy(deep=False)
+    for column, series in conversions.items():
+        df[column] = series
+    return df
+
+def _check_int_bounds(series, dtype, label):
+    """
+    Verifica que una columna numérica quepa en el tipo entero declarado;
+    astype no avisa y los valores fuera de rango darían la vuelta
+
+    Raises:
+        ValueError: Si el mínimo o el máximo quedan fuera del rango del tipo
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind not in 'iu' or series.dtype.kind not in 'iuf' or series.empty:
+        return
+    info = np.iinfo(dtype)
+    low, high = series.min(), series.max()
+    if low < info.min or high > info.max:
+        raise ValueError(f"{label}: valores fuera del rango de {dtype} ({low} a {high}, "
+                         f"admite {info.min} a {info.max})")
+
+def _to_bool(series, label):
+    """
+    Convierte una columna a bool: acepta True/False (también 1/0) y los textos
+    'true'/'false' sin distinguir mayúsculas; la tabla de conversión se arma
+    con los valores distintos, no fila por fila
+
+    Raises:
+        ValueError: Si hay nulos u otros valores, que se listan en el mensaje
+    """
+    mapping, invalid = {}, []
+    for value in series.unique():
+        key = value.strip().lower() if isinstance(value, str) else value
+        if not pd.isna(key) and key in BOOL_VALUES:
+            mapping[value] = BOOL_VALUES[key]
+        else:
+            invalid.append(repr(value))
+    if invalid:
+        raise ValueError(f"{label}: valores no booleanos {', '.join(sorted(invalid))}")
+    return series.map(mapping).astype(bool)
@@ -0,0 +1,74 @@
+"""
+Semillas y fecha de referencia reproducibles para los generadores de GESTOCK
+Divide la semilla de una ejecución en flujos numpy.random.Generator
+independientes por generador y por fragmento (negocio, bloque de días)
+"""
+
+import hashlib
+from datetime import datetime
+
+import numpy as np
+
+# "Ahora" de referencia de las ejecuciones con semilla: fija la ventana de
+# fechas simulada para que dos ejecuciones con la misma semilla coincidan
+REFERENCE_NOW = datetime(2025, 6, 30, 23, 59, 59)
+
+
+def _spawn_key(keys):
+    """
+    Convierte claves (textos o enteros no negativos) en una clave de SeedSequence estable
+    """
+    spawn_key = []
+    for key in keys:
+        if isinstance(key, str):
+            key = int.from_bytes(hashlib.sha256(key.encode('utf-8')).digest()[:4], 'little')
+        spawn_key.append(int(key))
+    return tuple(spawn_key)
+
+def seed_sequence(seed, *keys):
+    """
+    Deriva la SeedSequence de un flujo a partir de la semilla de la ejecución
+
+    El flujo depende solo de la semilla y de las claves (p. ej. 'transactions',
+    business_id, número de bloque), no del orden en que se pidan los flujos ni
+    del número de procesos, así que cada fragmento es reproducible por sí solo.
+
+    Args:
+        seed (int | numpy.random.SeedSequence | None): Semilla de la ejecución;
+            None usa entropía del sistema
+        *keys: Claves del flujo (textos o enteros no negativos)
+
+    Returns:
+        numpy.random.SeedSequence: Secuencia del flujo
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        root = seed
+    else:
+        root = np.random.SeedSequence(seed)
+    return np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + _spawn_key(keys))
+
+def stream(seed, *keys):
+    """
+    Crea el generador aleatorio de un flujo (ver seed_sequence)
+
+    Returns:
+        numpy.random.Generator: Generador independiente del flujo
+    """
+    return np.random.default_rng(seed_sequence(seed, *keys))
+
+def resolve_now(now=None, seed=None):
+    """
+    Fecha de referencia de una ejecución
+
+    Args:
+        now (datetime): Fecha explícita; tiene prioridad
+        seed: Semilla de la ejecución; con semilla se usa REFERENCE_NOW
+
+    Returns:
+        datetime: now, REFERENCE_NOW o la fecha actual
+    """
+    if now is not None:
+        return now
+    if seed is not None:
+        return REFERENCE_NOW
+    return datetime.now()
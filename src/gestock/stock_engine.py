@@ -0,0 +1,126 @@
+"""
+Motor de simulación de inventario respaldado por arreglos NumPy
+Mantiene stock, min_stock y max_stock por pareja producto-almacén y el
+conjunto de parejas con stock disponible de forma incremental
+"""
+
+import numpy as np
+
+
+class StockState:
+    """
+    Estado de inventario para la simulación de transacciones
+
+    Cada pareja producto-almacén ocupa una posición fija en los arreglos.
+    Las parejas con stock > 0 se guardan en un conjunto de índices con
+    borrado por intercambio (swap-remove), de modo que muestrear, agregar
+    y quitar parejas cuesta O(1) en lugar de filtrar todo el DataFrame.
+    """
+
+    def __init__(self, warehouse_products_df):
+        """
+        Args:
+            warehouse_products_df (pandas.DataFrame): DataFrame con stock inicial
+        """
+        self.frame = warehouse_products_df.reset_index(drop=True)
+
+        self.product_ids = self.frame['product_id'].to_numpy()
+        self.warehouse_ids = self.frame['warehouse_id'].to_numpy()
+        self.stock = self.frame['stock'].to_numpy(dtype=np.int64, copy=True)
+        self.min_stock = self.frame['min_stock'].to_numpy(dtype=np.int64, copy=True)
+        self.max_stock = self.frame['max_stock'].to_numpy(dtype=np.int64, copy=True)
+
+        self._members = np.empty(len(self.stock), dtype=np.int64)
+        self._slot = np.full(len(self.stock), -1, dtype=np.int64)
+        self._rebuild_in_stock()
+
+    def _rebuild_in_stock(self):
+        """
+        Reconstruye el conjunto de parejas con stock a partir del arreglo de stock
+        """
+        # _members[:_size] son posiciones con stock y _slot[pos] es el lugar
+        # de pos dentro de _members (-1 si no está)
+        in_stock = np.flatnonzero(self.stock > 0)
+        self._members[:len(in_stock)] = in_stock
+        self._slot.fill(-1)
+        self._slot[in_stock] = np.arange(len(in_stock))
+        self._size = len(in_stock)
+
+    @property
+    def in_stock_count(self):
+        """Número de parejas producto-almacén con stock disponible"""
+        return self._size
+
+    def in_stock_positions(self):
+        """
+        Devuelve una copia de las posiciones de las parejas con stock disponible
+        """
+        return self._members[:self._size].copy()
+
+    def sample_in_stock(self, rng):
+        """
+        Selecciona una pareja con stock disponible de forma uniforme
+
+        Args:
+            rng (numpy.random.Generator): Generador aleatorio
+
+        Returns:
+            int: Posición de la pareja, o -1 si no hay stock
+        """
+        if self._size == 0:
+            return -1
+        return int(self._members[rng.integers(self._size)])
+
+    def add(self, pos, quantity):
+        """
+        Registra una ENTRADA de inventario
+        """
+        self.stock[pos] += quantity
+        if self._slot[pos] < 0 and self.stock[pos] > 0:
+            self._slot[pos] = self._size
+            self._members[self._size] = pos
+            self._size += 1
+
+    def remove(self, pos, quantity):
+        """
+        Registra una SALIDA de inventario sin dejar stock negativo
+
+        Returns:
+            int: Cantidad efectivamente descontada
+        """
+        quantity = min(quantity, int(self.stock[pos]))
+        self.stock[pos] -= quantity
+        if self.stock[pos] <= 0 and self._slot[pos] >= 0:
+            # Mover el último miembro al hueco que deja esta pareja
+            slot = self._slot[pos]
+            last = self._members[self._size - 1]
+            self._members[slot] = last
+            self._slot[last] = slot
+            self._slot[pos] = -1
+            self._size -= 1
+        return quantity
+
+    def set_stock(self, positions, levels):
+        """
+        Asigna niveles de stock en bloque (modo vectorizado)
+
+        Args:
+            positions (numpy.ndarray): Posiciones de las parejas a actualizar
+            levels (numpy.ndarray): Nuevos niveles de stock, no negativos
+        """
+        self.stock[positions] = levels
+        self._rebuild_in_stock()
+
+    def to_frame(self):
+        """
+        Construye el DataFrame de stock actualizado
+
+        Returns:
+            pandas.DataFrame: Mismo esquema que warehouse_products con el stock final,
+            con product_id y warehouse_id como primeras columnas
+        """
+        updated = self.frame.copy()
+        updated['stock'] = self.stock
+        key_columns = ['product_id', 'warehouse_id']
+        other_columns = [c for c in updated.columns if c not in key_columns]
+        return updated[key_columns + other_columns]
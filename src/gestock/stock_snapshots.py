@@ -0,0 +1,134 @@
+"""
+Consultas de stock a una fecha (as-of) para GESTOCK
+Usa los checkpoints semanales del vector completo de stock (stock_checkpoints)
+y el cubo de movimientos como registro de deltas diarios por pareja (almacén,
+producto): el stock al cierre de un día es el checkpoint anterior más el
+movimiento neto de, como mucho, seis días
+
+Uso:
+    index = StockSnapshotIndex()
+    index.stock_at(warehouse_id=3, product_id=17, date='2025-03-14')
+    index.stock_as_of('2025-03-14', warehouse_ids=[3, 4])
+"""
+
+import numpy as np
+import pandas as pd
+
+from .config import processed_dir
+from .movement_cube import CHECKPOINT_FREQ, CHECKPOINT_TABLE, CUBE_TABLE
+from .storage import load_table, table_max, table_min
+
+class StockSnapshotIndex:
+    """
+    Índice de stock por fecha sobre las tablas procesadas
+
+    Cada consulta lee una sola fecha de checkpoint (las filas de las parejas
+    pedidas) y las celdas del cubo entre ese checkpoint y la fecha, así que su
+    costo no depende de la longitud de la historia. Los checkpoints se
+    ordenan por pareja dentro de cada fecha y el cubo se particiona por mes,
+    de modo que Parquet lee solo los grupos de filas necesarios.
+    """
+
+    def __init__(self, storage_format='parquet', base_dir=None):
+        """
+        Args:
+            storage_format (str): Formato de las tablas procesadas
+            base_dir (str): Directorio (por defecto, config.processed_dir())
+        """
+        self.storage_format = storage_format
+        self.base_dir = base_dir or processed_dir()
+        self.first_checkpoint = table_min(CHECKPOINT_TABLE, ['checkpoint_date'],
+                                          storage_format, self.base_dir)['checkpoint_date']
+        self.last_checkpoint = table_max(CHECKPOINT_TABLE, ['checkpoint_date'],
+                                         storage_format, self.base_dir)['checkpoint_date']
+        self._offset = pd.tseries.frequencies.to_offset(CHECKPOINT_FREQ)
+
+    def checkpoint_for(self, date):
+        """
+        Checkpoint desde el que se reconstruye el stock al cierre de date
+
+        Returns:
+            pandas.Timestamp: Último checkpoint anterior o igual al día siguiente
+        """
+        next_day = pd.Timestamp(date).normalize() + pd.Timedelta(days=1)
+        return min(self._offset.rollback(next_day), self.last_checkpoint)
+
+    def stock_as_of(self, date, warehouse_ids=None, product_ids=None):
+        """
+        Stock de cada pareja al cierre de un día
+
+        Args:
+            date: Fecha (cualquier valor que acepte pandas.Timestamp)
+            warehouse_ids (list): Almacenes a incluir (todos por defecto)
+            product_ids (list): Productos a incluir (todos por defecto)
+
+        Returns:
+            pandas.DataFrame: warehouse_id, product_id y stock, ordenado por pareja
+
+        Raises:
+            ValueError: Si date es anterior al primer checkpoint
+        """
+        day = pd.Timestamp(date).normalize()
+        checkpoint = self.checkpoint_for(day)
+        if self.first_checkpoint is None or checkpoint < self.first_checkpoint:
+            raise ValueError(f"No hay checkpoint de stock para {day.date()} (anterior a la historia)")
+        pair_filters = []
+        if warehouse_ids is not None:
+            pair_filters.append(('warehouse_id', 'in', list(warehouse_ids)))
+        if product_ids is not None:
+            pair_filters.append(('product_id', 'in', list(product_ids)))
+
+        base = self._read(CHECKPOINT_TABLE, 'checkpoint_date', checkpoint, checkpoint, pair_filters)
+
+        # Deltas de los días entre el checkpoint y date, sumados por pareja
+        cells = self._read(CUBE_TABLE, 'date', checkpoint, day, pair_filters)
+        key_width = int(max(base['product_id'].to_numpy().max(initial=0),
+                            cells['product_id'].to_numpy().max(initial=0)) + 1)
+        pair_keys = (base['warehouse_id'].to_numpy(dtype=np.int64) * key_width
+                     + base['product_id'].to_numpy(dtype=np.int64))
+        cell_keys = (cells['warehouse_id'].to_numpy(dtype=np.int64) * key_width
+                     + cells['product_id'].to_numpy(dtype=np.int64))
+        pair_index = np.searchsorted(pair_keys, cell_keys)
+        net = (cells['entrada_quantity'].to_numpy(dtype=np.int64)
+               - cells['salida_quantity'].to_numpy(dtype=np.int64))
+        replayed = np.bincount(pair_index, weights=net, minlength=len(pair_keys)).astype(np.int64)
+
+        return pd.DataFrame({
+            'warehouse_id': base['warehouse_id'].to_numpy(),
+            'product_id': base['product_id'].to_numpy(),
+            'stock': base['stock'].to_numpy(dtype=np.int64) + replayed
+        })
+
+    def stock_at(self, warehouse_id, product_id, date):
+        """
+        Stock de una pareja al cierre de un día
+
+        Returns:
+            int: Stock
+
+        Raises:
+            KeyError: Si la pareja no existe
+        """
+        stock = self.stock_as_of(date, warehouse_ids=[warehouse_id], product_ids=[product_id])
+        if len(stock) == 0:
+            raise KeyError((warehouse_id, product_id))
+        return int(stock['stock'].iloc[0])
+
+    def _read(self, table, date_column, start, end, pair_filters):
+        """
+        Lee las filas de una tabla con date_column entre start y end (inclusive)
+
+        En Parquet los filtros descartan las particiones de otros meses y los
+        grupos de filas fuera del rango; en los demás formatos se filtra al leer.
+        """
+        months = pd.period_range(start, end, freq='M').strftime('%Y-%m').tolist()
+        filters = [('month', 'in', months), (date_column, '>=', start), (date_column, '<=', end)]
+        df = load_table(table, self.storage_format, self.base_dir, filters=filters + pair_filters)
+
+        mask = (df[date_column] >= start) & (df[date_column] <= end)
+        for column, _, values in pair_filters:
+            mask &= df[column].isin(values)
+        df = df[mask]
+        if table == CHECKPOINT_TABLE:
+            return df.sort_values(['warehouse_id', 'product_id'], kind='stable', ignore_index=True)
+        return df.reset_index(drop=True)
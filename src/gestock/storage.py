@@ -0,0 +1,421 @@
+"""
+Capa de almacenamiento para las tablas de GESTOCK
+Guarda y carga tablas en Parquet, Feather (Arrow IPC) o CSV con tipos explícitos,
+y expone archivos Arrow sin comprimir mediante memory-mapping sin copias
+"""
+
+import glob
+import hashlib
+import os
+import shutil
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .config import FORMATS, raw_dir
+from .schema import apply_schema, date_columns
+
+# Particionamiento de las tablas en Parquet
+PARTITION_COLUMNS = {
+    'transactions': ['business_id', 'month'],
+    'movement_cube': ['month'],
+    'movement_daily_business': ['month'],
+    'stock_eod': ['month'],
+    'stock_checkpoints': ['month']
+}
+
+# Columna de fecha de la que se deriva la partición 'month' de cada tabla
+MONTH_SOURCE_COLUMNS = {
+    'transactions': 'created_at',
+    'movement_cube': 'date',
+    'movement_daily_business': 'date',
+    'stock_eod': 'date',
+    'stock_checkpoints': 'checkpoint_date'
+}
+
+def table_path(table, fmt, base_dir=None):
+    """
+    Devuelve la ruta de una tabla en el formato indicado
+
+    Args:
+        table (str): Nombre de la tabla (p. ej. 'transactions')
+        fmt (str): 'parquet', 'feather', 'arrow' o 'csv'
+        base_dir (str): Directorio base (por defecto, config.raw_dir())
+
+    Returns:
+        str: Ruta del archivo (o directorio, en Parquet particionado)
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato de almacenamiento desconocido: {fmt}")
+    return os.path.join(base_dir or raw_dir(), f"{table}{FORMATS[fmt]}")
+
+def detect_format(table, base_dir=None):
+    """
+    Detecta el formato de la copia más reciente de una tabla
+
+    Returns:
+        str: Formato encontrado
+
+    Raises:
+        FileNotFoundError: Si la tabla no existe en ningún formato
+    """
+    base_dir = base_dir or raw_dir()
+    existing = [
+        (os.path.getmtime(table_path(table, fmt, base_dir)), fmt)
+        for fmt in FORMATS
+        if os.path.exists(table_path(table, fmt, base_dir))
+    ]
+    if not existing:
+        raise FileNotFoundError(f"No existe la tabla {table} en {base_dir}")
+    return max(existing)[1]
+
+def save_table(df, table, fmt='parquet', base_dir=None, append=False):
+    """
+    Guarda una tabla en el formato indicado
+
+    En Parquet, las tablas con particionamiento (transactions, movement_cube)
+    se escriben como un dataset particionado (ver PARTITION_COLUMNS). Los tipos se fijan con el
+    esquema central (schema.py). CSV se conserva como formato de exportación.
+
+    Con append=True las filas se agregan a la tabla existente: en Parquet
+    particionado se escriben archivos nuevos dentro del dataset y en CSV se
+    añaden al final del archivo, sin reescribir lo anterior. Feather, Arrow y
+    Parquet sin particionar no admiten agregar filas y se reescriben completos.
+
+    Args:
+        df (pandas.DataFrame): Datos de la tabla
+        table (str): Nombre de la tabla
+        fmt (str): 'parquet', 'feather', 'arrow' o 'csv'
+        base_dir (str): Directorio de destino (por defecto, config.raw_dir())
+        append (bool): Agregar las filas a la tabla existente
+
+    Returns:
+        str: Ruta escrita
+    """
+    base_dir = base_dir or raw_dir()
+    path = table_path(table, fmt, base_dir)
+    os.makedirs(base_dir, exist_ok=True)
+
+    df = apply_schema(df.reset_index(drop=True), table)
+    append = append and os.path.exists(path)
+
+    if fmt == 'csv':
+        if append:
+            df.to_csv(path, index=False, encoding='utf-8', mode='a', header=False)
+        else:
+            df.to_csv(path, index=False, encoding='utf-8')
+        return path
+
+    # Solo se particiona por las columnas presentes (las tablas normalizadas no
+    # llevan business_id)
+    partition_cols = [
+        c for c in PARTITION_COLUMNS.get(table, []) if c in df.columns or c == 'month'
+    ] if fmt == 'parquet' else []
+    if append and not partition_cols:
+        df = pd.concat([load_table(table, fmt, base_dir), df], ignore_index=True)
+        append = False
+
+    if fmt == 'feather':
+        df.to_feather(path)
+        return path
+
+    if fmt == 'arrow':
+        _write_arrow(df, path)
+        return path
+
+    # Cada escritura de un dataset crea archivos con nombre único, así que
+    # agregar filas no toca los archivos existentes
+    if os.path.isdir(path) and not append:
+        shutil.rmtree(path)
+    elif os.path.isfile(path) and partition_cols:
+        # Tabla escrita antes como un solo archivo y ahora particionada
+        os.remove(path)
+    if partition_cols:
+        if 'month' in partition_cols:
+            df = df.assign(month=month_labels(df[MONTH_SOURCE_COLUMNS[table]]))
+        df.to_parquet(path, index=False, partition_cols=partition_cols)
+    else:
+        df.to_parquet(path, index=False)
+    return path
+
+def month_labels(dates):
+    """
+    Etiqueta 'YYYY-MM' de cada fecha, como la columna de partición 'month'
+
+    Convierte cada mes distinto una sola vez (Series.dt.strftime formatea fila
+    por fila y domina el tiempo de escritura de tablas de millones de filas).
+
+    Args:
+        dates (pandas.Series): Fechas
+
+    Returns:
+        pandas.Categorical: Mes de cada fecha
+    """
+    codes, months = pd.factorize(dates.to_numpy().astype('datetime64[M]'))
+    return pd.Categorical.from_codes(codes, np.datetime_as_string(months.astype('datetime64[M]'), unit='M'))
+
+def replace_partitions(df, table, fmt='parquet', base_dir=None):
+    """
+    Reemplaza solo las particiones de una tabla que aparecen en df
+
+    En Parquet particionado se reescriben los directorios de partición
+    presentes en df y el resto del dataset no se toca, así que el costo
+    depende de df y no del tamaño de la tabla. Los demás formatos no tienen
+    particiones: se reescribe la tabla completa sin las filas de los meses de df.
+
+    Args:
+        df (pandas.DataFrame): Contenido completo de las particiones a reemplazar
+        table (str): Tabla particionada por mes (ver PARTITION_COLUMNS)
+        fmt (str): 'parquet', 'feather', 'arrow' o 'csv'
+        base_dir (str): Directorio de la tabla (por defecto, config.raw_dir())
+
+    Returns:
+        str: Ruta escrita
+    """
+    base_dir = base_dir or raw_dir()
+    path = table_path(table, fmt, base_dir)
+    month_column = MONTH_SOURCE_COLUMNS[table]
+    if not os.path.exists(path):
+        return save_table(df, table, fmt, base_dir)
+
+    if fmt != 'parquet':
+        months = month_labels(df[month_column]).categories
+        existing = load_table(table, fmt, base_dir)
+        kept = existing[~month_labels(existing[month_column]).isin(months)]
+        merged = pd.concat([kept, df], ignore_index=True).sort_values(month_column, kind='stable')
+        return save_table(merged, table, fmt, base_dir)
+
+    df = apply_schema(df.reset_index(drop=True), table)
+    df = df.assign(month=month_labels(df[month_column]))
+    df.to_parquet(path, index=False, partition_cols=PARTITION_COLUMNS[table],
+                  existing_data_behavior='delete_matching')
+    return path
+
+def load_table(table, fmt=None, base_dir=None, columns=None, filters=None):
+    """
+    Carga una tabla aplicando los tipos del esquema central (schema.py)
+
+    Args:
+        table (str): Nombre de la tabla
+        fmt (str): Formato a leer; por defecto, la copia más reciente
+        base_dir (str): Directorio de origen (por defecto, config.raw_dir())
+        columns (list): Columnas a leer (todas por defecto)
+        filters (list): Filtros de pyarrow para Parquet, p. ej. [('business_id', '=', 3)]
+
+    Returns:
+        pandas.DataFrame: Datos de la tabla
+    """
+    if fmt is None:
+        fmt = detect_format(table, base_dir)
+    path = table_path(table, fmt, base_dir)
+
+    if fmt == 'csv':
+        parse_dates = [c for c in date_columns(table) if columns is None or c in columns]
+        df = pd.read_csv(path, usecols=columns, parse_dates=parse_dates)
+        return apply_schema(df, table)
+
+    if fmt == 'feather':
+        return apply_schema(pd.read_feather(path, columns=columns), table)
+
+    if fmt == 'arrow':
+        return apply_schema(pd.DataFrame(map_table(table, columns, base_dir), copy=False), table)
+
+    df = pd.read_parquet(path, columns=columns, filters=filters)
+    partition_cols = PARTITION_COLUMNS.get(table, [])
+    if partition_cols:
+        # Las columnas de partición se leen como categóricas; el esquema restaura sus tipos
+        if 'month' in df.columns:
+            df = df.drop(columns='month')
+        if 'business_id' in partition_cols and 'business_id' in df.columns:
+            df['business_id'] = df['business_id'].astype(str)
+        if 'id' in df.columns:
+            df = df.sort_values('id', kind='stable').reset_index(drop=True)
+        column_order = columns if columns is not None else _partitioned_column_order(path)
+        df = df[[c for c in column_order if c in df.columns]]
+    return apply_schema(df, table)
+
+def table_version(table, fmt=None, base_dir=None):
+    """
+    Identificador de la versión de los datos de una tabla
+
+    Se calcula con la ruta relativa, el tamaño y la fecha de modificación de
+    cada archivo de la tabla, sin leer los datos: cambia cuando se reescribe o
+    se agrega cualquier archivo (p. ej. al reemplazar una partición).
+
+    Args:
+        table (str): Nombre de la tabla
+        fmt (str): Formato; por defecto, la copia más reciente
+        base_dir (str): Directorio de la tabla (por defecto, config.raw_dir())
+
+    Returns:
+        str: Hash hexadecimal de la versión
+    """
+    if fmt is None:
+        fmt = detect_format(table, base_dir)
+    path = table_path(table, fmt, base_dir)
+    if os.path.isdir(path):
+        files = sorted(glob.glob(os.path.join(path, '**', '*'), recursive=True))
+    else:
+        files = [path]
+
+    digest = hashlib.sha256(f"{table}:{fmt}".encode('utf-8'))
+    for file in files:
+        stat = os.stat(file)
+        digest.update(f"{os.path.relpath(file, path)}:{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+    return digest.hexdigest()
+
+def table_max(table, columns, fmt=None, base_dir=None):
+    """
+    Devuelve el máximo de algunas columnas de una tabla
+
+    En Parquet se usan las estadísticas de los grupos de filas, sin leer los
+    datos; en los demás formatos se leen solo las columnas pedidas.
+
+    Args:
+        table (str): Nombre de la tabla
+        columns (list): Columnas (numéricas o de fecha)
+        fmt (str): Formato a leer; por defecto, la copia más reciente
+        base_dir (str): Directorio de origen (por defecto, config.raw_dir())
+
+    Returns:
+        dict: Columna -> máximo (None si la tabla está vacía)
+    """
+    if fmt is None:
+        fmt = detect_format(table, base_dir)
+
+    if fmt == 'parquet':
+        maxima = _parquet_statistics(table_path(table, fmt, base_dir), columns, 'max')
+        if maxima is not None:
+            return maxima
+
+    df = load_table(table, fmt, base_dir, columns=columns)
+    if len(df) == 0:
+        return {column: None for column in columns}
+    return df[columns].max().to_dict()
+
+def table_min(table, columns, fmt=None, base_dir=None):
+    """
+    Devuelve el mínimo de algunas columnas de una tabla (ver table_max)
+
+    Returns:
+        dict: Columna -> mínimo (None si la tabla está vacía)
+    """
+    if fmt is None:
+        fmt = detect_format(table, base_dir)
+
+    if fmt == 'parquet':
+        minima = _parquet_statistics(table_path(table, fmt, base_dir), columns, 'min')
+        if minima is not None:
+            return minima
+
+    df = load_table(table, fmt, base_dir, columns=columns)
+    if len(df) == 0:
+        return {column: None for column in columns}
+    return df[columns].min().to_dict()
+
+def _parquet_statistics(path, columns, stat):
+    """
+    Máximo o mínimo de columnas a partir de las estadísticas de un archivo o dataset Parquet
+
+    Args:
+        stat (str): 'max' o 'min'
+
+    Returns:
+        dict: Columna -> valor, o None si falta alguna estadística
+    """
+    import pyarrow.parquet as pq
+
+    if os.path.isdir(path):
+        files = glob.glob(os.path.join(path, '**', '*.parquet'), recursive=True)
+    else:
+        files = [path]
+
+    pick = max if stat == 'max' else min
+    values = {column: None for column in columns}
+    for file in files:
+        metadata = pq.ParquetFile(file).metadata
+        for group in range(metadata.num_row_groups):
+            row_group = metadata.row_group(group)
+            if row_group.num_rows == 0:
+                continue
+            for index in range(row_group.num_columns):
+                chunk = row_group.column(index)
+                if chunk.path_in_schema not in values:
+                    continue
+                statistics = chunk.statistics
+                if statistics is None or not statistics.has_min_max:
+                    return None
+                current = values[chunk.path_in_schema]
+                value = getattr(statistics, stat)
+                values[chunk.path_in_schema] = value if current is None else pick(current, value)
+    return {
+        column: pd.Timestamp(value) if isinstance(value, datetime) else value
+        for column, value in values.items()
+    }
+
+def _partitioned_column_order(path):
+    """
+    Recupera el orden original de columnas de un dataset Parquet particionado
+
+    Las columnas de partición se leen al final; el orden original se toma de
+    los metadatos de pandas guardados en los archivos del dataset.
+    """
+    import pyarrow.parquet as pq
+
+    files = glob.glob(os.path.join(path, '**', '*.parquet'), recursive=True)
+    if not files:
+        return []
+    metadata = pq.read_schema(files[0]).pandas_metadata or {}
+    return [column['name'] for column in metadata.get('columns', [])]
+
+def _write_arrow(df, path):
+    """
+    Escribe un archivo Arrow IPC sin comprimir con un único lote por columna
+    """
+    import pyarrow as pa
+
+    arrow_table = pa.Table.from_pandas(df, preserve_index=False).combine_chunks()
+    with pa.OSFile(path, 'wb') as sink:
+        with pa.ipc.new_file(sink, arrow_table.schema) as writer:
+            writer.write_table(arrow_table)
+
+def map_table(table, columns=None, base_dir=None):
+    """
+    Abre una tabla Arrow IPC ('arrow') mediante memory-mapping
+
+    Solo se paginan las columnas solicitadas. Las columnas numéricas y de fecha
+    sin nulos se exponen como vistas NumPy de solo lectura sobre el archivo
+    mapeado, sin copias: varios procesos en el mismo host comparten una sola
+    copia en la caché de páginas. Las columnas de texto, booleanas o con nulos
+    se materializan en memoria.
+
+    Args:
+        table (str): Nombre de la tabla (p. ej. 'transactions')
+        columns (list): Columnas a exponer (todas por defecto)
+        base_dir (str): Directorio de origen (por defecto, config.raw_dir())
+
+    Returns:
+        dict: Nombre de columna -> numpy.ndarray o pandas.Series
+    """
+    import pyarrow as pa
+
+    source = pa.memory_map(table_path(table, 'arrow', base_dir), 'r')
+    arrow_table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        arrow_table = arrow_table.select(list(columns))
+
+    arrays = {}
+    for name, column in zip(arrow_table.column_names, arrow_table.columns):
+        zero_copy = (
+            column.num_chunks == 1
+            and column.null_count == 0
+            and (pa.types.is_integer(column.type)
+                 or pa.types.is_floating(column.type)
+                 or pa.types.is_timestamp(column.type))
+        )
+        if zero_copy:
+            arrays[name] = column.chunk(0).to_numpy(zero_copy_only=True)
+        else:
+            arrays[name] = column.to_pandas()
+    return arrays
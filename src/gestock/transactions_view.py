@@ -0,0 +1,103 @@
+"""
+Vista perezosa de transacciones desnormalizadas para GESTOCK
+Une la tabla de hechos normalizada (solo IDs) con las dimensiones bajo demanda
+"""
+
+import pandas as pd
+
+from .dimension_lookups import DimensionLookups
+from .schema import TABLE_SCHEMAS
+
+# Columnas copiadas de las dimensiones en la salida desnormalizada, en orden
+DENORMALIZED_COLUMNS = [
+    'product_name', 'product_category', 'warehouse_name', 'business_id', 'user_name'
+]
+
+class TransactionsView:
+    """
+    Vista de transacciones que materializa columnas desnormalizadas al pedirlas
+
+    La tabla de hechos solo guarda IDs. Las columnas de DENORMALIZED_COLUMNS se
+    calculan con búsquedas densas por ID la primera vez que se solicitan y se
+    guardan en caché. Las de texto se construyen directamente como categóricas
+    a partir de los códigos de las dimensiones, sin materializar cadenas por fila.
+    """
+
+    def __init__(self, fact_df, products_df, warehouses_df, users_df):
+        """
+        Args:
+            fact_df (pandas.DataFrame): Transacciones normalizadas (IDs)
+            products_df (pandas.DataFrame): DataFrame con productos
+            warehouses_df (pandas.DataFrame): DataFrame con almacenes
+            users_df (pandas.DataFrame): DataFrame con usuarios
+        """
+        self.fact = fact_df
+        self._dimensions = (products_df, warehouses_df, users_df)
+        self._lookups = None
+        self._cache = {}
+
+    @property
+    def columns(self):
+        """Columnas disponibles: las de la tabla de hechos más las desnormalizadas"""
+        return list(self.fact.columns) + [c for c in DENORMALIZED_COLUMNS if c not in self.fact.columns]
+
+    def __len__(self):
+        return len(self.fact)
+
+    def __getitem__(self, column):
+        if column in self.fact.columns:
+            return self.fact[column]
+        if column not in DENORMALIZED_COLUMNS:
+            raise KeyError(column)
+        if column not in self._cache:
+            self._cache[column] = self._materialize(column)
+        return self._cache[column]
+
+    def to_frame(self, columns=None):
+        """
+        Materializa la vista como DataFrame
+
+        Args:
+            columns (list): Columnas a incluir (por defecto, todas)
+
+        Returns:
+            pandas.DataFrame: Transacciones con las columnas solicitadas
+        """
+        if columns is None:
+            columns = self.columns
+        return pd.DataFrame({column: self[column] for column in columns}, index=self.fact.index)
+
+    def _materialize(self, column):
+        """
+        Calcula una columna desnormalizada a partir de las dimensiones
+        """
+        if self._lookups is None:
+            self._lookups = DimensionLookups(*self._dimensions)
+        lookups = self._lookups
+
+        product_ids = self.fact['product_id'].to_numpy()
+        warehouse_ids = self.fact['warehouse_id'].to_numpy()
+
+        if column == 'product_name':
+            values = pd.Categorical.from_codes(lookups.product_name[product_ids], lookups.product_names)
+        elif column == 'product_category':
+            values = pd.Categorical.from_codes(lookups.product_category[product_ids], lookups.categories)
+        elif column == 'warehouse_name':
+            values = pd.Categorical.from_codes(lookups.warehouse_name[warehouse_ids], lookups.warehouse_names)
+        elif column == 'user_name':
+            user_ids = self.fact['user_id'].to_numpy()
+            values = pd.Categorical.from_codes(lookups.user_name[user_ids], lookups.user_names)
+        else:  # business_id
+            values = lookups.warehouse_business[warehouse_ids].astype(
+                TABLE_SCHEMAS['transactions']['business_id']
+            )
+        return pd.Series(values, index=self.fact.index, name=column)
+
+def denormalize_transactions(fact_df, products_df, warehouses_df, users_df):
+    """
+    Reconstruye el DataFrame de transacciones desnormalizado
+
+    Returns:
+        pandas.DataFrame: Mismo esquema que generate_transactions(normalized=False)
+    """
+    return TransactionsView(fact_df, products_df, warehouses_df, users_df).to_frame()
@@ -0,0 +1,393 @@
+"""
+Motor de validación vectorizado para los datos transaccionales de GESTOCK
+Cada regla es una operación sobre arreglos de enteros (mapas de bits, gathers
+densos por ID) y devuelve las filas que la incumplen, sin merges ni sets de Python
+"""
+
+import numpy as np
+
+from .dimension_lookups import _dense_index
+
+# Tamaño máximo (en IDs) de un mapa de bits de pertenencia; por encima se usa
+# np.isin con ordenamiento
+MAX_BITMAP_SIZE = 1 << 27
+
+
+class ValidationIssue:
+    """
+    Incumplimiento de una regla de validación
+
+    Attributes:
+        rule (str): Identificador de la regla (p. ej. 'transactions.user_fk')
+        severity (str): 'error' o 'warning'
+        message (str): Mensaje para mostrar
+        table (str): Tabla en la que están las filas
+        rows (numpy.ndarray): Posiciones (0-based) de las filas que incumplen la regla
+    """
+
+    def __init__(self, rule, severity, message, table, rows):
+        self.rule = rule
+        self.severity = severity
+        self.message = message
+        self.table = table
+        self.rows = rows
+
+    def __repr__(self):
+        return f"ValidationIssue({self.rule!r}, {self.severity!r}, rows={len(self.rows)})"
+
+
+class ValidationReport:
+    """
+    Resultado estructurado de una validación
+
+    Solo contiene las reglas incumplidas; un reporte sin errores es válido.
+    """
+
+    def __init__(self):
+        self.issues = []
+
+    def add(self, rule, severity, message, table, rows):
+        """
+        Registra una regla incumplida si hay filas que la violan
+
+        Args:
+            rows (numpy.ndarray): Posiciones de las filas; vacío si la regla se cumple
+        """
+        if len(rows):
+            self.issues.append(ValidationIssue(rule, severity, message, table, rows))
+
+    @property
+    def errors(self):
+        """Incumplimientos con severidad 'error'"""
+        return [issue for issue in self.issues if issue.severity == 'error']
+
+    @property
+    def warnings(self):
+        """Incumplimientos con severidad 'warning'"""
+        return [issue for issue in self.issues if issue.severity == 'warning']
+
+    @property
+    def is_valid(self):
+        """True si no hay errores (las advertencias no invalidan los datos)"""
+        return not self.errors
+
+    def offending_rows(self, rule):
+        """
+        Devuelve las filas que incumplen una regla
+
+        Returns:
+            numpy.ndarray: Posiciones de las filas (vacío si la regla se cumple)
+        """
+        for issue in self.issues:
+            if issue.rule == rule:
+                return issue.rows
+        return np.empty(0, dtype=np.int64)
+
+def _missing_rows(values, valid_ids):
+    """
+    Filas cuyo valor no pertenece al conjunto de IDs válidos (clave foránea)
+
+    Con IDs no negativos y acotados se usa un mapa de bits indexado por ID;
+    en otro caso, np.isin con ordenamiento.
+
+    Returns:
+        numpy.ndarray: Posiciones de las filas con IDs inexistentes
+    """
+    values = np.asarray(values)
+    valid_ids = np.asarray(valid_ids)
+    if len(valid_ids) == 0:
+        return np.arange(len(values))
+
+    low, high = int(valid_ids.min()), int(valid_ids.max())
+    if low >= 0 and high < MAX_BITMAP_SIZE:
+        bitmap = np.zeros(high + 1, dtype=bool)
+        bitmap[valid_ids] = True
+        inside = (values >= 0) & (values <= high)
+        found = np.zeros(len(values), dtype=bool)
+        found[inside] = bitmap[values[inside]]
+    else:
+        found = np.isin(values, valid_ids, kind='sort')
+    return np.flatnonzero(~found)
+
+def _duplicate_rows(values):
+    """
+    Filas cuyo valor ya apareció en una fila anterior
+
+    Si los valores son estrictamente crecientes (IDs consecutivos) basta una
+    pasada; si no, se ordenan una vez de forma estable.
+
+    Returns:
+        numpy.ndarray: Posiciones de las repeticiones, en orden
+    """
+    values = np.asarray(values)
+    if len(values) < 2 or (values[1:] > values[:-1]).all():
+        return np.empty(0, dtype=np.int64)
+    order = np.argsort(values, kind='stable')
+    sorted_values = values[order]
+    repeated = sorted_values[1:] == sorted_values[:-1]
+    return np.sort(order[1:][repeated])
+
+def _gather(dense, ids):
+    """
+    Busca ids en un arreglo denso; los IDs fuera de rango devuelven -1
+    """
+    result = np.full(len(ids), -1, dtype=dense.dtype)
+    inside = (ids >= 0) & (ids < len(dense))
+    result[inside] = dense[ids[inside]]
+    return result
+
+def _invalid_type_rows(types, valid_types):
+    """
+    Filas con un tipo de transacción fuera de valid_types
+    """
+    if hasattr(types, 'cat'):
+        categories = np.asarray(types.cat.categories)
+        valid_codes = np.flatnonzero(np.isin(categories, list(valid_types)))
+        codes = types.cat.codes.to_numpy()
+        return _missing_rows(codes, valid_codes)
+    return np.flatnonzero(~types.isin(list(valid_types)).to_numpy())
+
+def validate_tables(users_df, warehouse_products_df, transactions_df,
+                    businesses_df, warehouses_df, products_df):
+    """
+    Valida la integridad de los datos transaccionales con reglas vectorizadas
+
+    Cada tabla se recorre una sola vez por regla y sin copias intermedias de
+    tamaño de fila más allá de máscaras booleanas y arreglos de enteros:
+    las claves foráneas se comprueban con mapas de bits y la coherencia entre
+    negocios con gathers densos por ID.
+
+    Args:
+        users_df: DataFrame con usuarios
+        warehouse_products_df: DataFrame con stock
+        transactions_df: DataFrame con transacciones (normalizado o no)
+        businesses_df: DataFrame con negocios
+        warehouses_df: DataFrame con almacenes
+        products_df: DataFrame con productos
+
+    Returns:
+        ValidationReport: Reglas incumplidas con las filas que las violan
+    """
+    report = ValidationReport()
+
+    user_ids = users_df['id'].to_numpy()
+    warehouse_ids = warehouses_df['id'].to_numpy()
+    product_ids = products_df['id'].to_numpy()
+
+    # Usuarios
+    report.add('users.duplicate_id', 'error', "❌ IDs duplicados en users",
+               'users', _duplicate_rows(user_ids))
+    report.add('users.duplicate_email', 'error', "❌ Emails duplicados en users",
+               'users', np.flatnonzero(users_df['email'].duplicated().to_numpy()))
+
+    active = users_df['is_active'].to_numpy(dtype=bool)
+    business_ids = businesses_df['id'].to_numpy()
+    without_active = _missing_rows(business_ids, users_df['business_id'].to_numpy()[active])
+    report.add('businesses.no_active_users', 'warning',
+               f"⚠️ Negocios sin usuarios activos: {set(business_ids[without_active].tolist())}",
+               'businesses', without_active)
+
+    # Stock
+    stock = warehouse_products_df['stock']
+    report.add('warehouse_products.null_stock', 'error', "❌ Valores nulos en stock",
+               'warehouse_products', np.flatnonzero(stock.isna().to_numpy()))
+    report.add('warehouse_products.negative_stock', 'error', "❌ Stock negativo encontrado",
+               'warehouse_products', np.flatnonzero((stock < 0).to_numpy()))
+    report.add('warehouse_products.warehouse_fk', 'error', "❌ Stock con warehouse_id inexistentes",
+               'warehouse_products',
+               _missing_rows(warehouse_products_df['warehouse_id'].to_numpy(), warehouse_ids))
+    report.add('warehouse_products.product_fk', 'error', "❌ Stock con product_id inexistentes",
+               'warehouse_products',
+               _missing_rows(warehouse_products_df['product_id'].to_numpy(), product_ids))
+
+    # Transacciones
+    if len(transactions_df) == 0:
+        report.add('transactions.empty', 'error', "❌ No se generaron transacciones",
+                   'transactions', np.zeros(1, dtype=np.int64))
+        return report
+
+    report.add('transactions.duplicate_id', 'error', "❌ IDs duplicados en transactions",
+               'transactions', _duplicate_rows(transactions_df['id'].to_numpy()))
+
+    invalid_types = _invalid_type_rows(transactions_df['type'], {'ENTRADA', 'SALIDA'})
+    report.add('transactions.invalid_type', 'error',
+               f"❌ Tipos de transacción inválidos: "
+               f"{set(transactions_df['type'].iloc[invalid_types[:1000]].astype(str))}",
+               'transactions', invalid_types)
+
+    report.add('transactions.non_positive_quantity', 'error',
+               "❌ Cantidades negativas o cero en transactions",
+               'transactions', np.flatnonzero(transactions_df['quantity'].to_numpy() <= 0))
+
+    tx_users = transactions_df['user_id'].to_numpy()
+    tx_products = transactions_df['product_id'].to_numpy()
+    tx_warehouses = transactions_df['warehouse_id'].to_numpy()
+
+    report.add('transactions.user_fk', 'error', "❌ Transacciones con user_id inexistentes",
+               'transactions', _missing_rows(tx_users, user_ids))
+    report.add('transactions.product_fk', 'error', "❌ Transacciones con product_id inexistentes",
+               'transactions', _missing_rows(tx_products, product_ids))
+    report.add('transactions.warehouse_fk', 'error', "❌ Transacciones con warehouse_id inexistentes",
+               'transactions', _missing_rows(tx_warehouses, warehouse_ids))
+
+    # Coherencia de negocio: el usuario y el almacén de cada transacción
+    # deben pertenecer al mismo negocio (solo filas con ambas claves válidas).
+    # Los arreglos densos se reducen a int32 para acotar la memoria por fila
+    warehouse_business = _gather(
+        _dense_index(warehouse_ids, warehouses_df['business_id'].to_numpy()).astype(np.int32),
+        tx_warehouses
+    )
+    user_business = _gather(
+        _dense_index(user_ids, users_df['business_id'].to_numpy()).astype(np.int32),
+        tx_users
+    )
+    mismatch = np.flatnonzero(
+        (warehouse_business != user_business) & (warehouse_business >= 0) & (user_business >= 0)
+    )
+    report.add('transactions.business_mismatch', 'error',
+               f"❌ {len(mismatch)} transacciones con usuarios de diferente negocio que el almacén",
+               'transactions', mismatch)
+
+    # Fechas: el esquema ya las entrega como datetime64, no se vuelven a parsear
+    created_at = transactions_df['created_at'].to_numpy()
+    if np.issubdtype(created_at.dtype, np.datetime64):
+        invalid_dates = np.flatnonzero(np.isnat(created_at))
+    else:
+        invalid_dates = np.flatnonzero(transactions_df['created_at'].isna().to_numpy())
+    report.add('transactions.invalid_created_at', 'error', "❌ Fechas inválidas en transactions",
+               'transactions', invalid_dates)
+
+    return report
+
+class _PairIndex:
+    """
+    Posición de cada pareja producto-almacén en una tabla warehouse_products
+
+    Con IDs acotados se usa una matriz densa [product_id, warehouse_id]; si
+    no, búsqueda binaria sobre claves de 64 bits ordenadas.
+    """
+
+    def __init__(self, product_ids, warehouse_ids):
+        product_ids = np.asarray(product_ids, dtype=np.int64)
+        warehouse_ids = np.asarray(warehouse_ids, dtype=np.int64)
+        self._dense = None
+        if len(product_ids) and product_ids.min() >= 0 and warehouse_ids.min() >= 0:
+            shape = (int(product_ids.max()) + 1, int(warehouse_ids.max()) + 1)
+            if shape[0] * shape[1] < MAX_BITMAP_SIZE // 4:
+                self._dense = np.full(shape, -1, dtype=np.int32)
+                self._dense[product_ids, warehouse_ids] = np.arange(len(product_ids))
+                return
+        keys = (product_ids << 32) | warehouse_ids
+        self._order = np.argsort(keys, kind='stable')
+        self._keys = keys[self._order]
+
+    def locate(self, product_ids, warehouse_ids):
+        """
+        Returns:
+            numpy.ndarray: Posición (int32) de cada pareja, o -1 si no existe
+        """
+        product_ids = np.asarray(product_ids)
+        warehouse_ids = np.asarray(warehouse_ids)
+        if self._dense is not None:
+            result = np.full(len(product_ids), -1, dtype=np.int32)
+            inside = ((product_ids >= 0) & (product_ids < self._dense.shape[0])
+                      & (warehouse_ids >= 0) & (warehouse_ids < self._dense.shape[1]))
+            result[inside] = self._dense[product_ids[inside], warehouse_ids[inside]]
+            return result
+        if len(self._keys) == 0:
+            return np.full(len(product_ids), -1, dtype=np.int32)
+        keys = (product_ids.astype(np.int64) << 32) | warehouse_ids.astype(np.int64)
+        slot = np.minimum(np.searchsorted(self._keys, keys), len(self._keys) - 1)
+        return np.where(self._keys[slot] == keys, self._order[slot], -1).astype(np.int32)
+
+def validate_stock_ledger(initial_stock_df, final_stock_df, transactions_df):
+    """
+    Reproduce el libro de movimientos y verifica el stock de cada pareja
+
+    Las transacciones se ordenan una sola vez por (product_id, warehouse_id,
+    created_at, id) y el saldo de cada pareja se obtiene con una suma
+    acumulada agrupada: stock inicial + ENTRADAS - SALIDAS hasta cada
+    movimiento. Se comprueba que el saldo nunca sea negativo y que el saldo
+    final coincida con el stock final guardado.
+
+    Args:
+        initial_stock_df: DataFrame warehouse_products con el stock inicial
+        final_stock_df: DataFrame warehouse_products con el stock final
+        transactions_df: DataFrame con transacciones (normalizado o no)
+
+    Returns:
+        ValidationReport: Reglas 'ledger.*' incumplidas; las filas de
+        'ledger.negative_balance' son las transacciones en las que el saldo
+        queda negativo y las de 'ledger.final_mismatch' son filas de final_stock_df
+    """
+    report = ValidationReport()
+
+    # Posición de cada pareja en el stock inicial
+    pairs = _PairIndex(initial_stock_df['product_id'].to_numpy(),
+                       initial_stock_df['warehouse_id'].to_numpy())
+    initial_stock = initial_stock_df['stock'].to_numpy(dtype=np.int64)
+
+    pair_pos = pairs.locate(transactions_df['product_id'].to_numpy(),
+                            transactions_df['warehouse_id'].to_numpy())
+    unknown = np.flatnonzero(pair_pos < 0)
+    report.add('ledger.unknown_pair', 'error',
+               "❌ Transacciones sobre parejas producto-almacén sin stock inicial",
+               'transactions', unknown)
+
+    # Arreglos por fila en int32 (la suma acumulada sí se lleva en int64)
+    quantity = transactions_df['quantity'].to_numpy(dtype=np.int32)
+    delta = np.where((transactions_df['type'] == 'SALIDA').to_numpy(), -quantity, quantity)
+
+    # Orden (pareja, fecha, id). Si el id ya sigue el orden temporal basta
+    # ordenar por pareja conservando el orden de fila: pareja y fila se
+    # empaquetan en un int64 y se ordenan los valores (mucho más rápido que
+    # un argsort estable). Las parejas desconocidas (-1) quedan al principio
+    tx_ids = transactions_df['id'].to_numpy()
+    created_at = np.asarray(transactions_df['created_at'].to_numpy(), dtype='datetime64[s]').view(np.int64)
+    chronological = len(tx_ids) < 2 or (
+        (tx_ids[1:] > tx_ids[:-1]).all() and (created_at[1:] >= created_at[:-1]).all()
+    )
+    if chronological:
+        packed = (pair_pos.astype(np.int64) << 32) | np.arange(len(pair_pos), dtype=np.int64)
+        packed.sort()
+        order = packed[np.searchsorted(packed, 0):] & 0xFFFFFFFF
+        del packed
+    else:
+        order = np.lexsort((tx_ids, created_at, pair_pos))
+        order = order[pair_pos[order] >= 0]
+
+    net = np.zeros(len(initial_stock), dtype=np.int64)
+    if len(order):
+        pos = pair_pos[order]
+        sorted_delta = delta[order]
+        del delta
+
+        # Saldo acumulado por pareja: suma global menos el acumulado previo a
+        # cada grupo más el stock inicial, calculado en el mismo arreglo
+        group_first = np.flatnonzero(np.r_[True, pos[1:] != pos[:-1]])
+        group_sizes = np.diff(np.r_[group_first, len(pos)])
+        balance = np.cumsum(sorted_delta, dtype=np.int64)
+        group_offset = balance[group_first] - sorted_delta[group_first]
+        del sorted_delta
+        balance -= np.repeat(group_offset - initial_stock[pos[group_first]], group_sizes)
+
+        negative = np.sort(order[balance < 0])
+        negative_pairs = len(np.unique(pair_pos[negative]))
+        report.add('ledger.negative_balance', 'error',
+                   f"❌ {len(negative)} movimientos dejan stock negativo en {negative_pairs} parejas",
+                   'transactions', negative)
+
+        group_last = np.r_[group_first[1:] - 1, len(pos) - 1]
+        net[pos[group_first]] = balance[group_last] - initial_stock[pos[group_first]]
+
+    # Stock final esperado = inicial + movimientos netos
+    final_pos = pairs.locate(final_stock_df['product_id'].to_numpy(),
+                             final_stock_df['warehouse_id'].to_numpy())
+    final_stock = final_stock_df['stock'].to_numpy(dtype=np.int64)
+    expected = np.where(final_pos >= 0, (initial_stock + net)[final_pos], -1)
+    mismatch = np.flatnonzero((final_pos < 0) | (final_stock != expected))
+    report.add('ledger.final_mismatch', 'error',
+               f"❌ {len(mismatch)} parejas con stock final distinto de inicial + ENTRADAS - SALIDAS",
+               'warehouse_products', mismatch)
+
+    return report
@@ -0,0 +1,77 @@
+"""
+Datos de prueba compartidos: un conjunto pequeño generado con semilla
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from gestock import config
+from gestock.generate_businesses import generate_businesses
+from gestock.generate_products import generate_products
+from gestock.generate_transactions import generate_transactions_parallel
+from gestock.generate_users import generate_users
+from gestock.generate_warehouse_products import generate_warehouse_products
+from gestock.generate_warehouses import generate_warehouses
+from gestock.seeding import REFERENCE_NOW
+from gestock.storage import save_table
+
+SEED = 42
+
+# Días entre el final de seeded_history y el "ahora" de referencia
+HISTORY_GAP_DAYS = 10
+
+@pytest.fixture(scope='session')
+def base_tables():
+    """
+    Tablas base y stock inicial de un conjunto pequeño con semilla
+
+    Returns:
+        dict: businesses, products, warehouses, users y warehouse_products
+    """
+    businesses_df = generate_businesses(8, seed=SEED)
+    products_df = generate_products(85, seed=SEED)
+    warehouses_df = generate_warehouses(businesses_df, (2, 4), seed=SEED)
+    users_df = generate_users(businesses_df, (2, 5), seed=SEED)
+    warehouse_products_df = generate_warehouse_products(businesses_df, warehouses_df, products_df, seed=SEED)
+    return {
+        'businesses': businesses_df,
+        'products': products_df,
+        'warehouses': warehouses_df,
+        'users': users_df,
+        'warehouse_products': warehouse_products_df
+    }
+
+@pytest.fixture
+def data_dirs(tmp_path, monkeypatch):
+    """
+    Directorios de datos temporales (raw/ y processed/ bajo tmp_path)
+
+    Returns:
+        pathlib.Path: Directorio base
+    """
+    monkeypatch.setattr(config, '_dirs', {})
+    config.configure_dirs(data_dir=tmp_path)
+    return tmp_path
+
+@pytest.fixture
+def seeded_history(base_tables, data_dirs):
+    """
+    Tablas base e historia guardadas en raw/; la historia termina
+    HISTORY_GAP_DAYS antes del "ahora" de referencia, lista para una
+    actualización incremental
+
+    Returns:
+        pandas.DataFrame: Transacciones guardadas
+    """
+    for table in ('businesses', 'products', 'warehouses', 'users'):
+        save_table(base_tables[table], table)
+    transactions_df, updated_stock_df = generate_transactions_parallel(
+        base_tables['warehouse_products'], base_tables['users'], base_tables['warehouses'],
+        base_tables['products'], base_tables['businesses'], max_workers=1, seed=SEED,
+        start_date=REFERENCE_NOW - timedelta(days=180),
+        end_date=REFERENCE_NOW - timedelta(days=HISTORY_GAP_DAYS)
+    )
+    save_table(transactions_df, 'transactions')
+    save_table(updated_stock_df, 'warehouse_products')
+    return transactions_df
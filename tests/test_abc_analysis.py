@@ -0,0 +1,67 @@
+"""
+Clasificación ABC contra una referencia que recorre cada grupo
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gestock.abc_analysis import abc_classification, classify_abc
+from gestock.movement_cube import refresh_movement_cube
+
+def _reference_classes(df, group_column, thresholds=(0.8, 0.95)):
+    """Clase de cada fila: grupo por grupo, en orden de valor descendente"""
+    classes = {}
+    for group, rows in df.groupby(group_column, sort=True):
+        rows = rows.sort_values('value', ascending=False, kind='stable')
+        total = rows['value'].sum()
+        preceding = 0.0
+        for index, value in rows['value'].items():
+            share = preceding / total if total > 0 else 1.0
+            classes[index] = 'A' if share < thresholds[0] else 'B' if share < thresholds[1] else 'C'
+            preceding += value
+    return pd.Series(classes).sort_index()
+
+@pytest.mark.parametrize('dtype', [np.int64, np.float64])
+def test_classify_abc_matches_reference(dtype):
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        'warehouse_id': rng.integers(0, 30, 3_000),
+        'item': np.arange(3_000),
+        # Muchos empates y valores en cero
+        'value': (rng.pareto(1.5, 3_000) * 10).astype(np.int64).astype(dtype)
+    })
+    df.loc[df['warehouse_id'] == 7, 'value'] = 0
+
+    result = classify_abc(df, 'warehouse_id')
+    classes = result.set_index('item')['abc_class'].astype(str).sort_index()
+    expected = _reference_classes(df, 'warehouse_id')
+    assert classes.tolist() == expected.tolist()
+    assert (result.loc[result['warehouse_id'] == 7, 'abc_class'] == 'C').all()
+    assert (result.loc[result['rank'] == 1, 'abc_class'][result['share'] > 0] == 'A').all()
+
+@pytest.mark.parametrize('level, group_column', [('warehouse', 'warehouse_id'), ('business', 'business_id')])
+@pytest.mark.parametrize('price_column', ['price', 'cost_price'])
+def test_abc_classification_matches_transactions(seeded_history, base_tables, level, group_column,
+                                                 price_column):
+    refresh_movement_cube()
+    result = abc_classification(level, price_column=price_column)
+
+    # Referencia desde las transacciones: valor de las SALIDAs de cada
+    # producto del surtido del grupo
+    assortment = base_tables['warehouse_products'][['warehouse_id', 'product_id']]
+    assortment = assortment.merge(base_tables['warehouses'][['id', 'business_id']],
+                                  left_on='warehouse_id', right_on='id')
+    salidas = seeded_history[seeded_history['type'] == 'SALIDA']
+    quantity = salidas.groupby([group_column, 'product_id'], observed=True)['quantity'].sum()
+    values = assortment[[group_column, 'product_id']].drop_duplicates().sort_values([group_column, 'product_id'])
+    values = values.join(quantity, on=[group_column, 'product_id']).fillna({'quantity': 0})
+    prices = base_tables['products'].set_index('id')[price_column]
+    values['value'] = values['quantity'] * values['product_id'].map(prices)
+    values = values.reset_index(drop=True)
+    expected = values.assign(abc_class=_reference_classes(values, group_column))
+
+    merged = result.merge(expected, on=[group_column, 'product_id'], suffixes=('', '_expected'))
+    assert len(merged) == len(result) == len(expected)
+    assert (merged['value'] == merged['value_expected']).all()
+    assert (merged['abc_class'].astype(str) == merged['abc_class_expected']).all()
@@ -0,0 +1,55 @@
+"""
+Comparación de benchmarks con una línea base
+"""
+
+from gestock.benchmark import MIN_BYTES_DELTA, compare_results
+
+MB = 1 << 20
+
+def _results(stages):
+    return {'results': {'SF1': {
+        stage: {'seconds': seconds, 'peak_bytes': peak_bytes, 'rows': rows}
+        for stage, (seconds, peak_bytes, rows) in stages.items()
+    }}}
+
+BASELINE = _results({
+    'generate_transactions': (2.0, 100 * MB, 1800),
+    'validation': (1.0, 40 * MB, 1800),
+    'summaries': (0.01, 1 * MB, 1800),
+})
+
+def _flags(comparisons, flag):
+    return sorted((c['stage'], c['metric']) for c in comparisons if c[flag])
+
+def test_regressions_and_improvements_are_flagged():
+    current = _results({
+        'generate_transactions': (3.0, 101 * MB, 1800),   # +50% en tiempo
+        'validation': (0.5, 20 * MB, 1800),               # -50% en tiempo y memoria
+        'summaries': (0.01, 1 * MB, 1800),
+    })
+    comparisons = compare_results(current, BASELINE, threshold=0.2)
+
+    assert _flags(comparisons, 'regression') == [('generate_transactions', 'seconds')]
+    assert _flags(comparisons, 'improvement') == [('validation', 'peak_bytes'), ('validation', 'seconds')]
+    ratio = next(c['ratio'] for c in comparisons if c['stage'] == 'generate_transactions' and c['metric'] == 'seconds')
+    assert ratio == 1.5
+
+def test_small_absolute_changes_are_noise():
+    # Triplicar una etapa de 10 ms o crecer menos de MIN_BYTES_DELTA no es una regresión
+    current = _results({
+        'generate_transactions': (2.0, 100 * MB + MIN_BYTES_DELTA // 2, 1800),
+        'validation': (1.0, 40 * MB, 1800),
+        'summaries': (0.03, 1 * MB, 1800),
+    })
+    comparisons = compare_results(current, BASELINE, threshold=0.2)
+    assert _flags(comparisons, 'regression') == []
+    assert _flags(comparisons, 'improvement') == []
+
+def test_changed_rows_and_new_stages_are_reported_apart():
+    current = _results({
+        'generate_transactions': (2.0, 100 * MB, 3600),
+        'new_stage': (5.0, 10 * MB, 10),
+    })
+    comparisons = compare_results(current, BASELINE)
+    assert {c['stage'] for c in comparisons} == {'generate_transactions'}
+    assert all(c['rows_changed'] for c in comparisons)
@@ -0,0 +1,68 @@
+"""
+CLI `gestock`: subcomandos, opciones globales e importación perezosa
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from gestock import cli, config
+from gestock.seeding import REFERENCE_NOW
+from gestock.storage import load_table
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+def _python(*args):
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, check=False)
+
+def test_scales_describes_the_requested_profiles(capsys):
+    assert cli.main(['scales', 'SF10', 'SF250']) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split(':')[0] for line in lines] == ['SF10', 'SF250']
+    assert '80 negocios' in lines[0]
+
+def test_invalid_scale_exits_with_an_error(capsys):
+    assert cli.main(['scales', 'XL']) == 1
+    assert 'XL' in capsys.readouterr().out
+
+def test_scales_respects_quiet(capsys):
+    assert cli.main(['scales', 'SF10', '--quiet']) == 0
+    assert capsys.readouterr().out == ''
+
+def test_unknown_command_is_rejected():
+    with pytest.raises(SystemExit):
+        cli.main(['deploy'])
+
+def test_global_directories_are_configured(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, '_dirs', {})
+    assert cli.main(['--data-dir', str(tmp_path), 'scales', 'SF1']) == 0
+    assert config.raw_dir() == str(tmp_path / 'raw')
+    assert config.processed_dir() == str(tmp_path / 'processed')
+
+def test_import_and_help_do_not_load_pandas():
+    code = (
+        "import sys, gestock, gestock.cli\n"
+        "assert 'pandas' not in sys.modules and 'numpy' not in sys.modules\n"
+        "gestock.get_scale_profile\n"
+        "assert 'pandas' not in sys.modules\n"
+    )
+    assert _python('-c', code).returncode == 0
+
+def test_python_m_gestock_runs_the_cli():
+    result = _python('-m', 'gestock', 'scales', 'SF1')
+    assert result.returncode == 0
+    assert result.stdout.startswith('SF1:')
+
+def test_generate_incremental_appends_the_new_days(base_tables, seeded_history):
+    assert cli.main(['generate', '--incremental', '--seed', '42', '--quiet']) == 0
+    transactions_df = load_table('transactions')
+    appended = transactions_df[transactions_df['id'] > seeded_history['id'].max()]
+
+    assert len(transactions_df) == len(seeded_history) + len(appended)
+    assert appended['created_at'].min() > seeded_history['created_at'].max()
+    assert appended['created_at'].max().date() == REFERENCE_NOW.date()
+    # Los usuarios no se regeneran
+    assert load_table('users')['id'].tolist() == base_tables['users']['id'].tolist()
@@ -0,0 +1,35 @@
+"""
+Búsquedas densas de DimensionLookups contra las tablas de origen
+"""
+
+import numpy as np
+
+from gestock.dimension_lookups import DimensionLookups, _dense_index
+
+def test_dense_index_fills_missing_ids():
+    dense = _dense_index(np.array([1, 4]), np.array([10, 40]))
+    assert dense.tolist() == [-1, 10, -1, -1, 40]
+
+def test_lookups_match_the_dimension_tables(base_tables):
+    products_df = base_tables['products']
+    warehouses_df = base_tables['warehouses']
+    users_df = base_tables['users']
+    lookups = DimensionLookups(products_df, warehouses_df, users_df)
+
+    for product in products_df.itertuples():
+        assert lookups.categories[lookups.product_category[product.id]] == product.category
+        assert lookups.product_names[lookups.product_name[product.id]] == product.name
+        assert lookups.suppliers[lookups.product_supplier[product.id]] == product.supplier
+    for warehouse in warehouses_df.itertuples():
+        assert lookups.warehouse_names[lookups.warehouse_name[warehouse.id]] == warehouse.name
+        assert lookups.warehouse_business[warehouse.id] == warehouse.business_id
+    for user in users_df.itertuples():
+        assert lookups.user_names[lookups.user_name[user.id]] == user.full_name
+
+def test_active_users_are_grouped_by_business(base_tables):
+    users_df = base_tables['users']
+    lookups = DimensionLookups(base_tables['products'], base_tables['warehouses'], users_df)
+    for business_id in base_tables['businesses']['id']:
+        start, end = lookups.active_users_range(business_id)
+        expected = users_df[(users_df['business_id'] == business_id) & users_df['is_active']]['id']
+        assert sorted(lookups.active_user_ids[start:end].tolist()) == sorted(expected.tolist())
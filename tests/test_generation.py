@@ -0,0 +1,42 @@
+"""
+Reproducibilidad de la generación de transacciones
+"""
+
+import random
+
+import pandas as pd
+import pytest
+
+from gestock import generate_transactions as generator
+from gestock.generate_businesses import generate_businesses
+
+SEED = 42
+
+def _tables(base_tables):
+    return (base_tables['warehouse_products'], base_tables['users'], base_tables['warehouses'],
+            base_tables['products'], base_tables['businesses'])
+
+@pytest.mark.parametrize('mode', ['sequential', 'batched'])
+def test_worker_count_does_not_change_the_result(base_tables, monkeypatch, mode):
+    # Fragmentos de pocas parejas para que SF1 se reparta entre varios procesos
+    monkeypatch.setattr(generator, 'MIN_SHARD_PAIRS', 100)
+    results = [
+        generator.generate_transactions_parallel(*_tables(base_tables), mode=mode, max_workers=workers, seed=SEED)
+        for workers in (1, 3)
+    ]
+    (transactions_df, stock_df), (other_transactions_df, other_stock_df) = results
+    pd.testing.assert_frame_equal(transactions_df, other_transactions_df)
+    pd.testing.assert_frame_equal(stock_df, other_stock_df)
+
+def test_same_seed_same_result_and_other_seed_differs(base_tables):
+    first, _ = generator.generate_transactions(*_tables(base_tables), seed=SEED)
+    again, _ = generator.generate_transactions(*_tables(base_tables), seed=SEED)
+    other, _ = generator.generate_transactions(*_tables(base_tables), seed=SEED + 1)
+    pd.testing.assert_frame_equal(first, again)
+    assert not first[['product_id', 'quantity']].equals(other[['product_id', 'quantity']])
+
+def test_base_generators_do_not_use_the_global_state():
+    first = generate_businesses(8, seed=SEED)
+    random.seed(0)
+    again = generate_businesses(8, seed=SEED)
+    pd.testing.assert_frame_equal(first, again)
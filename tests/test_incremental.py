@@ -0,0 +1,131 @@
+"""
+Modo incremental: agregar días nuevos a las tablas guardadas
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from gestock import config, generate_transactional_data
+from gestock.aggregates import table_keys
+from gestock.generate_transactions import generate_transactions
+from gestock.movement_cube import refresh_movement_cube
+from gestock.seeding import REFERENCE_NOW
+from gestock.storage import load_table, save_table, table_max
+from gestock.validation_engine import validate_stock_ledger
+
+SEED = 42
+
+HISTORY_START = datetime(2025, 1, 1)
+HISTORY_END = datetime(2025, 3, 31, 23, 59, 59)
+
+def _generate(base_tables, stock_df, **options):
+    return generate_transactions(
+        stock_df, base_tables['users'], base_tables['warehouses'],
+        base_tables['products'], base_tables['businesses'], seed=21, **options
+    )
+
+@pytest.fixture
+def raw_dir(base_tables, data_dirs):
+    """
+    Tablas base e historial guardados en el directorio raw/ temporal
+    """
+    raw_dir = str(data_dirs / 'raw')
+    for table in ['businesses', 'warehouses', 'products', 'users']:
+        save_table(base_tables[table], table, base_dir=raw_dir)
+    transactions_df, stock_df = _generate(base_tables, base_tables['warehouse_products'],
+                                          start_date=HISTORY_START, end_date=HISTORY_END)
+    save_table(transactions_df, 'transactions', base_dir=raw_dir)
+    save_table(stock_df, 'warehouse_products', base_dir=raw_dir)
+    return raw_dir
+
+@pytest.mark.parametrize('fmt', ['parquet', 'csv'])
+def test_append_adds_rows_without_rewriting(base_tables, tmp_path, fmt):
+    transactions_df, stock_df = _generate(base_tables, base_tables['warehouse_products'], end_date=HISTORY_END)
+    half = len(transactions_df) // 2
+    save_table(transactions_df.iloc[:half], 'transactions', fmt, str(tmp_path))
+    save_table(transactions_df.iloc[half:], 'transactions', fmt, str(tmp_path), append=True)
+
+    loaded = load_table('transactions', fmt, str(tmp_path))
+    assert loaded['id'].tolist() == transactions_df['id'].tolist()
+    pd.testing.assert_frame_equal(loaded[transactions_df.columns], transactions_df,
+                                  check_categorical=False, check_dtype=False)
+
+@pytest.mark.parametrize('fmt', ['parquet', 'feather', 'csv'])
+def test_table_max_matches_the_data(base_tables, tmp_path, fmt):
+    transactions_df, _ = _generate(base_tables, base_tables['warehouse_products'], end_date=HISTORY_END)
+    save_table(transactions_df, 'transactions', fmt, str(tmp_path))
+
+    maxima = table_max('transactions', ['id', 'created_at'], fmt, str(tmp_path))
+    assert maxima['id'] == transactions_df['id'].max()
+    assert maxima['created_at'] == transactions_df['created_at'].max()
+
+def test_append_continues_ids_and_stock(raw_dir):
+    before = load_table('transactions', base_dir=raw_dir)
+    snapshot_before = load_table('warehouse_products', base_dir=raw_dir)
+    end_date = datetime(2025, 4, 20, 23, 59, 59)
+
+    assert generate_transactional_data.append_transactional_data(end_date=end_date)
+
+    after = load_table('transactions', base_dir=raw_dir)
+    new = after.iloc[len(before):]
+    assert len(new) > 0
+    pd.testing.assert_frame_equal(after.iloc[:len(before)], before)
+    assert new['id'].tolist() == list(range(before['id'].max() + 1, before['id'].max() + len(new) + 1))
+    assert new['created_at'].min() >= pd.Timestamp('2025-04-01')
+    assert new['created_at'].max() <= pd.Timestamp(end_date)
+
+    # El snapshot guardado es el stock final del tramo nuevo
+    snapshot_after = load_table('warehouse_products', base_dir=raw_dir)
+    assert validate_stock_ledger(snapshot_before, snapshot_after, new.reset_index(drop=True)).is_valid
+
+def test_append_without_new_days_is_a_no_op(raw_dir):
+    before = load_table('transactions', base_dir=raw_dir)
+    assert generate_transactional_data.append_transactional_data(end_date=HISTORY_END)
+    pd.testing.assert_frame_equal(load_table('transactions', base_dir=raw_dir), before)
+
+def _processed_tables(tables):
+    return {
+        table: load_table(table, base_dir=config.processed_dir())
+        .sort_values(table_keys(table), ignore_index=True)
+        for table in tables
+    }
+
+def test_incremental_processed_tables_match_a_rebuild(raw_dir, data_dirs):
+    built = refresh_movement_cube()
+    assert generate_transactional_data.append_transactional_data(end_date=datetime(2025, 4, 20, 23, 59, 59), seed=21)
+    incremental = _processed_tables(built)
+
+    config.configure_dirs(processed_dir=data_dirs / 'rebuilt')
+    refresh_movement_cube()
+    rebuilt = _processed_tables(built)
+
+    for table, df in incremental.items():
+        pd.testing.assert_frame_equal(df, rebuilt[table], check_categorical=False, obj=table)
+
+def _appended(history_df):
+    transactions_df = load_table('transactions')
+    return transactions_df[transactions_df['id'] > history_df['id'].max()]
+
+def test_append_simulates_the_days_after_the_history(seeded_history):
+    assert generate_transactional_data.append_transactional_data(seed=SEED)
+    appended = _appended(seeded_history)['created_at']
+
+    first_day = seeded_history['created_at'].max().normalize() + pd.Timedelta(days=1)
+    assert appended.min().normalize() == first_day
+    assert appended.dt.hour.between(8, 18).all()
+    assert appended.max() <= pd.Timestamp(REFERENCE_NOW)
+    assert appended.max().date() == REFERENCE_NOW.date()
+
+def test_append_leaves_the_current_day_for_later(seeded_history):
+    now = datetime(2025, 7, 3, 9, 30)
+    assert generate_transactional_data.append_transactional_data(seed=SEED, end_date=now)
+    appended = _appended(seeded_history)['created_at']
+    assert appended.max() < pd.Timestamp('2025-07-03')
+
+    # La siguiente actualización empieza en el día que quedó pendiente
+    assert generate_transactional_data.append_transactional_data(seed=SEED, end_date=datetime(2025, 7, 4))
+    transactions_df = load_table('transactions')
+    assert transactions_df['created_at'].max().date().isoformat() == '2025-07-03'
+    assert transactions_df['id'].is_unique
@@ -0,0 +1,113 @@
+"""
+Instrumentación: eventos de etapas, contadores anidados y sumideros
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from gestock import instrumentation
+from gestock.generate_transactions import generate_transactions
+from gestock.instrumentation import MemorySink
+from gestock.logs import capture_logs
+
+SEED = 42
+
+@pytest.fixture
+def sink():
+    sink = MemorySink()
+    instrumentation.configure([sink])
+    yield sink
+    instrumentation.configure()
+
+def test_disabled_instrumentation_emits_nothing():
+    instrumentation.configure()
+    assert not instrumentation.enabled()
+    with instrumentation.stage('outer') as measured:
+        measured.count('rows', 5)
+    assert measured is instrumentation._NULL_STAGE
+
+def test_nested_counters_roll_up(sink):
+    with instrumentation.stage('outer', scale='SF1') as outer:
+        outer.count('rows', 2)
+        with instrumentation.stage('inner') as inner:
+            inner.count('rows', 3)
+            instrumentation.count('skipped')
+
+    inner_event, outer_event = sink.of_type('stage')
+    assert inner_event['stage'] == 'inner' and inner_event['parent'] == 'outer'
+    assert inner_event['counters'] == {'rows': 3, 'skipped': 1}
+    assert outer_event['counters'] == {'rows': 5, 'skipped': 1}
+    assert outer_event['scale'] == 'SF1' and outer_event['parent'] is None
+    assert outer_event['seconds'] >= inner_event['seconds'] >= 0
+
+def test_stage_is_emitted_when_it_fails(sink):
+    with pytest.raises(RuntimeError):
+        with instrumentation.stage('failing'):
+            raise RuntimeError
+    assert [event['stage'] for event in sink.of_type('stage')] == ['failing']
+
+@pytest.mark.parametrize('mode, sample_name', [('sequential', 'transactions.day'), ('batched', 'transactions.block')])
+def test_generation_samples_count_every_row(base_tables, sink, mode, sample_name):
+    transactions_df, _ = generate_transactions(
+        base_tables['warehouse_products'], base_tables['users'], base_tables['warehouses'],
+        base_tables['products'], base_tables['businesses'], mode=mode, seed=SEED
+    )
+    samples = sink.of_type('sample')
+    assert {event['sample'] for event in samples} == {sample_name}
+    assert sum(event['counters']['rows'] for event in samples) == len(transactions_df)
+
+def test_profile_mode_is_validated():
+    with pytest.raises(ValueError):
+        instrumentation.configure(profile='perf')
+
+def test_tracemalloc_profile_summarizes_top_level_stages(sink):
+    instrumentation.configure([sink], profile='tracemalloc')
+    with instrumentation.stage('outer'):
+        with instrumentation.stage('inner'):
+            data = [bytearray(1024) for _ in range(100)]
+    del data
+    profiles = sink.of_type('profile')
+    assert [event['stage'] for event in profiles] == ['outer']
+    assert profiles[0]['peak_traced_bytes'] > 100 * 1024
+
+def test_json_lines_sink_appends_events(tmp_path):
+    path = tmp_path / 'events' / 'run.jsonl'
+    instrumentation.configure_from_env({'GESTOCK_EVENTS': str(path)})
+    try:
+        with instrumentation.stage('a'):
+            pass
+        with instrumentation.stage('b'):
+            pass
+    finally:
+        instrumentation.configure()
+    events = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert [event['stage'] for event in events] == ['a', 'b']
+
+def test_environment_is_read_on_first_use(tmp_path, monkeypatch):
+    path = tmp_path / 'run.jsonl'
+    monkeypatch.setenv('GESTOCK_EVENTS', str(path))
+    monkeypatch.setattr(instrumentation, '_configured', False)
+    try:
+        assert instrumentation.enabled()
+        with instrumentation.stage('a'):
+            pass
+    finally:
+        instrumentation.configure()
+    assert json.loads(path.read_text(encoding='utf-8'))['stage'] == 'a'
+
+def test_invalid_profile_in_environment_falls_back_with_a_warning():
+    with capture_logs() as buffer:
+        instrumentation.configure_from_env({'GESTOCK_PROFILE': 'perf'})
+    assert instrumentation._profile is None
+    assert 'GESTOCK_PROFILE=perf' in buffer.getvalue()
+
+def test_invalid_profile_does_not_break_the_import():
+    src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+    env = dict(os.environ, PYTHONPATH=src_dir, GESTOCK_PROFILE='perf')
+    code = "from gestock import instrumentation\nwith instrumentation.stage('a'):\n    pass\n"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=False)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,73 @@
+"""
+Salida por logging: niveles, modo silencioso, JSON y captura
+"""
+
+import io
+import json
+import logging
+
+import pytest
+
+from gestock import generate_transactions
+from gestock.generate_businesses import generate_businesses
+from gestock.logs import LOGGER_NAME, capture_logs, configure_logging, get_logger, silenced
+
+@pytest.fixture(autouse=True)
+def restore_logger():
+    logger = logging.getLogger(LOGGER_NAME)
+    state = (logger.level, logger.propagate, list(logger.handlers))
+    yield
+    logger.level, logger.propagate, logger.handlers[:] = state[0], state[1], state[2]
+
+def test_module_loggers_are_children_of_gestock():
+    assert get_logger('generate_users').name == f"{LOGGER_NAME}.generate_users"
+
+def test_package_module_loggers_are_not_prefixed_twice():
+    assert get_logger('gestock.generate_users').name == 'gestock.generate_users'
+    assert get_logger(LOGGER_NAME) is logging.getLogger(LOGGER_NAME)
+    assert generate_transactions.logger.name == 'gestock.generate_transactions'
+
+def test_levels_filter_console_output():
+    stream = io.StringIO()
+    configure_logging('warning', stream=stream)
+    logger = get_logger('tests')
+    logger.info("informativo")
+    logger.warning("advertencia")
+    assert stream.getvalue().splitlines() == ["advertencia"]
+
+def test_quiet_writes_nothing():
+    stream = io.StringIO()
+    configure_logging('info', stream=stream)
+    configure_logging('quiet', stream=stream)
+    generate_businesses(3, seed=1)
+    assert stream.getvalue() == ""
+
+def test_json_format_emits_one_object_per_message():
+    stream = io.StringIO()
+    configure_logging('info', 'json', stream=stream)
+    get_logger('tests').info("  hola  ")
+    event = json.loads(stream.getvalue())
+    assert event['message'] == "hola"
+    assert event['logger'] == f"{LOGGER_NAME}.tests"
+    assert event['level'] == 'INFO'
+
+def test_invalid_level_is_rejected():
+    with pytest.raises(ValueError):
+        configure_logging('verbose')
+
+def test_capture_does_not_change_console_output():
+    stream = io.StringIO()
+    configure_logging('warning', stream=stream)
+    with capture_logs() as captured:
+        get_logger('tests').info("resumen")
+    assert captured.getvalue() == "resumen\n"
+    assert stream.getvalue() == ""
+    assert logging.getLogger(LOGGER_NAME).level == logging.WARNING
+
+def test_silenced_discards_messages_inside_the_block():
+    stream = io.StringIO()
+    configure_logging('info', stream=stream)
+    with silenced():
+        get_logger('tests').warning("oculto")
+    get_logger('tests').info("visible")
+    assert stream.getvalue() == "visible\n"
@@ -0,0 +1,102 @@
+"""
+Cubo diario de movimientos y resúmenes derivados contra las transacciones
+"""
+
+import pandas as pd
+import pytest
+
+from gestock.generate_transactions import generate_transactions
+from gestock.movement_cube import (
+    CUBE_TABLE, MEASURES, build_movement_cube, build_processed_tables, build_stock_eod, load_cube,
+    refresh_movement_cube, rollup
+)
+from gestock.storage import save_table
+
+SEED = 42
+
+@pytest.fixture(scope='module')
+def generated(base_tables):
+    return generate_transactions(
+        base_tables['warehouse_products'], base_tables['users'], base_tables['warehouses'],
+        base_tables['products'], base_tables['businesses'], seed=SEED
+    )
+
+@pytest.fixture(scope='module')
+def transactions_df(generated):
+    return generated[0]
+
+def _expected(transactions_df, keys):
+    # Agregación directa de las transacciones, como referencia
+    frame = transactions_df.assign(
+        entrada_quantity=transactions_df['quantity'].where(transactions_df['type'] == 'ENTRADA', 0),
+        salida_quantity=transactions_df['quantity'].where(transactions_df['type'] == 'SALIDA', 0),
+        entrada_count=(transactions_df['type'] == 'ENTRADA').astype('int64'),
+        salida_count=(transactions_df['type'] == 'SALIDA').astype('int64')
+    )
+    return frame.groupby(keys, observed=True)[MEASURES].sum().astype('int64').sort_index()
+
+def test_cube_matches_a_groupby_of_the_transactions(transactions_df):
+    cube = build_movement_cube(transactions_df)
+    keyed = transactions_df.assign(date=transactions_df['created_at'].dt.floor('D'))
+    expected = _expected(keyed, ['date', 'warehouse_id', 'product_id'])
+
+    assert not cube.duplicated(['date', 'warehouse_id', 'product_id']).any()
+    actual = cube.set_index(['date', 'warehouse_id', 'product_id'])[MEASURES].astype('int64')
+    pd.testing.assert_frame_equal(actual, expected, check_index_type=False)
+
+def test_rollups_match_the_transactions(base_tables, transactions_df):
+    tables = build_processed_tables(transactions_df, base_tables['warehouses'], base_tables['products'])
+
+    daily = tables['movement_daily_business'].set_index(['date', 'business_id'])[MEASURES].astype('int64')
+    keyed = transactions_df.assign(date=transactions_df['created_at'].dt.floor('D'))
+    pd.testing.assert_frame_equal(daily, _expected(keyed, ['date', 'business_id']), check_index_type=False)
+
+    monthly = tables['movement_monthly']
+    monthly = monthly.assign(month=monthly['month'].dt.strftime('%Y-%m'), category=monthly['category'].astype(str))
+    keyed = transactions_df.assign(month=transactions_df['created_at'].dt.strftime('%Y-%m'),
+                                   category=transactions_df['product_category'].astype(str))
+    pd.testing.assert_frame_equal(
+        monthly.set_index(['month', 'business_id', 'category'])[MEASURES].astype('int64'),
+        _expected(keyed, ['month', 'business_id', 'category'])
+    )
+
+def test_stock_eod_replays_the_initial_stock(base_tables, generated):
+    transactions_df, updated_stock_df = generated
+    stock_eod = build_stock_eod(build_movement_cube(transactions_df), updated_stock_df)
+
+    keys = ['warehouse_id', 'product_id']
+    daily = transactions_df.assign(
+        date=transactions_df['created_at'].dt.floor('D'),
+        net=transactions_df['quantity'].where(transactions_df['type'] == 'ENTRADA', -transactions_df['quantity'])
+    ).groupby(keys + ['date'])['net'].sum().reset_index()
+    initial = base_tables['warehouse_products'].set_index(keys)['stock']
+    daily['stock'] = (initial.reindex(pd.MultiIndex.from_frame(daily[keys])).to_numpy()
+                      + daily.groupby(keys)['net'].cumsum().to_numpy())
+
+    expected = daily.sort_values(['date'] + keys, ignore_index=True)
+    assert stock_eod['stock'].astype('int64').tolist() == expected['stock'].tolist()
+
+def test_total_rollup_and_invalid_arguments(transactions_df):
+    cube = build_movement_cube(transactions_df)
+    total = rollup(cube)
+    assert total['entrada_count'].iloc[0] + total['salida_count'].iloc[0] == len(transactions_df)
+    with pytest.raises(ValueError):
+        rollup(cube, grain='week')
+    with pytest.raises(ValueError):
+        rollup(cube, ['user_id'])
+
+def test_refresh_writes_a_month_partitioned_cube(base_tables, generated, data_dirs):
+    transactions_df, updated_stock_df = generated
+    for table in ('warehouses', 'products'):
+        save_table(base_tables[table], table)
+    save_table(transactions_df, 'transactions')
+    save_table(updated_stock_df, 'warehouse_products')
+
+    tables = refresh_movement_cube()
+    month = transactions_df['created_at'].max().strftime('%Y-%m')
+    assert sorted(path.name for path in (data_dirs / 'processed' / f'{CUBE_TABLE}.parquet').iterdir())[-1] == f'month={month}'
+
+    loaded = load_cube(filters=[('month', '=', month)])
+    expected = tables[CUBE_TABLE]
+    expected = expected[expected['date'].dt.strftime('%Y-%m') == month].reset_index(drop=True)
+    pd.testing.assert_frame_equal(loaded, expected, check_dtype=False)
@@ -0,0 +1,44 @@
+"""
+Generación en paralelo por negocio: la unión de los fragmentos es una
+simulación válida de todos los negocios
+"""
+
+import numpy as np
+import pytest
+
+from gestock.generate_transactions import generate_transactions_parallel
+
+def _generate(base_tables, **options):
+    return generate_transactions_parallel(
+        base_tables['warehouse_products'], base_tables['users'], base_tables['warehouses'],
+        base_tables['products'], base_tables['businesses'], max_workers=2, seed=7, **options
+    )
+
+@pytest.mark.parametrize('mode', ['sequential', 'batched'])
+def test_shards_merge_into_one_consistent_table(base_tables, mode):
+    transactions_df, updated_stock_df = _generate(base_tables, mode=mode)
+    assert transactions_df['id'].tolist() == list(range(1, len(transactions_df) + 1))
+    assert transactions_df['created_at'].is_monotonic_increasing
+    assert transactions_df['business_id'].nunique() > 1
+
+    # Cada transacción usa un usuario del negocio de su almacén
+    warehouse_business = base_tables['warehouses'].set_index('id')['business_id']
+    user_business = base_tables['users'].set_index('id')['business_id']
+    assert (transactions_df['warehouse_id'].map(warehouse_business) == transactions_df['business_id']).all()
+    assert (transactions_df['user_id'].map(user_business) == transactions_df['business_id']).all()
+
+    # El stock final de cada pareja vuelve en el orden de entrada y refleja sus movimientos
+    initial_df = base_tables['warehouse_products']
+    assert (updated_stock_df['warehouse_id'].to_numpy() == initial_df['warehouse_id'].to_numpy()).all()
+    assert (updated_stock_df['product_id'].to_numpy() == initial_df['product_id'].to_numpy()).all()
+    signed = transactions_df['quantity'].where(transactions_df['type'] == 'ENTRADA', -transactions_df['quantity'])
+    keys = ['warehouse_id', 'product_id']
+    net = signed.groupby([transactions_df[key] for key in keys]).sum()
+    expected = initial_df.set_index(keys)['stock'].add(net, fill_value=0).astype(np.int64)
+    final = updated_stock_df.set_index(keys)['stock'].astype(np.int64)
+    assert (final.sort_index() == expected.sort_index()).all()
+
+def test_target_is_split_across_businesses(base_tables):
+    transactions_df, _ = _generate(base_tables, target_transactions=3_000)
+    # Cada día genera al menos un evento por negocio, así que el total ronda el objetivo
+    assert 0.7 * 3_000 < len(transactions_df) < 1.5 * 3_000
@@ -0,0 +1,55 @@
+"""
+Pipeline por etapas: orden por dependencias y caché por contenido
+"""
+
+import os
+
+import pytest
+
+from gestock.pipeline import Pipeline, Stage, build_pipeline
+from gestock.storage import load_table
+
+SMALL = {
+    'num_businesses': 3, 'num_products': 20, 'months_back': 1,
+    'target_transactions': 300, 'seed': 5
+}
+BASE_STAGES = ['businesses', 'products', 'warehouses', 'users', 'warehouse_products']
+DOWNSTREAM_STAGES = ['transactions', 'validation', 'summaries', 'movement_cube']
+
+def _run(**params):
+    return build_pipeline(**dict(SMALL, **params)).run()
+
+def test_stages_follow_their_dependencies():
+    order = build_pipeline().order()
+    for name, stage in build_pipeline().stages.items():
+        assert all(order.index(dependency) < order.index(name) for dependency in stage.dependencies)
+
+def test_cycles_are_rejected():
+    stages = [Stage('a', None, inputs={'x': 'b.x'}), Stage('b', None, inputs={'x': 'a.x'})]
+    with pytest.raises(ValueError):
+        Pipeline(stages).order()
+
+def test_unchanged_run_skips_every_stage(data_dirs):
+    first = _run()
+    assert set(first.values()) == {'ejecutada'}
+    second = _run()
+    assert set(second.values()) == {'omitida'}
+
+def test_unseeded_generation_is_never_reused(data_dirs):
+    _run(seed=None)
+    status = _run(seed=None)
+    assert [name for name in BASE_STAGES + ['transactions'] if status[name] != 'ejecutada'] == []
+
+def test_changing_target_reruns_only_the_transaction_stages(data_dirs):
+    _run()
+    published = load_table('transactions', base_dir=str(data_dirs / 'raw'))
+
+    status = _run(target_transactions=600)
+    assert [name for name in BASE_STAGES if status[name] != 'omitida'] == []
+    assert [name for name in DOWNSTREAM_STAGES if status[name] != 'ejecutada'] == []
+
+    # Las tablas publicadas reflejan la nueva ejecución
+    republished = load_table('transactions', base_dir=str(data_dirs / 'raw'))
+    assert len(republished) != len(published)
+    assert os.path.exists(data_dirs / 'raw' / 'businesses.parquet')
+    assert os.path.exists(data_dirs / 'processed' / 'movement_cube.parquet')
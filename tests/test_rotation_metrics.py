@@ -0,0 +1,100 @@
+"""
+Métricas de rotación sobre un cubo pequeño calculado a mano
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gestock.rotation_metrics import ROTATION_TABLE, build_rotation_metrics, refresh_rotation_metrics
+from gestock.config import processed_dir
+from gestock.movement_cube import refresh_movement_cube
+from gestock.storage import load_table
+
+AS_OF = '2025-06-10'
+WINDOWS = {'period_days': 10, 'velocity_days': 5, 'dead_stock_days': 7}
+
+def _cube(rows):
+    cube = pd.DataFrame(rows, columns=['date', 'warehouse_id', 'product_id', 'entrada_quantity', 'salida_quantity'])
+    cube['date'] = pd.to_datetime(cube['date'])
+    return cube
+
+# Período: 2025-06-01 a 2025-06-10; velocidad: 06-06 a 06-10
+CUBE = _cube([
+    ('2025-05-20', 1, 10, 100, 0),   # antes de las ventanas: se ignora
+    ('2025-06-01', 1, 10, 10, 0),
+    ('2025-06-02', 2, 30, 0, 1),
+    ('2025-06-05', 1, 10, 0, 4),
+    ('2025-06-09', 1, 10, 0, 2),
+    ('2025-06-10', 2, 10, 3, 3),
+    ('2025-06-12', 1, 10, 5, 0),     # después del corte: se descuenta del snapshot
+])
+STOCK = pd.DataFrame({
+    'warehouse_id': [2, 1, 1, 2],
+    'product_id': [30, 20, 10, 10],
+    'stock': [4, 7, 9, 0]
+})
+
+@pytest.fixture(scope='module')
+def metrics():
+    return build_rotation_metrics(CUBE, STOCK, AS_OF, **WINDOWS).set_index(['warehouse_id', 'product_id'])
+
+def test_pairs_are_sorted_and_stock_is_taken_at_the_cut_off(metrics):
+    assert metrics.index.tolist() == [(1, 10), (1, 20), (2, 10), (2, 30)]
+    assert metrics['stock'].tolist() == [4, 7, 0, 4]
+    assert (metrics['as_of'] == pd.Timestamp(AS_OF)).all()
+
+def test_moving_pair(metrics):
+    # Cierre diario: 10 x 4 días, 6 x 4 días, 4 x 2 días -> promedio 7.2
+    row = metrics.loc[(1, 10)]
+    assert row['average_stock'] == pytest.approx(7.2)
+    assert row['salida_quantity'] == 6
+    assert row['turnover'] == pytest.approx(6 / 7.2)
+    assert row['days_on_hand'] == pytest.approx(12.0)
+    assert row['salida_velocity'] == pytest.approx(0.4)
+    assert row['days_of_cover'] == pytest.approx(10.0)
+    assert row['last_salida_date'] == pd.Timestamp('2025-06-09')
+    assert not row['dead_stock']
+
+def test_pair_without_movements_is_dead_stock(metrics):
+    row = metrics.loc[(1, 20)]
+    assert row['average_stock'] == pytest.approx(7.0)
+    assert row['turnover'] == 0
+    assert np.isnan(row['days_on_hand']) and np.isnan(row['days_of_cover'])
+    assert pd.isna(row['last_salida_date'])
+    assert row['dead_stock']
+
+def test_zero_average_stock(metrics):
+    # Entra y sale lo mismo el día del corte: promedio 0, sin rotación definida
+    row = metrics.loc[(2, 10)]
+    assert row['average_stock'] == 0
+    assert np.isnan(row['turnover'])
+    assert row['days_on_hand'] == 0
+    assert row['salida_velocity'] == pytest.approx(0.6)
+    assert row['days_of_cover'] == 0
+    assert not row['dead_stock']
+
+def test_old_salida_is_dead_stock(metrics):
+    # Única SALIDA hace 8 días, con dead_stock_days = 7
+    row = metrics.loc[(2, 30)]
+    assert row['average_stock'] == pytest.approx(4.1)
+    assert row['turnover'] == pytest.approx(1 / 4.1)
+    assert row['days_on_hand'] == pytest.approx(41.0)
+    assert np.isnan(row['days_of_cover'])
+    assert row['dead_stock']
+
+def test_cube_pairs_without_stock_are_rejected():
+    with pytest.raises(ValueError):
+        build_rotation_metrics(CUBE, STOCK[STOCK['warehouse_id'] == 1], AS_OF, **WINDOWS)
+
+def test_refresh_reads_the_processed_cube(seeded_history):
+    refresh_movement_cube()
+    written = refresh_rotation_metrics()
+    stored = load_table(ROTATION_TABLE, base_dir=processed_dir())
+    pd.testing.assert_frame_equal(stored, written, check_categorical=False, check_dtype=False)
+    assert len(stored) == len(load_table('warehouse_products'))
+    assert (written['as_of'] == seeded_history['created_at'].max().normalize()).all()
+    # La rotación es SALIDAs / stock promedio en toda la tabla
+    defined = written['average_stock'] > 0
+    assert np.allclose(written.loc[defined, 'turnover'],
+                       written.loc[defined, 'salida_quantity'] / written.loc[defined, 'average_stock'])
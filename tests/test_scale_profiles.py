@@ -0,0 +1,56 @@
+"""
+Perfiles de escala: interpretación de SF<n> y crecimiento de cada dimensión
+"""
+
+import math
+
+import pytest
+
+from gestock.generate_businesses import generate_businesses
+from gestock.generate_products import generate_products
+from gestock.generate_warehouse_products import generate_warehouse_products
+from gestock.generate_warehouses import generate_warehouses
+from gestock.scale_profiles import BASE_PROFILE, get_scale_profile, scale_factor
+
+SEED = 42
+
+@pytest.mark.parametrize('scale, factor', [('SF1', 1), ('sf100', 100), ('SF250', 250), ('SF0.5', 0.5), (3, 3)])
+def test_scale_factor_accepts_profiles_and_numbers(scale, factor):
+    assert scale_factor(scale) == factor
+
+@pytest.mark.parametrize('scale', ['XL', 'SF', 'SF-2', '0'])
+def test_invalid_scales_are_rejected(scale):
+    with pytest.raises(ValueError):
+        scale_factor(scale)
+
+def test_sf1_is_the_demo_size():
+    profile = get_scale_profile('SF1')
+    assert {key: profile[key] for key in BASE_PROFILE} == BASE_PROFILE
+    assert profile['assortment_scale'] == 1.0
+
+def test_dimensions_grow_linearly_and_catalog_with_sqrt():
+    profile = get_scale_profile('SF100')
+    assert profile['num_businesses'] == 100 * BASE_PROFILE['num_businesses']
+    assert profile['target_transactions'] == 100 * BASE_PROFILE['target_transactions']
+    assert profile['num_products'] == round(BASE_PROFILE['num_products'] * math.sqrt(100))
+    assert profile['months_back'] == BASE_PROFILE['months_back']
+
+def test_profiles_beyond_the_id_dtypes_are_rejected():
+    # Hasta 32 almacenes por unidad de escala: SF100000000 no cabe en warehouses.id (int32)
+    assert get_scale_profile('SF5000')['num_businesses'] == 40_000
+    with pytest.raises(ValueError, match='warehouses.id'):
+        get_scale_profile('SF100000000')
+
+def _pairs(scale):
+    profile = get_scale_profile(scale)
+    businesses_df = generate_businesses(profile['num_businesses'], seed=SEED)
+    products_df = generate_products(profile['num_products'], seed=SEED)
+    warehouses_df = generate_warehouses(businesses_df, profile['warehouses_per_business_range'], seed=SEED)
+    warehouse_products_df = generate_warehouse_products(
+        businesses_df, warehouses_df, products_df, seed=SEED, assortment_scale=profile['assortment_scale']
+    )
+    return len(warehouse_products_df) / len(warehouses_df)
+
+def test_assortment_per_warehouse_stays_constant():
+    # Con un catálogo 3x mayor, cada almacén sigue surtiendo lo mismo en promedio
+    assert _pairs('SF9') == pytest.approx(_pairs('SF1'), rel=0.25)
@@ -0,0 +1,79 @@
+"""
+Registro de tipos: conversión a los dtypes declarados y aplicación sin copias
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gestock.schema import TABLE_SCHEMAS, TRANSACTION_TYPE, apply_schema, date_columns
+
+def _raw_transactions():
+    # Como se leerían de un CSV: textos, enteros de 64 bits y fechas como cadenas
+    return pd.DataFrame({
+        'id': [1, 2, 3],
+        'type': ['ENTRADA', 'SALIDA', 'SALIDA'],
+        'quantity': [5, 2, 1],
+        'created_at': ['2025-01-01 08:00:00', '2025-01-01 09:30:15', '2025-01-02 10:00:00'],
+        'business_id': [1, 1, 2],
+        'notes': ['a', 'b', 'c']
+    })
+
+def test_apply_schema_converts_to_declared_dtypes():
+    typed = apply_schema(_raw_transactions(), 'transactions')
+    schema = TABLE_SCHEMAS['transactions']
+
+    assert typed['type'].dtype == TRANSACTION_TYPE
+    assert typed['created_at'].dtype == np.dtype('datetime64[s]')
+    for column in ['id', 'quantity', 'business_id']:
+        assert typed[column].dtype == np.dtype(schema[column])
+    # Las columnas no declaradas conservan su tipo
+    assert typed['notes'].dtype == _raw_transactions()['notes'].dtype
+    assert typed['created_at'].iloc[1] == pd.Timestamp('2025-01-01 09:30:15')
+
+def test_apply_schema_is_free_on_typed_data():
+    typed = apply_schema(_raw_transactions(), 'transactions')
+    assert apply_schema(typed, 'transactions') is typed
+
+@pytest.mark.parametrize('values, expected', [
+    ([True, False], [True, False]),
+    (['True', 'False'], [True, False]),
+    (['true', 'FALSE', ' True '], [True, False, True]),
+    (np.array([1, 0]), [True, False]),
+    (pd.array([True, False], dtype='boolean'), [True, False])
+])
+def test_bool_columns_accept_boolean_values(values, expected):
+    users = apply_schema(pd.DataFrame({'is_active': values}), 'users')
+    assert users['is_active'].dtype == bool
+    assert users['is_active'].tolist() == expected
+
+@pytest.mark.parametrize('values', [
+    ['True', 'yes'],
+    ['1', 'False'],
+    [True, None],
+    [True, np.nan]
+])
+def test_bool_columns_reject_other_values(values):
+    with pytest.raises(ValueError, match='users.is_active'):
+        apply_schema(pd.DataFrame({'is_active': values}), 'users')
+
+def test_bool_error_lists_the_invalid_values():
+    with pytest.raises(ValueError) as error:
+        apply_schema(pd.DataFrame({'is_active': ['true', 'yes', 'no', 'yes']}), 'users')
+    assert "'no'" in str(error.value) and "'yes'" in str(error.value)
+    assert "'true'" not in str(error.value)
+
+def test_date_columns_follow_the_registry():
+    assert date_columns('users') == ['created_at', 'last_login']
+    assert date_columns('warehouse_products') == ['last_updated']
+
+def test_business_ids_beyond_int16_survive():
+    # SF5000 llega a 40.000 empresas
+    businesses_df = pd.DataFrame({'id': [1, 40_000], 'business_id': [40_000, 32_768]})
+    assert apply_schema(businesses_df, 'businesses')['id'].tolist() == [1, 40_000]
+    assert apply_schema(businesses_df, 'warehouses')['business_id'].tolist() == [40_000, 32_768]
+
+@pytest.mark.parametrize('values', [[1, 2**31], [-2**31 - 1, 1], [1.0, 3e9]])
+def test_integer_columns_reject_values_out_of_range(values):
+    with pytest.raises(ValueError, match='products.id'):
+        apply_schema(pd.DataFrame({'id': values}), 'products')
@@ -0,0 +1,36 @@
+"""
+Ventana de fechas de las ejecuciones con semilla
+"""
+
+import pandas as pd
+import pytest
+
+from gestock.generate_transactions import WEEKLY_PATTERNS, generate_transactions
+from gestock.seeding import REFERENCE_NOW
+
+SEED = 42
+
+def _generate(base_tables, mode):
+    transactions_df, _ = generate_transactions(
+        base_tables['warehouse_products'], base_tables['users'], base_tables['warehouses'],
+        base_tables['products'], base_tables['businesses'], mode=mode, seed=SEED
+    )
+    return transactions_df
+
+@pytest.mark.parametrize('mode', ['sequential', 'batched'])
+def test_seeded_window_ends_at_reference_now(base_tables, mode):
+    created_at = _generate(base_tables, mode)['created_at']
+    assert created_at.max() <= pd.Timestamp(REFERENCE_NOW)
+    assert created_at.max().date() == REFERENCE_NOW.date()
+    assert created_at.dt.hour.between(8, 18).all()
+
+@pytest.mark.parametrize('mode', ['sequential', 'batched'])
+def test_weekday_pattern_is_applied_to_the_calendar_day(base_tables, mode):
+    created_at = _generate(base_tables, mode)['created_at']
+    per_weekday = created_at.dt.weekday.value_counts().sort_index()
+    days = pd.Series(pd.date_range(created_at.min().normalize(), REFERENCE_NOW.date()).weekday).value_counts().sort_index()
+    daily = per_weekday / days
+
+    # Domingo es el día de menor actividad y sábado el siguiente
+    quietest = sorted(range(7), key=lambda weekday: WEEKLY_PATTERNS[weekday])[:2]
+    assert daily.sort_values().index[:2].tolist() == quietest
@@ -0,0 +1,67 @@
+"""
+Invariantes del conjunto de parejas con stock de StockState
+"""
+
+import numpy as np
+import pandas as pd
+
+from gestock.stock_engine import StockState
+
+def _state(stock):
+    return StockState(pd.DataFrame({
+        'product_id': np.arange(len(stock)),
+        'warehouse_id': np.zeros(len(stock), dtype=np.int64),
+        'stock': stock,
+        'min_stock': np.full(len(stock), 5),
+        'max_stock': np.full(len(stock), 50)
+    }))
+
+def _assert_invariants(state):
+    members = state._members[:state._size]
+    assert sorted(members.tolist()) == np.flatnonzero(state.stock > 0).tolist()
+    assert (state._slot[members] == np.arange(state._size)).all()
+    outside = np.setdiff1d(np.arange(len(state.stock)), members)
+    assert (state._slot[outside] == -1).all()
+    assert (state.stock >= 0).all()
+    assert state.in_stock_count == len(members)
+
+def test_add_and_remove_keep_the_in_stock_set():
+    rng = np.random.default_rng(0)
+    state = _state(rng.integers(0, 4, 200))
+    expected = state.stock.copy()
+    _assert_invariants(state)
+
+    for _ in range(5_000):
+        pos = int(rng.integers(len(expected)))
+        quantity = int(rng.integers(1, 5))
+        if rng.random() < 0.5:
+            state.add(pos, quantity)
+            expected[pos] += quantity
+        else:
+            removed = state.remove(pos, quantity)
+            assert removed == min(quantity, expected[pos])
+            expected[pos] -= removed
+        _assert_invariants(state)
+    assert (state.stock == expected).all()
+
+def test_set_stock_rebuilds_the_in_stock_set():
+    state = _state(np.array([3, 0, 2, 0, 1]))
+    state.set_stock(np.array([0, 1, 4]), np.array([0, 7, 0]))
+    _assert_invariants(state)
+    assert sorted(state.in_stock_positions().tolist()) == [1, 2]
+
+def test_sampling_only_returns_pairs_with_stock():
+    rng = np.random.default_rng(1)
+    state = _state(np.array([0, 4, 0, 1]))
+    assert {state.sample_in_stock(rng) for _ in range(100)} == {1, 3}
+    state.remove(1, 10)
+    state.remove(3, 1)
+    assert state.sample_in_stock(rng) == -1
+
+def test_to_frame_reports_the_final_stock():
+    state = _state(np.array([2, 0]))
+    state.add(1, 3)
+    state.remove(0, 1)
+    frame = state.to_frame()
+    assert frame.columns[:2].tolist() == ['product_id', 'warehouse_id']
+    assert frame['stock'].tolist() == [1, 3]
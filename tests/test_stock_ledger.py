@@ -0,0 +1,78 @@
+"""
+Reproducción del libro de movimientos: saldos por pareja y stock final
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from gestock.generate_transactions import generate_transactions
+from gestock.validation_engine import validate_stock_ledger
+
+def _stock(rows):
+    return pd.DataFrame(rows, columns=['product_id', 'warehouse_id', 'stock'])
+
+def _transactions(rows):
+    transactions_df = pd.DataFrame(rows, columns=['id', 'type', 'quantity', 'created_at', 'product_id', 'warehouse_id'])
+    transactions_df['created_at'] = pd.to_datetime(transactions_df['created_at'])
+    return transactions_df
+
+INITIAL = _stock([(1, 10, 5), (2, 10, 0), (1, 20, 3)])
+
+def test_consistent_ledger_passes():
+    transactions_df = _transactions([
+        (1, 'SALIDA', 4, '2025-01-01 09:00', 1, 10),
+        (2, 'ENTRADA', 2, '2025-01-01 10:00', 2, 10),
+        (3, 'SALIDA', 3, '2025-01-02 09:00', 1, 20),
+        (4, 'ENTRADA', 6, '2025-01-03 09:00', 1, 10),
+    ])
+    final = _stock([(1, 10, 7), (2, 10, 2), (1, 20, 0)])
+    report = validate_stock_ledger(INITIAL, final, transactions_df)
+    assert report.is_valid
+    assert report.issues == []
+
+def test_negative_running_balance_reports_the_row():
+    # Pareja (1, 10): 5 - 4 = 1, luego - 2 = -1 (fila 2) antes de la ENTRADA
+    transactions_df = _transactions([
+        (1, 'SALIDA', 4, '2025-01-01 09:00', 1, 10),
+        (2, 'ENTRADA', 1, '2025-01-01 10:00', 2, 10),
+        (3, 'SALIDA', 2, '2025-01-02 09:00', 1, 10),
+        (4, 'ENTRADA', 5, '2025-01-03 09:00', 1, 10),
+    ])
+    final = _stock([(1, 10, 4), (2, 10, 1), (1, 20, 3)])
+    report = validate_stock_ledger(INITIAL, final, transactions_df)
+    assert not report.is_valid
+    assert [issue.rule for issue in report.errors] == ['ledger.negative_balance']
+    assert report.offending_rows('ledger.negative_balance').tolist() == [2]
+
+def test_replay_follows_time_order_not_row_order():
+    # La SALIDA aparece antes en las filas pero ocurre después de la ENTRADA
+    transactions_df = _transactions([
+        (2, 'SALIDA', 7, '2025-01-02 09:00', 2, 10),
+        (1, 'ENTRADA', 7, '2025-01-01 09:00', 2, 10),
+        (3, 'SALIDA', 4, '2025-01-01 12:00', 1, 20),
+    ])
+    final = _stock([(1, 10, 5), (2, 10, 0), (1, 20, -1)])
+    report = validate_stock_ledger(INITIAL, final, transactions_df)
+    assert report.offending_rows('ledger.negative_balance').tolist() == [2]
+    assert report.offending_rows('ledger.final_mismatch').tolist() == []
+
+def test_final_mismatch_and_unknown_pair_are_reported():
+    transactions_df = _transactions([
+        (1, 'ENTRADA', 2, '2025-01-01 09:00', 1, 10),
+        (2, 'ENTRADA', 2, '2025-01-01 10:00', 3, 10),
+    ])
+    final = _stock([(1, 10, 7), (2, 10, 1), (1, 20, 3)])
+    report = validate_stock_ledger(INITIAL, final, transactions_df)
+    assert report.offending_rows('ledger.unknown_pair').tolist() == [1]
+    assert report.offending_rows('ledger.final_mismatch').tolist() == [1]
+
+@pytest.mark.parametrize('mode', ['sequential', 'batched'])
+def test_generated_ledger_replays_cleanly(base_tables, mode):
+    transactions_df, stock_df = generate_transactions(
+        base_tables['warehouse_products'], base_tables['users'], base_tables['warehouses'],
+        base_tables['products'], base_tables['businesses'], mode=mode,
+        end_date=datetime(2025, 6, 30, 23, 59, 59), seed=17
+    )
+    assert validate_stock_ledger(base_tables['warehouse_products'], stock_df, transactions_df).is_valid
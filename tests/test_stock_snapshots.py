@@ -0,0 +1,122 @@
+"""
+Checkpoints de stock y consultas as-of contra una reproducción del libro
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gestock.aggregates import apply_transaction_batch
+from gestock.config import processed_dir
+from gestock.generate_transactions import generate_transactions_parallel
+from gestock.movement_cube import (CHECKPOINT_TABLE, build_movement_cube, build_stock_checkpoints,
+                                   refresh_movement_cube)
+from gestock.stock_snapshots import StockSnapshotIndex
+from gestock.storage import load_table, save_table
+
+SEED = 42
+
+def _generate(base_tables, stock_df, start_date, end_date):
+    return generate_transactions_parallel(
+        stock_df, base_tables['users'], base_tables['warehouses'], base_tables['products'],
+        base_tables['businesses'], max_workers=1, seed=SEED, start_date=start_date, end_date=end_date
+    )
+
+@pytest.fixture
+def history(base_tables, data_dirs):
+    """
+    Historia guardada con su cubo y un lote contiguo agregado después
+
+    Returns:
+        tuple: (todas las transacciones, stock inicial, stock final)
+    """
+    for table in ('businesses', 'products', 'warehouses', 'users'):
+        save_table(base_tables[table], table)
+    history_df, stock_df = _generate(base_tables, base_tables['warehouse_products'],
+                                     datetime(2025, 1, 1), datetime(2025, 6, 15, 23, 59, 59))
+    save_table(history_df, 'transactions')
+    save_table(stock_df, 'warehouse_products')
+    refresh_movement_cube()
+
+    batch_df, final_stock_df = _generate(base_tables, stock_df, datetime(2025, 6, 16), datetime(2025, 6, 30, 23, 59, 59))
+    batch_df['id'] += history_df['id'].max()
+    save_table(batch_df, 'transactions', append=True)
+    save_table(final_stock_df, 'warehouse_products')
+    apply_transaction_batch(batch_df, final_stock_df, base_tables['warehouses'], base_tables['products'])
+    return pd.concat([history_df, batch_df], ignore_index=True), base_tables['warehouse_products'], final_stock_df
+
+@pytest.fixture
+def history_with_gap(base_tables, seeded_history):
+    """
+    Cubo construido sobre seeded_history y un lote agregado tres semanas
+    después de su último día
+
+    Returns:
+        tuple: (todas las transacciones, stock inicial, stock final)
+    """
+    refresh_movement_cube()
+    batch_df, final_stock_df = _generate(base_tables, load_table('warehouse_products'),
+                                         datetime(2025, 7, 14), datetime(2025, 7, 27, 23, 59, 59))
+    batch_df['id'] += seeded_history['id'].max()
+    save_table(batch_df, 'transactions', append=True)
+    save_table(final_stock_df, 'warehouse_products')
+    apply_transaction_batch(batch_df, final_stock_df, base_tables['warehouses'], base_tables['products'])
+    return pd.concat([seeded_history, batch_df], ignore_index=True), base_tables['warehouse_products'], final_stock_df
+
+def _replay(transactions_df, initial_stock_df, day):
+    """Stock de cada pareja al cierre de day, sumando transacción por transacción"""
+    stock = initial_stock_df.set_index(['warehouse_id', 'product_id'])['stock'].astype(np.int64).sort_index()
+    moves = transactions_df[transactions_df['created_at'] < pd.Timestamp(day) + pd.Timedelta(days=1)]
+    signed = np.where(moves['type'] == 'SALIDA', -1, 1) * moves['quantity'].to_numpy(dtype=np.int64)
+    net = pd.Series(signed, index=pd.MultiIndex.from_arrays([moves['warehouse_id'], moves['product_id']]))
+    return stock.add(net.groupby(level=[0, 1]).sum(), fill_value=0).astype(np.int64)
+
+def test_checkpoints_are_weekly_mondays(history):
+    transactions_df, _, final_stock_df = history
+    stored = load_table(CHECKPOINT_TABLE, base_dir=processed_dir()).sort_values(
+        ['checkpoint_date', 'warehouse_id', 'product_id'], ignore_index=True)
+    rebuilt = build_stock_checkpoints(build_movement_cube(transactions_df), final_stock_df)
+
+    dates = stored['checkpoint_date'].drop_duplicates()
+    assert (dates.dt.weekday == 0).all()
+    assert (dates.diff().dropna() == pd.Timedelta(days=7)).all()
+    pd.testing.assert_frame_equal(stored, rebuilt, check_categorical=False)
+
+@pytest.mark.parametrize('day', ['2025-01-05', '2025-03-17', '2025-06-15', '2025-06-16', '2025-06-22',
+                                 '2025-06-30', '2025-07-10'])
+def test_stock_as_of_matches_replay(history, day):
+    transactions_df, initial_stock_df, _ = history
+    stock = StockSnapshotIndex().stock_as_of(day).set_index(['warehouse_id', 'product_id'])['stock']
+    assert stock.to_dict() == _replay(transactions_df, initial_stock_df, day).to_dict()
+
+def test_stock_at_single_pair(history):
+    transactions_df, initial_stock_df, _ = history
+    warehouse_id, product_id = transactions_df[['warehouse_id', 'product_id']].iloc[-1]
+    expected = _replay(transactions_df, initial_stock_df, '2025-06-20')
+    index = StockSnapshotIndex()
+    assert index.stock_at(warehouse_id, product_id, '2025-06-20') == expected[(warehouse_id, product_id)]
+    with pytest.raises(KeyError):
+        index.stock_at(warehouse_id, 10**6, '2025-06-20')
+
+def test_stock_before_history_is_rejected(history):
+    with pytest.raises(ValueError):
+        StockSnapshotIndex().stock_as_of('2024-12-01')
+
+def test_appended_checkpoints_have_no_gaps(history_with_gap):
+    transactions_df, _, final_stock_df = history_with_gap
+    stored = load_table(CHECKPOINT_TABLE, base_dir=processed_dir()).sort_values(
+        ['checkpoint_date', 'warehouse_id', 'product_id'], ignore_index=True)
+    rebuilt = build_stock_checkpoints(build_movement_cube(transactions_df), final_stock_df)
+
+    dates = stored['checkpoint_date'].drop_duplicates()
+    assert (dates.diff().dropna() == pd.Timedelta(days=7)).all()
+    pd.testing.assert_frame_equal(stored, rebuilt, check_categorical=False)
+
+@pytest.mark.parametrize('day', ['2025-06-20', '2025-07-01', '2025-07-08', '2025-07-14', '2025-07-20',
+                                 '2025-07-27', '2025-08-10'])
+def test_stock_as_of_across_the_gap_matches_replay(history_with_gap, day):
+    transactions_df, initial_stock_df, _ = history_with_gap
+    stock = StockSnapshotIndex().stock_as_of(day).set_index(['warehouse_id', 'product_id'])['stock']
+    assert stock.to_dict() == _replay(transactions_df, initial_stock_df, day).to_dict()
@@ -0,0 +1,84 @@
+"""
+Capa de almacenamiento: ida y vuelta por formato y Parquet particionado
+"""
+
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gestock.generate_transactions import generate_transactions
+from gestock.schema import TABLE_SCHEMAS
+from gestock.storage import load_table, map_table, save_table
+
+END_DATE = datetime(2025, 6, 30, 23, 59, 59)
+
+@pytest.fixture(scope='module')
+def transactions_df(base_tables):
+    transactions_df, _ = generate_transactions(
+        base_tables['warehouse_products'], base_tables['users'], base_tables['warehouses'],
+        base_tables['products'], base_tables['businesses'], end_date=END_DATE, seed=11
+    )
+    return transactions_df
+
+@pytest.mark.parametrize('fmt', ['parquet', 'feather', 'csv'])
+def test_round_trip_preserves_values_and_dates(base_tables, tmp_path, fmt):
+    users_df = base_tables['users']
+    save_table(users_df, 'users', fmt=fmt, base_dir=str(tmp_path))
+    loaded = load_table('users', base_dir=str(tmp_path))
+
+    assert loaded['created_at'].dtype.kind == 'M'
+    assert isinstance(loaded['role'].dtype, pd.CategoricalDtype)
+    if fmt == 'csv':
+        # CSV no guarda tipos: los teléfonos numéricos vuelven como enteros
+        loaded, users_df = loaded.drop(columns='phone_number'), users_df.drop(columns='phone_number')
+    pd.testing.assert_frame_equal(loaded, users_df, check_categorical=False, check_dtype=False)
+
+def test_transactions_partitioned_by_business_and_month(transactions_df, tmp_path):
+    path = save_table(transactions_df, 'transactions', base_dir=str(tmp_path))
+
+    business_dirs = sorted(os.listdir(path))
+    assert business_dirs == sorted(f"business_id={b}" for b in transactions_df['business_id'].unique())
+    business_id = int(transactions_df['business_id'].iloc[0])
+    months = sorted(os.listdir(os.path.join(path, f"business_id={business_id}")))
+    expected_months = transactions_df.loc[transactions_df['business_id'] == business_id, 'created_at']
+    assert months == sorted(f"month={m}" for m in expected_months.dt.strftime('%Y-%m').unique())
+
+    loaded = load_table('transactions', base_dir=str(tmp_path))
+    assert 'month' not in loaded.columns
+    assert loaded['business_id'].dtype == TABLE_SCHEMAS['transactions']['business_id']
+    pd.testing.assert_frame_equal(
+        loaded[transactions_df.columns], transactions_df, check_categorical=False, check_dtype=False
+    )
+
+def test_partition_filters_prune_to_one_business(transactions_df, tmp_path):
+    save_table(transactions_df, 'transactions', base_dir=str(tmp_path))
+    business_id = int(transactions_df['business_id'].iloc[-1])
+
+    loaded = load_table('transactions', base_dir=str(tmp_path), columns=['id', 'business_id', 'quantity'],
+                        filters=[('business_id', '=', business_id)])
+    expected = transactions_df.loc[transactions_df['business_id'] == business_id, ['id', 'business_id', 'quantity']]
+    assert loaded.columns.tolist() == ['id', 'business_id', 'quantity']
+    pd.testing.assert_frame_equal(loaded, expected.reset_index(drop=True), check_dtype=False)
+
+def test_arrow_map_is_zero_copy_and_keeps_dtypes(transactions_df, tmp_path):
+    save_table(transactions_df, 'transactions', fmt='arrow', base_dir=str(tmp_path))
+
+    arrays = map_table('transactions', ['id', 'quantity', 'created_at', 'type'], base_dir=str(tmp_path))
+    assert list(arrays) == ['id', 'quantity', 'created_at', 'type']
+    for name in ['id', 'quantity', 'created_at']:
+        # Vistas de solo lectura sobre el archivo mapeado, con el tipo original
+        assert isinstance(arrays[name], np.ndarray)
+        assert not arrays[name].flags.writeable
+        assert not arrays[name].flags.owndata
+        assert arrays[name].dtype == transactions_df[name].dtype
+        np.testing.assert_array_equal(arrays[name], transactions_df[name].to_numpy())
+    assert isinstance(arrays['type'], pd.Series)
+
+    loaded = load_table('transactions', fmt='arrow', base_dir=str(tmp_path))
+    assert loaded.columns.tolist() == transactions_df.columns.tolist()
+    assert isinstance(loaded['type'].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(loaded, transactions_df, check_categorical=False, check_dtype=False)
+    assert (loaded.dtypes[loaded.dtypes != 'category'] == transactions_df.dtypes[loaded.dtypes != 'category']).all()
@@ -0,0 +1,38 @@
+"""
+Flujo de transacciones en chunks contra la generación en memoria
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from gestock.generate_transactions import generate_transactions, save_transactions_csv_stream, stream_transactions
+from gestock.schema import apply_schema
+
+END_DATE = datetime(2025, 6, 30, 23, 59, 59)
+
+def _tables(base_tables):
+    return (base_tables['warehouse_products'], base_tables['users'], base_tables['warehouses'],
+            base_tables['products'], base_tables['businesses'])
+
+@pytest.mark.parametrize('mode', ['sequential', 'batched'])
+def test_stream_matches_batch_generation(base_tables, mode):
+    transactions_df, stock_df = generate_transactions(*_tables(base_tables), mode=mode, end_date=END_DATE, seed=3)
+    stream = stream_transactions(*_tables(base_tables), mode=mode, end_date=END_DATE, seed=3, chunk_size=257)
+    chunks = list(stream)
+    assert all(len(chunk) == 257 for chunk in chunks[:-1])
+    # Cada chunk trae sus propias categorías: se comparan valores con el esquema aplicado
+    streamed = apply_schema(pd.concat(chunks, ignore_index=True), 'transactions')
+    pd.testing.assert_frame_equal(streamed, transactions_df, check_categorical=False)
+    pd.testing.assert_frame_equal(stream.updated_stock, stock_df)
+
+def test_stream_writer_appends_every_chunk(base_tables, data_dirs):
+    transactions_df, stock_df = generate_transactions(*_tables(base_tables), end_date=END_DATE, seed=5)
+    stream = stream_transactions(*_tables(base_tables), end_date=END_DATE, seed=5, chunk_size=100)
+    assert save_transactions_csv_stream(stream) == len(transactions_df)
+
+    written = pd.read_csv(data_dirs / 'raw' / 'transactions.csv', parse_dates=['created_at'])
+    assert written['id'].tolist() == transactions_df['id'].tolist()
+    assert written['quantity'].tolist() == transactions_df['quantity'].tolist()
+    assert pd.read_csv(data_dirs / 'raw' / 'warehouse_products.csv')['stock'].tolist() == stock_df['stock'].tolist()
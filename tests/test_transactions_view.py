@@ -0,0 +1,46 @@
+"""
+Salida normalizada y vista perezosa de desnormalización
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from gestock.generate_transactions import generate_transactions
+from gestock.transactions_view import DENORMALIZED_COLUMNS, TransactionsView, denormalize_transactions
+
+END_DATE = datetime(2025, 6, 30, 23, 59, 59)
+
+def _generate(base_tables, normalized):
+    transactions_df, _ = generate_transactions(
+        base_tables['warehouse_products'], base_tables['users'], base_tables['warehouses'],
+        base_tables['products'], base_tables['businesses'], end_date=END_DATE, seed=9, normalized=normalized
+    )
+    return transactions_df
+
+def _dimensions(base_tables):
+    return base_tables['products'], base_tables['warehouses'], base_tables['users']
+
+def test_normalized_output_has_only_ids(base_tables):
+    fact_df = _generate(base_tables, normalized=True)
+    assert not set(DENORMALIZED_COLUMNS) & set(fact_df.columns)
+
+def test_denormalized_view_matches_full_output(base_tables):
+    full_df = _generate(base_tables, normalized=False)
+    fact_df = _generate(base_tables, normalized=True)
+
+    view_df = denormalize_transactions(fact_df, *_dimensions(base_tables))
+    assert view_df.columns.tolist() == full_df.columns.tolist()
+    pd.testing.assert_frame_equal(view_df, full_df, check_categorical=False)
+
+def test_view_materializes_columns_on_demand(base_tables):
+    fact_df = _generate(base_tables, normalized=True)
+    view = TransactionsView(fact_df, *_dimensions(base_tables))
+
+    assert len(view) == len(fact_df)
+    assert view['id'].equals(fact_df['id'])
+    assert view['user_name'] is view['user_name']
+    assert isinstance(view['product_name'].dtype, pd.CategoricalDtype)
+    with pytest.raises(KeyError):
+        view['unknown']
@@ -0,0 +1,74 @@
+"""
+Motor de validación: reglas vectorizadas y filas exactas reportadas
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from gestock.generate_transactions import generate_transactions
+from gestock.validation_engine import validate_tables
+
+END_DATE = datetime(2025, 6, 30, 23, 59, 59)
+
+@pytest.fixture(scope='module')
+def tables(base_tables):
+    transactions_df, stock_df = generate_transactions(
+        base_tables['warehouse_products'], base_tables['users'], base_tables['warehouses'],
+        base_tables['products'], base_tables['businesses'], end_date=END_DATE, seed=13
+    )
+    return dict(base_tables, transactions=transactions_df, warehouse_products=stock_df)
+
+def _validate(tables, **overrides):
+    tables = dict(tables, **overrides)
+    return validate_tables(tables['users'], tables['warehouse_products'], tables['transactions'],
+                           tables['businesses'], tables['warehouses'], tables['products'])
+
+def test_generated_data_is_valid(tables):
+    report = _validate(tables)
+    assert report.is_valid
+    assert report.errors == []
+
+def test_dangling_warehouse_product_keys_are_reported(tables):
+    warehouse_products_df = tables['warehouse_products'].copy()
+    missing_warehouse = int(tables['warehouses']['id'].max()) + 1
+    missing_product = int(tables['products']['id'].max()) + 50
+    warehouse_products_df.loc[[2, 7], 'warehouse_id'] = missing_warehouse
+    warehouse_products_df.loc[5, 'product_id'] = missing_product
+
+    report = _validate(tables, warehouse_products=warehouse_products_df)
+    assert not report.is_valid
+    assert report.offending_rows('warehouse_products.warehouse_fk').tolist() == [2, 7]
+    assert report.offending_rows('warehouse_products.product_fk').tolist() == [5]
+
+def test_dangling_transaction_keys_are_reported(tables):
+    transactions_df = tables['transactions'].copy()
+    transactions_df.loc[4, 'warehouse_id'] = int(tables['warehouses']['id'].max()) + 1
+    transactions_df.loc[9, 'user_id'] = -3
+
+    report = _validate(tables, transactions=transactions_df)
+    assert report.offending_rows('transactions.warehouse_fk').tolist() == [4]
+    assert report.offending_rows('transactions.user_fk').tolist() == [9]
+    # Las filas con claves inexistentes no cuentan como incoherencia de negocio
+    assert report.offending_rows('transactions.business_mismatch').tolist() == []
+
+def test_cross_business_user_and_warehouse_are_reported(tables):
+    transactions_df = tables['transactions'].copy()
+    users_df = tables['users']
+    user_business = dict(zip(users_df['id'], users_df['business_id']))
+    rows = [0, 11, len(transactions_df) - 1]
+    for row in rows:
+        business_id = transactions_df.at[row, 'business_id']
+        other_user = users_df.loc[users_df['business_id'] != business_id, 'id'].iloc[0]
+        assert user_business[other_user] != business_id
+        transactions_df.at[row, 'user_id'] = other_user
+
+    report = _validate(tables, transactions=transactions_df)
+    assert not report.is_valid
+    assert report.offending_rows('transactions.business_mismatch').tolist() == rows
+    assert [issue.rule for issue in report.errors] == ['transactions.business_mismatch']
+
+def test_offending_rows_of_a_passing_rule_is_empty(tables):
+    rows = _validate(tables).offending_rows('transactions.duplicate_id')
+    assert isinstance(rows, np.ndarray) and len(rows) == 0
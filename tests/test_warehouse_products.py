@@ -0,0 +1,38 @@
+"""
+Asignación vectorizada de productos a almacenes
+"""
+
+import pandas as pd
+
+from gestock.generate_warehouse_products import generate_warehouse_products
+
+def _generate(base_tables, seed):
+    return generate_warehouse_products(base_tables['businesses'], base_tables['warehouses'],
+                                       base_tables['products'], seed=seed)
+
+def test_same_seed_gives_the_same_assignment(base_tables):
+    first = _generate(base_tables, seed=11)
+    again = _generate(base_tables, seed=11)
+    other = _generate(base_tables, seed=12)
+    columns = ['product_id', 'warehouse_id', 'stock', 'min_stock', 'max_stock']
+    pd.testing.assert_frame_equal(first[columns], again[columns])
+    assert not first[columns].equals(other[columns])
+
+def test_pairs_are_unique_and_ordered_like_the_nested_loops(base_tables):
+    df = _generate(base_tables, seed=11)
+    assert not df.duplicated(['warehouse_id', 'product_id']).any()
+
+    # Almacenes en el orden de sus negocios; productos en el orden del catálogo
+    business_order = {business_id: i for i, business_id in enumerate(base_tables['businesses']['id'])}
+    warehouse_business = base_tables['warehouses'].set_index('id')['business_id']
+    assert df['warehouse_id'].map(warehouse_business).map(business_order).is_monotonic_increasing
+    product_order = {product_id: i for i, product_id in enumerate(base_tables['products']['id'])}
+    for _, rows in df.groupby('warehouse_id', sort=False):
+        assert rows['product_id'].map(product_order).is_monotonic_increasing
+
+def test_stock_levels_are_consistent(base_tables):
+    df = _generate(base_tables, seed=11)
+    assert (df['stock'] >= 1).all()
+    assert (df['stock'] <= df['max_stock']).all()
+    assert (df['min_stock'] >= 1).all()
+    assert (df['min_stock'] < df['max_stock']).all()